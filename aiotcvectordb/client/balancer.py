@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import itertools
+import random
+import time
+from typing import List, Optional, Sequence
+
+from aiotcvectordb import exceptions
+from aiotcvectordb.client import status
+
+STRATEGIES = ("round_robin", "least_outstanding", "p2c")
+
+
+class Endpoint:
+    """State of one access endpoint of the balancer."""
+
+    __slots__ = (
+        "url",
+        "outstanding",
+        "latency",
+        "failures",
+        "ejections",
+        "ejected_until",
+        "probing",
+    )
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.outstanding = 0
+        # EWMA of successful request latencies in seconds
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.probing = False
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"Endpoint(url={self.url!r}, outstanding={self.outstanding}, "
+            f"latency={self.latency}, ejected={self.ejected})"
+        )
+
+
+class EndpointBalancer:
+    """Spread requests over several access endpoints and route around unhealthy ones.
+
+    An endpoint is ejected after ``eject_after`` consecutive failures (connection errors,
+    timeouts, 5xx). Once its ejection time is over, a single probe request is let through:
+    a response, even an application error, brings it back, a failure ejects it again for
+    twice as long, up to ``max_eject_time``, and a cancelled probe is retried by the next
+    request. When every endpoint is ejected the least recently ejected one is used.
+
+    Args:
+        urls (Sequence[str]): Endpoint urls, e.g. ["http://10.0.0.1", "http://10.0.0.2"].
+        strategy (str): "round_robin", "least_outstanding" (fewest in-flight requests), or
+            "p2c" (power of two choices: of two random endpoints, the one with the lower
+            in-flight weighted latency).
+        eject_after (int): Consecutive failures before an endpoint is ejected.
+        eject_time (float): First ejection duration in seconds.
+        max_eject_time (float): Upper bound of the ejection duration.
+        latency_decay (float): Weight of the latest latency in the EWMA.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        strategy: str = "round_robin",
+        eject_after: int = 3,
+        eject_time: float = 5.0,
+        max_eject_time: float = 60.0,
+        latency_decay: float = 0.3,
+    ):
+        if not urls:
+            raise exceptions.ParamError(message="at least one url is required")
+        if strategy not in STRATEGIES:
+            raise exceptions.ParamError(
+                message=f"strategy must be one of {STRATEGIES}, got {strategy!r}"
+            )
+        self.endpoints: List[Endpoint] = [Endpoint(url) for url in urls]
+        self.strategy = strategy
+        self.eject_after = eject_after
+        self.eject_time = eject_time
+        self.max_eject_time = max_eject_time
+        self.latency_decay = latency_decay
+        self._rr = itertools.count()
+
+    def _available(self, now: float) -> List[Endpoint]:
+        available = []
+        for ep in self.endpoints:
+            if not ep.ejected:
+                available.append(ep)
+            elif ep.ejected_until <= now and not ep.probing:
+                # half-open, route one request to probe the endpoint
+                ep.probing = True
+                return [ep]
+        return available
+
+    def _cost(self, ep: Endpoint) -> float:
+        latency = ep.latency if ep.latency is not None else 0.0
+        return (ep.outstanding + 1) * latency + ep.outstanding
+
+    def pick(self) -> Endpoint:
+        """Choose the endpoint of the next request, which must be passed to ``release``."""
+        candidates = self._available(time.monotonic())
+        if not candidates:
+            candidates = [min(self.endpoints, key=lambda ep: ep.ejected_until)]
+        if len(candidates) == 1:
+            ep = candidates[0]
+        elif self.strategy == "round_robin":
+            ep = candidates[next(self._rr) % len(candidates)]
+        elif self.strategy == "least_outstanding":
+            start = next(self._rr) % len(candidates)
+            rotated = candidates[start:] + candidates[:start]
+            ep = min(rotated, key=lambda e: e.outstanding)
+        else:
+            a, b = random.sample(candidates, 2)
+            ep = a if self._cost(a) <= self._cost(b) else b
+        ep.outstanding += 1
+        return ep
+
+    def release(
+        self,
+        ep: Endpoint,
+        latency: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Report the outcome of a request sent to ``ep``.
+
+        Args:
+            latency (float): Duration of a successful request.
+            error (Exception): The request's error, None on success or when it was cancelled.
+        """
+        ep.outstanding -= 1
+        if error is not None and self.is_failure(error):
+            ep.failures += 1
+            if ep.probing or ep.failures >= self.eject_after:
+                self._eject(ep)
+            return
+        # a cancelled probe leaves the endpoint ejected, the next request probes it again
+        ep.probing = False
+        if latency is None and error is None:
+            return
+        # a success or an application error, the endpoint answered
+        ep.failures = 0
+        ep.ejections = 0
+        ep.ejected_until = 0.0
+        if latency is None:
+            return
+        if ep.latency is None:
+            ep.latency = latency
+        else:
+            ep.latency += self.latency_decay * (latency - ep.latency)
+
+    def _eject(self, ep: Endpoint) -> None:
+        duration = min(self.max_eject_time, self.eject_time * (2**ep.ejections))
+        ep.ejections += 1
+        ep.ejected_until = time.monotonic() + duration
+        ep.probing = False
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        return status.is_failure(error, status.UNHEALTHY_CODES)
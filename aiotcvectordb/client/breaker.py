@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+from aiotcvectordb import exceptions
+from aiotcvectordb.client import status
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class Circuit:
+    """State of one circuit of the breaker."""
+
+    __slots__ = ("key", "state", "outcomes", "failures", "opened_at", "probes")
+
+    def __init__(self, key: tuple, window: int):
+        self.key = key
+        self.state = CLOSED
+        # True for a failed request, the last ``window`` outcomes
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+    def __repr__(self) -> str:
+        return f"Circuit(key={self.key!r}, state={self.state!r})"
+
+
+class CircuitBreaker:
+    """Fail fast on a host, or a collection, whose requests keep failing.
+
+    A circuit is kept per host, or per host/database/collection with ``per_collection``. It
+    opens when at least ``failure_rate`` of its last ``window`` requests failed (connection
+    errors, timeouts, ``failure_codes``), given at least ``min_requests`` of them. While open,
+    requests raise ``CircuitOpenError`` without being sent. After ``open_time`` seconds the
+    circuit is half-open and lets ``half_open_max`` probe requests through: a success closes
+    it, a failure opens it again.
+
+    Args:
+        failure_rate (float): Failure ratio opening the circuit, in (0, 1].
+        min_requests (int): Requests in the window needed before the circuit can open.
+        window (int): Number of recent requests the failure ratio is computed on.
+        open_time (float): Seconds the circuit stays open before probing recovery.
+        half_open_max (int): Concurrent probe requests allowed while half-open.
+        per_collection (bool): Key circuits by the database/collection of the request body
+            too, so that one overloaded collection doesn't open the circuit of its host.
+        failure_codes (Iterable[int]): Error codes counted as failures.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: int = 50,
+        open_time: float = 5.0,
+        half_open_max: int = 1,
+        per_collection: bool = False,
+        failure_codes: Iterable[int] = status.OVERLOAD_CODES,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise exceptions.ParamError(message="failure_rate must be in (0, 1]")
+        if window < 1 or min_requests > window:
+            raise exceptions.ParamError(
+                message="window must be >= 1 and min_requests must be <= window"
+            )
+        if half_open_max < 1:
+            raise exceptions.ParamError(message="half_open_max must be at least 1")
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_time = open_time
+        self.half_open_max = half_open_max
+        self.per_collection = per_collection
+        self.failure_codes = frozenset(failure_codes)
+        self._circuits: Dict[tuple, Circuit] = {}
+
+    def scope(self, body: Optional[dict]) -> Tuple[str, ...]:
+        """Part of the circuit key taken from the request body, appended to the host."""
+        if self.per_collection and body:
+            database = body.get("database")
+            collection = body.get("collection")
+            if database and collection:
+                return database, collection
+        return ()
+
+    def circuit(self, key: tuple) -> Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = Circuit(key, self.window)
+        return circuit
+
+    def state(self, key: tuple) -> str:
+        circuit = self._circuits.get(key)
+        return circuit.state if circuit is not None else CLOSED
+
+    def acquire(self, key: tuple) -> bool:
+        """Let a request through the circuit of ``key``, it must then be passed to ``release``.
+
+        Returns:
+            bool: Whether the request is a half-open probe.
+
+        Raises:
+            CircuitOpenError: The circuit is open.
+        """
+        circuit = self.circuit(key)
+        if circuit.state == OPEN:
+            if time.monotonic() - circuit.opened_at < self.open_time:
+                raise self._open_error(circuit)
+            circuit.state = HALF_OPEN
+            circuit.probes = 0
+        if circuit.state == HALF_OPEN:
+            if circuit.probes >= self.half_open_max:
+                raise self._open_error(circuit)
+            circuit.probes += 1
+            return True
+        return False
+
+    def release(
+        self,
+        key: tuple,
+        probe: bool,
+        error: Optional[BaseException] = None,
+        cancelled: bool = False,
+    ) -> None:
+        """Report the outcome of a request.
+
+        Args:
+            probe (bool): The value returned by ``acquire``.
+            error (Exception): The request's error, None on success.
+            cancelled (bool): The request was cancelled, its outcome isn't counted.
+        """
+        circuit = self.circuit(key)
+        if probe:
+            if circuit.state != HALF_OPEN:
+                return
+            circuit.probes -= 1
+            if cancelled:
+                return
+            if error is not None and self.is_failure(error):
+                self._open(circuit)
+            else:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+                circuit.failures = 0
+            return
+        if cancelled or circuit.state != CLOSED:
+            # requests admitted before the circuit opened don't count
+            return
+        failed = error is not None and self.is_failure(error)
+        if len(circuit.outcomes) == circuit.outcomes.maxlen and circuit.outcomes[0]:
+            circuit.failures -= 1
+        circuit.outcomes.append(failed)
+        if failed:
+            circuit.failures += 1
+            if (
+                len(circuit.outcomes) >= self.min_requests
+                and circuit.failures >= self.failure_rate * len(circuit.outcomes)
+            ):
+                self._open(circuit)
+
+    def _open(self, circuit: Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.probes = 0
+
+    def _open_error(self, circuit: Circuit) -> exceptions.CircuitOpenError:
+        retry_in = max(0.0, self.open_time - (time.monotonic() - circuit.opened_at))
+        return exceptions.CircuitOpenError(
+            message=f"Circuit {'/'.join(circuit.key)} is open, "
+            f"retry in {retry_in:.2f}s",
+        )
+
+    def is_failure(self, error: BaseException) -> bool:
+        return status.is_failure(error, self.failure_codes)
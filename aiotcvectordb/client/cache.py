@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+
+class TTLCache:
+    """A bounded LRU mapping whose entries expire ``ttl`` seconds after insertion.
+
+    Args:
+        maxsize (int): Maximum number of entries kept, the least recently used entry is
+            evicted first. A value <= 0 means unbounded.
+        ttl (float): Lifetime of an entry in seconds. None or <= 0 means entries never expire.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        value, expires_at = item
+        if self._expired(expires_at):
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if (ttl is None or ttl <= 0) else time.monotonic() + ttl
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        if self.maxsize and self.maxsize > 0:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.pop(key, None)
+        if item is None:
+            return default
+        return item[0]
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``, returns the number removed."""
+        keys = [k for k in self._data if predicate(k)]
+        for k in keys:
+            del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(list(self._data.keys()))
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._data.get(key)
+        return item is not None and not self._expired(item[1])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DatabaseIndex:
+    """Name -> info snapshot of ``/database/list``, considered stale after ``ttl`` seconds.
+
+    Args:
+        ttl (float): Lifetime of a snapshot in seconds. None or <= 0 means it never expires,
+            an explicit ``invalidate`` is then the only way to refresh it.
+    """
+
+    def __init__(self, ttl: Optional[float] = 60.0):
+        self.ttl = ttl
+        self._infos: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._expires_at: Optional[float] = None
+
+    @property
+    def fresh(self) -> bool:
+        if not self._loaded:
+            return False
+        return self._expires_at is None or self._expires_at > time.monotonic()
+
+    def load(self, infos: Dict[str, Dict[str, Any]]) -> None:
+        self._infos = dict(infos)
+        self._loaded = True
+        self._expires_at = (
+            None if (self.ttl is None or self.ttl <= 0) else time.monotonic() + self.ttl
+        )
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._infos.get(name)
+
+    def discard(self, name: str) -> None:
+        self._infos.pop(name, None)
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._infos
+
+    def __len__(self) -> int:
+        return len(self._infos)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+from enum import IntEnum
+from typing import Iterable, List, Optional, Tuple
+
+from aiotcvectordb import exceptions
+from aiotcvectordb.client import status
+
+ALGORITHMS = ("aimd", "gradient", "fixed")
+
+
+class Priority(IntEnum):
+    """Request priorities, lower values are admitted first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class ConcurrencyLimiter:
+    """Adaptive limit of the requests in flight, so that load spikes queue here, bounded,
+    instead of inside aiohttp's connection pool.
+
+    Every completed request is a sample: its latency is compared to a slowly moving baseline
+    latency, and connection errors, timeouts and ``overload_codes`` count as drops.
+
+    - "aimd": the limit grows by one per sample while it is fully used, and is multiplied by
+      ``backoff`` on a drop or when the latency exceeds ``tolerance`` times the baseline.
+    - "gradient": the limit follows ``limit * gradient + sqrt(limit)`` where the gradient is
+      ``tolerance * baseline / latency`` clamped to [0.5, 1], and is halved on a drop.
+    - "fixed": the limit stays ``initial_limit``, for priority scheduling alone.
+
+    Requests over the limit wait in a queue of at most ``max_queue`` entries for at most
+    ``queue_timeout`` seconds, otherwise they raise ``ConcurrencyLimitExceededError``. The queue
+    is ordered by priority, then by arrival, so interactive requests get the next free slot
+    ahead of bulk traffic.
+
+    Args:
+        algorithm (str): "aimd", "gradient" or "fixed".
+        initial_limit (int): Limit before any sample.
+        min_limit (int): Lower bound of the limit.
+        max_limit (int): Upper bound of the limit.
+        max_queue (int): Waiting requests allowed, 0 fails fast as soon as the limit is reached.
+        queue_timeout (float): Longest wait in the queue in seconds, None for no bound.
+        tolerance (float): Latency inflation over the baseline tolerated before shrinking.
+        backoff (float): Multiplicative decrease of "aimd", in (0, 1).
+        smoothing (float): Weight of a new "gradient" limit, in (0, 1].
+        overload_codes (Iterable[int]): Error codes counted as drops.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "aimd",
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        max_queue: int = 100,
+        queue_timeout: Optional[float] = None,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        smoothing: float = 0.2,
+        overload_codes: Iterable[int] = status.OVERLOAD_CODES,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise exceptions.ParamError(
+                message=f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}"
+            )
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise exceptions.ParamError(
+                message="limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < backoff < 1 or not 0 < smoothing <= 1 or tolerance < 1:
+            raise exceptions.ParamError(
+                message="backoff must be in (0, 1), smoothing in (0, 1], tolerance >= 1"
+            )
+        self.algorithm = algorithm
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.overload_codes = frozenset(overload_codes)
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        # EWMA of the latencies, slow enough to stand for the unloaded latency
+        self._baseline: Optional[float] = None
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        """Current limit of requests in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a slot."""
+        return len(self._waiters)
+
+    def metrics(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "rejected": self.rejected,
+            "baseline_latency": self._baseline,
+        }
+
+    async def acquire(self, priority: int = Priority.NORMAL) -> None:
+        """Wait for a slot, which must then be given back with ``release``.
+
+        Args:
+            priority (int): Queue priority of the request, see ``Priority``.
+
+        Raises:
+            ConcurrencyLimitExceededError: The queue is full or the wait timed out.
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise self._rejection("queue is full")
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._seq), waiter)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise self._rejection("timed out waiting in the queue")
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just before the cancellation
+                self._in_flight -= 1
+                self._wake()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                # timed out or cancelled while queued
+                try:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                except ValueError:
+                    pass
+
+    def _rejection(self, reason: str) -> exceptions.ConcurrencyLimitExceededError:
+        return exceptions.ConcurrencyLimitExceededError(
+            message=f"Concurrency limit of {self.limit} requests reached, {reason}"
+        )
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Give back a slot and report the request's outcome.
+
+        Args:
+            latency (float): Duration of the request, None when it was cancelled.
+            error (Exception): The request's error, None on success.
+        """
+        self._in_flight -= 1
+        if error is not None and self.is_drop(error):
+            self._on_drop()
+        elif latency is not None and error is None:
+            self._on_sample(latency)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _on_sample(self, latency: float) -> None:
+        baseline = self._baseline
+        if baseline is None:
+            self._baseline = latency
+            return
+        self._baseline = baseline + 0.05 * (latency - baseline)
+        if self.algorithm == "fixed":
+            return
+        if self.algorithm == "aimd":
+            if latency > self.tolerance * baseline:
+                limit = self._limit * self.backoff
+            elif self._in_flight + 1 >= self.limit:
+                limit = self._limit + 1
+            else:
+                return
+        else:
+            gradient = max(0.5, min(1.0, self.tolerance * baseline / max(latency, 1e-9)))
+            target = self._limit * gradient + math.sqrt(self._limit)
+            limit = (1 - self.smoothing) * self._limit + self.smoothing * target
+        self._limit = max(self.min_limit, min(self.max_limit, limit))
+
+    def _on_drop(self) -> None:
+        if self.algorithm == "fixed":
+            return
+        factor = self.backoff if self.algorithm == "aimd" else 0.5
+        self._limit = max(self.min_limit, self._limit * factor)
+
+    def is_drop(self, error: BaseException) -> bool:
+        return status.is_failure(error, self.overload_codes)
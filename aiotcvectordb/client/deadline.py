@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from aiotcvectordb import exceptions
+
+# Absolute deadline (time.monotonic()) of the current context, None when unbounded
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    "aiotcvectordb_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[float]:
+    """Bound every request made within the block by one end-to-end budget.
+
+    All requests sent by ``AsyncHTTPClient`` inside the block, including the ones of
+    multi-request operations, retries and hedges, share the budget: each one gets the time
+    that is left, and once the budget is spent requests fail with ``DeadlineExceededError``
+    instead of being sent. Tasks created inside the block inherit the deadline, and a nested
+    block can only shorten it.
+
+    Example:
+        with deadline(0.5):
+            await client.search(...)
+
+    Args:
+        timeout (float): Budget in seconds.
+
+    Yields:
+        float: The absolute deadline, on the ``time.monotonic()`` clock.
+    """
+    at = time.monotonic() + timeout
+    current = _deadline.get()
+    if current is not None and current < at:
+        at = current
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the deadline of the current context, None without a deadline."""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+def check() -> Optional[float]:
+    """Seconds left before the deadline, raises when it has already passed.
+
+    Raises:
+        DeadlineExceededError: The deadline has passed.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise exceptions.DeadlineExceededError(code=-1, message="Deadline exceeded")
+    return left
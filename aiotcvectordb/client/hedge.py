@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional
+
+from aiotcvectordb import exceptions
+from aiotcvectordb.client.retry import RetryBudget
+
+# Read endpoints hedged by default
+HEDGE_PATHS = frozenset(
+    {
+        "/document/search",
+        "/document/query",
+        "/document/hybridSearch",
+        "/document/count",
+    }
+)
+
+
+class _Latencies:
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.quantile: Optional[float] = None
+        self.dirty = 0
+
+
+class HedgePolicy:
+    """Send a second identical request when the first one is slower than ``delay``.
+
+    The first successful response wins and the other request is cancelled. Without a fixed
+    ``delay``, the delay of a path is the ``percentile`` of its recent latencies, so only the
+    slowest requests get hedged.
+
+    Args:
+        delay (float): Fixed hedging delay in seconds, None for the adaptive delay.
+        percentile (float): Latency percentile used as adaptive delay, in (0, 100).
+        min_delay (float): Lower bound of the adaptive delay.
+        max_delay (float): Upper bound of the adaptive delay, also used until ``min_samples``
+            latencies of a path have been observed.
+        min_samples (int): Latencies needed before the adaptive delay is used.
+        window (int): Number of recent latencies kept per path.
+        max_ratio (float): Hedges allowed per request, 0.05 means at most 5% extra requests.
+        paths (Iterable[str]): Paths eligible for hedging, they must be idempotent.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        max_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 500,
+        max_ratio: float = 0.05,
+        paths: Iterable[str] = HEDGE_PATHS,
+    ):
+        if not 0 < percentile < 100:
+            raise exceptions.ParamError(message="percentile must be in (0, 100)")
+        if min_delay < 0 or max_delay < min_delay:
+            raise exceptions.ParamError(
+                message="delays must satisfy 0 <= min_delay <= max_delay"
+            )
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.paths = frozenset(paths)
+        self.budget = RetryBudget(ratio=max_ratio, min_per_second=0)
+        self._latencies: Dict[str, _Latencies] = {}
+        self.hedged = 0
+
+    def applies(self, method: str, path: str) -> bool:
+        return path in self.paths
+
+    def observe(self, path: str, latency: float) -> None:
+        """Record the latency in seconds of a successful request."""
+        stats = self._latencies.get(path)
+        if stats is None:
+            stats = self._latencies[path] = _Latencies(self.window)
+        stats.samples.append(latency)
+        stats.dirty += 1
+
+    def delay_for(self, path: str) -> float:
+        if self.delay is not None:
+            return self.delay
+        stats = self._latencies.get(path)
+        if stats is None or len(stats.samples) < self.min_samples:
+            return self.max_delay
+        # the percentile is recomputed every few samples, not on every request
+        if stats.quantile is None or stats.dirty >= 16:
+            ordered = sorted(stats.samples)
+            index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+            stats.quantile = ordered[index]
+            stats.dirty = 0
+        return min(self.max_delay, max(self.min_delay, stats.quantile))
+
+    def acquire(self) -> bool:
+        """Take a hedge from the budget, returns False when it is exhausted."""
+        if self.budget.withdraw():
+            self.hedged += 1
+            return True
+        return False
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Optional, Dict, Any
+import copy
+import functools
+from typing import Optional, Dict, Any, Awaitable, Callable, Sequence, Union
 from urllib.parse import urlparse
 
 import aiohttp
+import tcvectordb.exceptions as vendor_exceptions
 
 from aiotcvectordb import exceptions
 from aiotcvectordb.exceptions import ParamError, ServerInternalError
+from aiotcvectordb.client.balancer import EndpointBalancer
+from aiotcvectordb.client.breaker import CircuitBreaker
+from aiotcvectordb.client import deadline
+from aiotcvectordb.client.concurrency import ConcurrencyLimiter, Priority
+from aiotcvectordb.client.hedge import HedgePolicy
+from aiotcvectordb.client.ratelimit import RateLimiter
+from aiotcvectordb.client.result_cache import ResultCache
+from aiotcvectordb.client.semantic_cache import SemanticCache
+from aiotcvectordb.client.retry import RetryPolicy
+from aiotcvectordb.client.serializer import get_serializer
+from aiotcvectordb.client.singleflight import SingleFlight
 
 
 class Response:
@@ -30,6 +44,8 @@ class Response:
         self._message = json_body.get("msg", "")
         self.req_id = json_body.get("requestId", None)
         self._warn = warn_header
+        # size of the raw body, set when read from the wire
+        self.nbytes = 0
 
     @property
     def code(self) -> int:
@@ -44,15 +60,24 @@ class Response:
         return self._body
 
     def data(self) -> Dict[str, Any]:
-        res: Dict[str, Any] = {}
-        res.update(self._body)
-        return res
+        # The body is decoded once per request and owned by the caller, no copy needed.
+        return self._body
+
+    def copy(self, body: Optional[Dict[str, Any]] = None) -> "Response":
+        """A response owning a deep copy of the body, for callers sharing one request.
+
+        Args:
+            body (Dict[str, Any]): Body of the copy instead of a copy of this one.
+        """
+        response = copy.copy(self)
+        response._body = copy.deepcopy(self._body) if body is None else body
+        return response
 
 
 class AsyncHTTPClient:
     def __init__(
         self,
-        url: str,
+        url: Union[str, Sequence[str], None],
         username: str,
         key: str,
         timeout: int = 10,
@@ -60,7 +85,21 @@ class AsyncHTTPClient:
         proxies: Optional[dict] = None,
         password: Optional[str] = None,
         connector: Optional[aiohttp.BaseConnector] = None,
+        serializer: Union[str, Any, None] = "auto",
+        retry: Optional[RetryPolicy] = None,
+        hedge: Optional[HedgePolicy] = None,
+        balancer: Optional[EndpointBalancer] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[ConcurrencyLimiter] = None,
+        single_flight: Union[bool, SingleFlight] = False,
+        result_cache: Union[bool, ResultCache] = False,
+        semantic_cache: Optional[SemanticCache] = None,
     ):
+        if balancer is None and url is not None and not isinstance(url, str):
+            balancer = EndpointBalancer(url)
+        if balancer is not None:
+            url = balancer.endpoints[0].url
         self.url = url
         self.username = username
         self.key = key
@@ -73,6 +112,23 @@ class AsyncHTTPClient:
         self.direct = False
         self._pool_size = pool_size
         self._connector = connector
+        self._serializer = get_serializer(serializer)
+        self._retry = retry
+        self._hedge = hedge
+        self._balancer = balancer
+        self._breaker = breaker
+        self._rate_limiter = rate_limiter
+        self._concurrency = concurrency
+        if single_flight is True:
+            single_flight = SingleFlight()
+        self._single_flight: Optional[SingleFlight] = single_flight or None
+        if result_cache is True:
+            result_cache = ResultCache()
+        # not `or None`, an empty cache is falsy
+        self._result_cache: Optional[ResultCache] = (
+            None if result_cache is False else result_cache
+        )
+        self._semantic_cache = semantic_cache
         # 会话延迟创建，确保在事件循环中实例化，避免非 ioloop 报错
         self._session: Optional[aiohttp.ClientSession] = None
 
@@ -95,6 +151,46 @@ class AsyncHTTPClient:
     async def __aexit__(self, exc_type, exc, tb):
         await self.close()
 
+    @property
+    def serializer(self):
+        return self._serializer
+
+    @property
+    def retry(self) -> Optional[RetryPolicy]:
+        return self._retry
+
+    @property
+    def hedge(self) -> Optional[HedgePolicy]:
+        return self._hedge
+
+    @property
+    def balancer(self) -> Optional[EndpointBalancer]:
+        return self._balancer
+
+    @property
+    def breaker(self) -> Optional[CircuitBreaker]:
+        return self._breaker
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def concurrency(self) -> Optional[ConcurrencyLimiter]:
+        return self._concurrency
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        return self._single_flight
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        return self._result_cache
+
+    @property
+    def semantic_cache(self) -> Optional[SemanticCache]:
+        return self._semantic_cache
+
     def _authorization(self) -> str:
         if self.password is None:
             self.password = self.key
@@ -104,12 +200,13 @@ class AsyncHTTPClient:
             )
         return f"account={self.username}&api_key={self.password}"
 
-    def _get_url(self, path: str) -> str:
-        if not self.url:
+    def _get_url(self, path: str, base: Optional[str] = None) -> str:
+        base = base or self.url
+        if not base:
             raise ParamError(
                 message="Network or authentication settings are invalid, please check url/username/api_key."
             )
-        return self.url + path
+        return base + path
 
     def _get_headers(self, ai: Optional[bool] = False) -> Dict[str, str]:
         if ai is None:
@@ -137,79 +234,356 @@ class AsyncHTTPClient:
         params: Optional[dict] = None,
         timeout: Optional[float] = None,
         ai: Optional[bool] = False,
+        priority: int = Priority.NORMAL,
+    ) -> Response:
+        return await self._request(
+            "GET", path, params=params, timeout=timeout, ai=ai, priority=priority
+        )
+
+    async def post(
+        self,
+        path: str,
+        body: dict,
+        timeout: Optional[float] = None,
+        ai: Optional[bool] = False,
+        priority: int = Priority.NORMAL,
+    ) -> Response:
+        return await self._request(
+            "POST", path, body=body, timeout=timeout, ai=ai, priority=priority
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        body: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        ai: Optional[bool] = False,
+        priority: int = Priority.NORMAL,
+    ) -> Response:
+        # the semantic cache is checked first, a hit on it spares the exact lookup
+        caches = [
+            cache
+            for cache in (self._semantic_cache, self._result_cache)
+            if cache is not None
+        ]
+        if not caches or method != "POST":
+            return await self._dispatch(
+                method, path, params, body, timeout, ai, priority
+            )
+        misses = []
+        for cache in caches:
+            if cache.applies(path, body):
+                cached, token = cache.lookup(path, body, ai)
+                if cached is not None:
+                    return cached
+                misses.append((cache, token))
+        if not misses:
+            try:
+                return await self._dispatch(
+                    method, path, params, body, timeout, ai, priority
+                )
+            finally:
+                # even a failed write may have been applied
+                for cache in caches:
+                    cache.invalidate(path, body)
+        response = await self._dispatch(
+            method, path, params, body, timeout, ai, priority
+        )
+        for cache, token in misses:
+            cache.store(token, response)
+        return response
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        body: Optional[dict],
+        timeout: Optional[float],
+        ai: Optional[bool],
+        priority: int,
     ) -> Response:
         await self._ensure_session()
-        # Per-request timeout overrides session's default
-        timeout_ctx = aiohttp.ClientTimeout(
-            total=None if (timeout is None or timeout <= 0) else timeout
+        headers = self._get_headers(ai)
+        data = None
+        if body is not None:
+            data = self._serializer.dumps(body)
+            headers["Content-Type"] = self._serializer.content_type
+        scope = self._breaker.scope(body) if self._breaker is not None else ()
+        send = functools.partial(self._send, scope=scope, priority=priority)
+        hedge = self._hedge
+        if hedge is not None and hedge.applies(method, path):
+            hedge.budget.deposit()
+            send = functools.partial(
+                self._hedged_send, hedge, scope=scope, priority=priority
+            )
+        flight = self._single_flight
+        if flight is None or not flight.applies(method, path):
+            return await self._call(send, method, path, params, data, headers, timeout)
+        key = (
+            method,
+            path,
+            None if params is None else tuple(sorted(params.items())),
+            data,
+            headers.get("backend-service"),
+            timeout,
+            priority,
         )
-        proxy = self._choose_proxy()
+        return await flight.do(
+            key,
+            functools.partial(
+                self._call, send, method, path, params, data, headers, timeout
+            ),
+            copy=Response.copy,
+        )
+
+    async def _call(
+        self,
+        send: Callable[..., Awaitable[Response]],
+        method: str,
+        path: str,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> Response:
+        policy = self._retry
+        if policy is None:
+            return await send(method, path, params, data, headers, timeout)
+        idempotent = policy.is_idempotent(method, path)
+        if policy.budget is not None:
+            policy.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return await send(method, path, params, data, headers, timeout)
+            except vendor_exceptions.VectorDBException as e:
+                delay = policy.backoff(attempt)
+                left = deadline.remaining()
+                if left is not None and left <= delay:
+                    # no time left for another attempt
+                    raise
+                if not policy.should_retry(e, attempt, idempotent):
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _hedged_send(
+        self,
+        hedge: HedgePolicy,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: tuple = (),
+        priority: int = Priority.NORMAL,
+    ) -> Response:
+        loop = asyncio.get_running_loop()
+
+        async def _timed() -> Response:
+            start = loop.time()
+            response = await self._send(
+                method, path, params, data, headers, timeout, scope, priority
+            )
+            hedge.observe(path, loop.time() - start)
+            return response
+
+        first = asyncio.ensure_future(_timed())
+        tasks = [first]
         try:
-            async with self._session.get(
-                self._get_url(path),
-                params=params,
-                headers=self._get_headers(ai),
-                proxy=proxy,
-                timeout=timeout_ctx,
-            ) as resp:
-                warn = resp.headers.get("Warning")
-                try:
-                    body = await resp.json(content_type=None)
-                except Exception:
-                    text = await resp.text()
-                    # attempt to construct a body for consistent error handling
-                    body = {"code": resp.status, "msg": text}
-                response = Response(path, body, resp.status, resp.reason, warn)
-        except aiohttp.ClientConnectorError as e:
-            raise exceptions.ConnectError(
-                message=f"{e}: {exceptions.ERROR_MESSAGE_NETWORK_OR_AUTH}"
+            done, _ = await asyncio.wait(tasks, timeout=hedge.delay_for(path))
+            if done or not hedge.acquire():
+                return await first
+            tasks.append(asyncio.ensure_future(_timed()))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: tuple = (),
+        priority: int = Priority.NORMAL,
+    ) -> Response:
+        left = deadline.check()
+        if left is None:
+            return await self._send_limited(
+                method, path, params, data, headers, timeout, scope, priority
+            )
+        # the deadline bounds the waits for the limiters too, not only the request
+        try:
+            return await asyncio.wait_for(
+                self._send_limited(
+                    method, path, params, data, headers, timeout, scope, priority
+                ),
+                left,
             )
-        except aiohttp.ClientResponseError as e:
-            raise ServerInternalError(code=e.status or -1, message=str(e))
         except asyncio.TimeoutError:
-            raise ServerInternalError(code=-1, message="Request timed out")
+            raise exceptions.DeadlineExceededError(code=-1, message="Deadline exceeded")
 
-        if response.code != 0:
-            raise ServerInternalError(
-                code=response.code, message=response.message, req_id=response.req_id
+    async def _send_limited(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: tuple = (),
+        priority: int = Priority.NORMAL,
+    ) -> Response:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(path)
+        limiter = self._concurrency
+        if limiter is None:
+            return await self._send_balanced(
+                method, path, params, data, headers, timeout, scope
             )
+        await limiter.acquire(priority)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            response = await self._send_balanced(
+                method, path, params, data, headers, timeout, scope
+            )
+        except Exception as e:
+            limiter.release(error=e)
+            raise
+        except BaseException:
+            limiter.release()
+            raise
+        limiter.release(latency=loop.time() - start)
         return response
 
-    async def post(
+    async def _send_balanced(
         self,
+        method: str,
         path: str,
-        body: dict,
-        timeout: Optional[float] = None,
-        ai: Optional[bool] = False,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: tuple = (),
     ) -> Response:
-        await self._ensure_session()
+        balancer = self._balancer
+        if balancer is None:
+            return await self._send_to(
+                self.url, method, path, params, data, headers, timeout, scope
+            )
+        endpoint = balancer.pick()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            response = await self._send_to(
+                endpoint.url, method, path, params, data, headers, timeout, scope
+            )
+        except Exception as e:
+            balancer.release(endpoint, error=e)
+            raise
+        except BaseException:
+            # cancelled, e.g. the losing request of a hedge
+            balancer.release(endpoint)
+            raise
+        balancer.release(endpoint, latency=loop.time() - start)
+        return response
+
+    async def _send_to(
+        self,
+        base: Optional[str],
+        method: str,
+        path: str,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        scope: tuple = (),
+    ) -> Response:
+        breaker = self._breaker
+        if breaker is None:
+            return await self._fetch(base, method, path, params, data, headers, timeout)
+        key = (base or "",) + scope
+        probe = breaker.acquire(key)
+        try:
+            response = await self._fetch(
+                base, method, path, params, data, headers, timeout
+            )
+        except Exception as e:
+            breaker.release(key, probe, error=e)
+            raise
+        except BaseException:
+            breaker.release(key, probe, cancelled=True)
+            raise
+        breaker.release(key, probe)
+        return response
+
+    async def _fetch(
+        self,
+        base: Optional[str],
+        method: str,
+        path: str,
+        params: Optional[dict],
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> Response:
+        # Per-request timeout overrides session's default
         timeout_ctx = aiohttp.ClientTimeout(
             total=None if (timeout is None or timeout <= 0) else timeout
         )
         proxy = self._choose_proxy()
         try:
-            async with self._session.post(
-                self._get_url(path),
-                json=body,
-                headers=self._get_headers(ai),
+            async with self._session.request(
+                method,
+                self._get_url(path, base),
+                params=params,
+                data=data,
+                headers=headers,
                 proxy=proxy,
                 timeout=timeout_ctx,
             ) as resp:
                 warn = resp.headers.get("Warning")
+                raw = await resp.read()
                 try:
-                    body = await resp.json(content_type=None)
+                    json_body = self._serializer.loads(raw)
                 except Exception:
-                    text = await resp.text()
-                    body = {"code": resp.status, "msg": text}
-                response = Response(path, body, resp.status, resp.reason, warn)
+                    # attempt to construct a body for consistent error handling
+                    json_body = {
+                        "code": resp.status,
+                        "msg": raw.decode("utf-8", errors="replace"),
+                    }
+                response = Response(path, json_body, resp.status, resp.reason, warn)
+                response.nbytes = len(raw)
         except aiohttp.ClientConnectorError as e:
             raise exceptions.ConnectError(
                 message=f"{e}: {exceptions.ERROR_MESSAGE_NETWORK_OR_AUTH}"
             )
         except aiohttp.ClientResponseError as e:
             raise ServerInternalError(code=e.status or -1, message=str(e))
+        except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError) as e:
+            raise exceptions.ConnectionLostError(message=f"Connection lost: {e}")
         except asyncio.TimeoutError:
-            raise ServerInternalError(code=-1, message="Request timed out")
+            raise exceptions.RequestTimeoutError(code=-1, message="Request timed out")
 
         if response.code != 0:
             raise ServerInternalError(
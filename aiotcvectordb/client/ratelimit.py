@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+from aiotcvectordb import exceptions
+
+# Path groups limited together, an entry ending with "/" matches every path under it
+PATH_GROUPS: Dict[str, tuple] = {
+    "write": ("/document/upsert", "/document/update", "/document/delete"),
+    "read": (
+        "/document/search",
+        "/document/query",
+        "/document/hybridSearch",
+        "/document/fullTextSearch",
+        "/document/count",
+    ),
+    "admin": ("/collection/", "/index/"),
+}
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second, holding up to ``burst`` tokens.
+
+    A request takes one token. When the bucket is empty the request reserves the next token
+    and waits for it, so waiting requests are served in arrival order.
+
+    Args:
+        rate (float): Requests per second.
+        burst (float): Bucket capacity, the requests allowed at once after an idle period.
+            Defaults to ``rate`` (at least 1).
+        max_wait (float): Longest wait in seconds before a request is rejected with
+            ``RateLimitExceededError``, 0 rejects instead of waiting, None waits as long as needed.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        max_wait: Optional[float] = None,
+    ):
+        if rate <= 0:
+            raise exceptions.ParamError(message="rate must be > 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        if self.burst < 1:
+            raise exceptions.ParamError(message="burst must be at least 1")
+        self.max_wait = max_wait
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> Optional[float]:
+        """Take a token, returns the seconds to wait before using it, None when rejected."""
+        self._refill(time.monotonic())
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if self.max_wait is not None and wait > self.max_wait:
+            self._tokens += 1
+            return None
+        return wait
+
+    def refund(self) -> None:
+        """Give back a reserved token that wasn't used."""
+        self._tokens += 1
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait is None:
+            raise exceptions.RateLimitExceededError(
+                message=f"Rate limit of {self.rate:g} requests/s exceeded"
+            )
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.refund()
+            raise
+
+
+class RateLimiter:
+    """Client-side rate limits per group of paths, e.g. writes vs reads.
+
+    Paths without a limited group are not limited.
+
+    Args:
+        limits (Mapping[str, Union[TokenBucket, float]]): Bucket of each group, a number is the
+            rate of a default ``TokenBucket``, e.g. ``{"write": 50, "read": TokenBucket(500)}``.
+        groups (Mapping[str, Iterable[str]]): Paths of each group, see ``PATH_GROUPS``.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, Union[TokenBucket, float]],
+        groups: Mapping[str, Iterable[str]] = PATH_GROUPS,
+    ):
+        self.buckets: Dict[str, TokenBucket] = {
+            group: limit if isinstance(limit, TokenBucket) else TokenBucket(limit)
+            for group, limit in limits.items()
+        }
+        unknown = set(self.buckets) - set(groups)
+        if unknown:
+            raise exceptions.ParamError(
+                message=f"unknown rate limit group(s): {sorted(unknown)}"
+            )
+        self._exact: Dict[str, str] = {}
+        self._prefixes = []
+        for group, paths in groups.items():
+            for path in paths:
+                if path.endswith("/"):
+                    self._prefixes.append((path, group))
+                else:
+                    self._exact[path] = group
+        self._resolved: Dict[str, Optional[TokenBucket]] = {}
+
+    def group(self, path: str) -> Optional[str]:
+        group = self._exact.get(path)
+        if group is not None:
+            return group
+        for prefix, group in self._prefixes:
+            if path.startswith(prefix):
+                return group
+        return None
+
+    def bucket(self, path: str) -> Optional[TokenBucket]:
+        try:
+            return self._resolved[path]
+        except KeyError:
+            bucket = self._resolved[path] = self.buckets.get(self.group(path))
+            return bucket
+
+    async def acquire(self, path: str) -> None:
+        """Wait until a request to ``path`` is allowed.
+
+        Raises:
+            RateLimitExceededError: The request would wait longer than its bucket's ``max_wait``.
+        """
+        bucket = self.bucket(path)
+        if bucket is not None:
+            await bucket.acquire()
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Set, Tuple
+
+from numpy import ndarray
+
+from aiotcvectordb.client.serializer import json_default
+
+# Read paths whose results are cached
+CACHE_PATHS = frozenset(
+    {
+        "/document/search",
+        "/document/query",
+        "/document/hybridSearch",
+    }
+)
+
+# Write paths invalidating the cached results of their collection
+COLLECTION_WRITE_PATHS = frozenset(
+    {
+        "/document/upsert",
+        "/document/update",
+        "/document/delete",
+        "/collection/truncate",
+        "/collection/drop",
+    }
+)
+
+# Write paths invalidating the cached results of their whole database
+DATABASE_WRITE_PATHS = frozenset(
+    {
+        "/alias/set",
+        "/alias/delete",
+        "/database/drop",
+    }
+)
+
+CollectionKey = Tuple[str, str]
+
+
+def _update(digest: Any, obj: Any) -> None:
+    # Values are fed with a type tag and a length, so that different bodies don't feed
+    # the same bytes.
+    if isinstance(obj, str):
+        data = obj.encode("utf-8")
+        digest.update(b"s%d:" % len(data))
+        digest.update(data)
+    elif obj is None or isinstance(obj, (bool, int, float)):
+        digest.update(b"v%a;" % (obj,))
+    elif isinstance(obj, Mapping):
+        digest.update(b"{%d:" % len(obj))
+        for key in sorted(obj):
+            _update(digest, key)
+            _update(digest, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"[%d:" % len(obj))
+        if obj and type(obj[0]) is float:
+            # vectors given as lists are hashed as packed doubles
+            try:
+                digest.update(array("d", obj).tobytes())
+                return
+            except TypeError:
+                pass
+        for item in obj:
+            _update(digest, item)
+    elif isinstance(obj, ndarray):
+        # hashed from the buffer instead of being converted to lists
+        digest.update(b"n%s%a:" % (obj.dtype.str.encode(), obj.shape))
+        digest.update(obj.tobytes())
+    else:
+        _update(digest, json_default(obj))
+
+
+def request_key(path: str, body: Mapping[str, Any]) -> bytes:
+    """Hash of a request, independent of the key order of its body."""
+    digest = hashlib.blake2b(digest_size=16)
+    _update(digest, path)
+    _update(digest, body)
+    return digest.digest()
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "nbytes", "collection")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        nbytes: int,
+        collection: CollectionKey,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.nbytes = nbytes
+        self.collection = collection
+
+
+class ResultCache:
+    """Read-through cache of search/query results, bounded by entries and bytes (LRU).
+
+    Results are keyed by a hash of the path and canonical request body, ndarray vectors are
+    hashed from their buffer. Upsert/update/delete/truncate/drop requests sent through the
+    same client drop the entries of their collection, alias and database changes drop the
+    entries of the database. Strongly consistent reads are never cached.
+
+    Writes made by other clients, or through an alias while reading through the collection
+    name (or the reverse), are only seen once the entries expire.
+
+    Args:
+        maxsize (int): Maximum number of entries.
+        max_bytes (int): Maximum total size of the cached responses, as received, None for no
+            bound.
+        ttl (float): Lifetime in seconds of an entry.
+        ttls (Mapping[Tuple[str, str], float]): Lifetime per (database, collection), overriding
+            ``ttl``. 0 disables caching for the collection.
+        paths (Iterable[str]): Paths whose results are cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        ttl: float = 5.0,
+        ttls: Optional[Mapping[CollectionKey, float]] = None,
+        paths: Iterable[str] = CACHE_PATHS,
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttls: Dict[CollectionKey, float] = dict(ttls or {})
+        self.paths = frozenset(paths)
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._by_collection: Dict[CollectionKey, Set[Hashable]] = {}
+        # bumped on every invalidation, so that a read racing with a write isn't stored
+        self._generations: Dict[CollectionKey, int] = {}
+        self._database_generations: Dict[str, int] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def set_ttl(self, database_name: str, collection_name: str, ttl: float) -> None:
+        self.ttls[(database_name, collection_name)] = ttl
+
+    def applies(self, path: str, body: Optional[Mapping[str, Any]]) -> bool:
+        return (
+            path in self.paths
+            and body is not None
+            and body.get("readConsistency") != "strongConsistency"
+            and self._ttl(self.collection(body)) > 0
+        )
+
+    @staticmethod
+    def collection(body: Mapping[str, Any]) -> CollectionKey:
+        return body.get("database") or "", body.get("collection") or ""
+
+    def _ttl(self, collection: CollectionKey) -> float:
+        return self.ttls.get(collection, self.ttl)
+
+    def generation(self, collection: CollectionKey) -> int:
+        return self._generations.get(collection, 0)
+
+    def database_generation(self, database_name: str) -> int:
+        return self._database_generations.get(database_name, 0)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        collection: CollectionKey,
+        nbytes: int,
+        generation: int,
+        database_generation: int = 0,
+    ) -> None:
+        """Store ``value`` unless the collection or database generations changed."""
+        stale = generation != self.generation(collection)
+        if stale or database_generation != self.database_generation(collection[0]):
+            return
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        if key in self._data:
+            self._remove(key)
+        expires_at = time.monotonic() + self._ttl(collection)
+        self._data[key] = _Entry(value, expires_at, nbytes, collection)
+        self._by_collection.setdefault(collection, set()).add(key)
+        self.nbytes += nbytes
+        while len(self._data) > self.maxsize or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._data)))
+
+    def lookup(self, path: str, body: Mapping[str, Any], ai: Any) -> Tuple[Any, Any]:
+        """Cached response of a request, and a token to ``store`` its response on a miss.
+
+        Responses are stored and returned as copies, callers own them.
+        """
+        key = (request_key(path, body), ai)
+        cached = self.get(key)
+        if cached is not None:
+            return cached.copy(), None
+        collection = self.collection(body)
+        return None, (
+            key,
+            collection,
+            self.generation(collection),
+            self.database_generation(collection[0]),
+        )
+
+    def store(self, token: Any, response: Any) -> None:
+        key, collection, generation, database_generation = token
+        self.set(
+            key,
+            response.copy(),
+            collection,
+            response.nbytes,
+            generation,
+            database_generation,
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key)
+        self.nbytes -= entry.nbytes
+        keys = self._by_collection.get(entry.collection)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_collection[entry.collection]
+
+    def invalidate_collection(self, database_name: str, collection_name: str) -> int:
+        """Drop the entries of a collection, returns the number removed."""
+        collection = (database_name, collection_name)
+        self._generations[collection] = self.generation(collection) + 1
+        keys = self._by_collection.pop(collection, ())
+        for key in keys:
+            self.nbytes -= self._data.pop(key).nbytes
+        return len(keys)
+
+    def invalidate_database(self, database_name: str) -> int:
+        """Drop the entries of every collection of a database, returns the number removed."""
+        # also covers reads in flight on collections without entries yet
+        self._database_generations[database_name] = (
+            self.database_generation(database_name) + 1
+        )
+        return sum(
+            self.invalidate_collection(*collection)
+            for collection in list(self._by_collection)
+            if collection[0] == database_name
+        )
+
+    def invalidate(self, path: str, body: Optional[Mapping[str, Any]]) -> None:
+        """Drop the entries a write request to ``path`` may have made stale."""
+        if body is None:
+            return
+        if path in COLLECTION_WRITE_PATHS:
+            self.invalidate_collection(*self.collection(body))
+        elif path in DATABASE_WRITE_PATHS:
+            self.invalidate_database(body.get("database") or "")
+
+    def clear(self) -> None:
+        for collection in list(self._by_collection):
+            self.invalidate_collection(*collection)
+
+    def __len__(self) -> int:
+        return len(self._data)
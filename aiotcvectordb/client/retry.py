@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from typing import Iterable, Optional, Union
+
+from aiotcvectordb import exceptions
+from aiotcvectordb.client import status
+
+# POST endpoints that only read, a repeated call has no side effect
+IDEMPOTENT_PATHS = frozenset(
+    {
+        "/database/list",
+        "/collection/describe",
+        "/collection/list",
+        "/document/query",
+        "/document/search",
+        "/document/hybridSearch",
+        "/document/fullTextSearch",
+        "/document/count",
+        "/ai/documentSet/query",
+        "/ai/documentSet/get",
+        "/ai/documentSet/search",
+        "/ai/documentSet/getChunks",
+        "/ai/document/queryFileDetails",
+        "/ai/collectionView/describe",
+        "/ai/collectionView/list",
+        "/ai/document/getImageUrl",
+        "/user/describe",
+        "/user/list",
+    }
+)
+
+
+class RetryBudget:
+    """Caps retries to a fraction of the traffic, so an outage doesn't turn into a retry storm.
+
+    Within a sliding ``window``, retries are allowed while their count stays under
+    ``min_per_second * window + ratio * requests``.
+
+    Args:
+        ratio (float): Retries allowed per original request, 0.1 means at most 10% extra load.
+        min_per_second (float): Retries always allowed per second, for low traffic clients.
+        window (float): Length in seconds of the accounting window.
+    """
+
+    def __init__(
+        self, ratio: float = 0.1, min_per_second: float = 1.0, window: float = 10.0
+    ):
+        if ratio < 0 or min_per_second < 0 or window <= 0:
+            raise exceptions.ParamError(
+                message="ratio and min_per_second must be >= 0, window must be > 0"
+            )
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window
+        while self._requests and self._requests[0] <= horizon:
+            self._requests.popleft()
+        while self._retries and self._retries[0] <= horizon:
+            self._retries.popleft()
+
+    def deposit(self) -> None:
+        """Record an original (first attempt) request."""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Take one retry from the budget, returns False when it is exhausted."""
+        now = time.monotonic()
+        self._prune(now)
+        allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+class RetryPolicy:
+    """When and how ``AsyncHTTPClient`` retries a failed request.
+
+    - A connection that couldn't be established (``ConnectError``) is retried for any path,
+      the request never reached the server.
+    - Timeouts, lost connections and the ``retry_codes`` errors are only retried on
+      idempotent paths, the server may already have applied the request.
+
+    Args:
+        max_attempts (int): Total attempts including the first one.
+        backoff_base (float): Delay in seconds before the first retry, doubled on each attempt.
+        backoff_max (float): Upper bound of the delay.
+        jitter (bool): Use "full jitter", a uniform random delay in [0, backoff], so that
+            clients failing together don't retry together.
+        retry_codes (Iterable[int]): Error codes (server codes or HTTP statuses) to retry.
+        idempotent_paths (Iterable[str]): POST paths safe to repeat, GET is always idempotent.
+        budget (Union[RetryBudget, bool]): Retry budget of this policy, True creates a default
+            ``RetryBudget``, False disables the budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.05,
+        backoff_max: float = 2.0,
+        jitter: bool = True,
+        retry_codes: Iterable[int] = status.RETRY_CODES,
+        idempotent_paths: Iterable[str] = IDEMPOTENT_PATHS,
+        budget: Union[RetryBudget, bool] = True,
+    ):
+        if max_attempts < 1:
+            raise exceptions.ParamError(message="max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_codes = frozenset(retry_codes)
+        self.idempotent_paths = frozenset(idempotent_paths)
+        if budget is True:
+            budget = RetryBudget()
+        self.budget: Optional[RetryBudget] = budget or None
+
+    def is_idempotent(self, method: str, path: str) -> bool:
+        return method == "GET" or path in self.idempotent_paths
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before the retry following the ``attempt``-th (1-based) failed attempt."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retryable(self, error: BaseException, idempotent: bool) -> bool:
+        if isinstance(error, exceptions.DeadlineExceededError):
+            return False
+        if isinstance(error, exceptions.ConnectionLostError):
+            return idempotent
+        if isinstance(error, exceptions.ConnectError):
+            return True
+        if isinstance(error, exceptions.RequestTimeoutError):
+            return idempotent
+        return idempotent and status.has_status(error, self.retry_codes)
+
+    def should_retry(
+        self, error: BaseException, attempt: int, idempotent: bool
+    ) -> bool:
+        """Whether to retry after the ``attempt``-th failed attempt, consumes the budget."""
+        if attempt >= self.max_attempts or not self.retryable(error, idempotent):
+            return False
+        return self.budget is None or self.budget.withdraw()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from aiotcvectordb.client.result_cache import (
+    COLLECTION_WRITE_PATHS,
+    DATABASE_WRITE_PATHS,
+    CollectionKey,
+    request_key,
+)
+from aiotcvectordb.exceptions import ParamError
+
+COSINE = "cosine"
+L2 = "l2"
+
+
+class _Bucket:
+    """Cached query vectors of one (collection, search parameters) context, one row each."""
+
+    __slots__ = ("collection", "vectors", "expires", "ids", "count")
+
+    def __init__(self, collection: CollectionKey, dim: int, capacity: int):
+        self.collection = collection
+        self.vectors = np.empty((capacity, dim), dtype=np.float32)
+        self.expires = np.empty(capacity, dtype=np.float64)
+        self.ids: List[int] = []
+        self.count = 0
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def append(self, vector: np.ndarray, expires_at: float, entry_id: int) -> int:
+        if self.count == len(self.vectors):
+            grown = np.empty((2 * self.count, self.dim), dtype=np.float32)
+            grown[: self.count] = self.vectors
+            self.vectors = grown
+            self.expires = np.resize(self.expires, 2 * self.count)
+        self.vectors[self.count] = vector
+        self.expires[self.count] = expires_at
+        self.ids.append(entry_id)
+        self.count += 1
+        return self.count - 1
+
+    def remove(self, row: int) -> Optional[int]:
+        """Remove a row by moving the last one in its place, returns the moved entry id."""
+        last = self.count - 1
+        self.count = last
+        if row == last:
+            self.ids.pop()
+            return None
+        self.vectors[row] = self.vectors[last]
+        self.expires[row] = self.expires[last]
+        moved = self.ids[row] = self.ids.pop()
+        return moved
+
+
+class _Entry:
+    __slots__ = ("context", "row", "result", "template")
+
+    def __init__(self, context, row, result, template):
+        self.context = context
+        self.row = row
+        self.result = result
+        self.template = template
+
+
+class SemanticCache:
+    """Approximate cache of vector searches, hits on queries near a cached one.
+
+    A search whose vector is within ``threshold`` of a cached query vector of the same
+    collection, with the same other parameters (filter, limit, params, output fields, ...),
+    returns the results of the cached query without a request. Query vectors are kept per
+    context in a float32 matrix, so a lookup is one matrix-vector product. A batch search hits
+    only when all of its vectors do, its results are then cached vector by vector.
+
+    Entries are evicted LRU past ``maxsize`` query vectors and expire after ``ttl``; writes
+    through the same client drop the entries of their collection, as with ``ResultCache``.
+    Searches by id or text and strongly consistent searches aren't cached.
+
+    Args:
+        threshold (float): Maximum distance between a query and a cached query for a hit,
+            ``1 - cosine similarity`` with the cosine metric, euclidean distance with l2.
+        metric (str): "cosine" or "l2".
+        maxsize (int): Maximum number of cached query vectors.
+        ttl (float): Lifetime in seconds of an entry.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.02,
+        metric: str = COSINE,
+        maxsize: int = 4096,
+        ttl: float = 60.0,
+    ):
+        if metric not in (COSINE, L2):
+            raise ParamError(message=f"Unknown semantic cache metric: {metric}")
+        if threshold < 0:
+            raise ParamError(message="threshold must be >= 0")
+        self.threshold = threshold
+        self.metric = metric
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._generations: Dict[CollectionKey, int] = {}
+        self._database_generations: Dict[str, int] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def applies(self, path: str, body: Optional[Mapping[str, Any]]) -> bool:
+        if path != "/document/search" or body is None:
+            return False
+        search = body.get("search")
+        return (
+            isinstance(search, Mapping)
+            and search.get("vectors") is not None
+            and body.get("readConsistency") != "strongConsistency"
+        )
+
+    def _queries(self, vectors: Any) -> Optional[np.ndarray]:
+        try:
+            queries = np.asarray(vectors, dtype=np.float32)
+        except (TypeError, ValueError):
+            # text vectors, embedded by the server
+            return None
+        if queries.ndim != 2 or queries.shape[0] == 0:
+            return None
+        if self.metric == COSINE:
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms == 0, 1, norms)
+        return queries
+
+    def _expire(self, context: Hashable) -> Optional[_Bucket]:
+        """Remove the expired rows of a context, returns its bucket if rows are left."""
+        bucket = self._buckets.get(context)
+        if bucket is None:
+            return None
+        expired = np.flatnonzero(bucket.expires[: bucket.count] <= time.monotonic())
+        # ids first, removing a row moves the last one in its place
+        for entry_id in [bucket.ids[row] for row in expired]:
+            self._remove(entry_id)
+        return self._buckets.get(context)
+
+    def _nearest(self, bucket: _Bucket, query: np.ndarray) -> Optional[_Entry]:
+        vectors = bucket.vectors[: bucket.count]
+        if self.metric == COSINE:
+            distances = 1 - vectors @ query
+        else:
+            distances = np.linalg.norm(vectors - query, axis=1)
+        row = int(np.argmin(distances))
+        if distances[row] > self.threshold:
+            return None
+        return self._entries[bucket.ids[row]]
+
+    def lookup(self, path: str, body: Mapping[str, Any], ai: Any) -> Tuple[Any, Any]:
+        """Response from cached near queries, and a token to ``store`` the response on a miss."""
+        queries = self._queries(body["search"]["vectors"])
+        if queries is None:
+            return None, None
+        search = {k: v for k, v in body["search"].items() if k != "vectors"}
+        context = (request_key(path, {**body, "search": search}), ai)
+        bucket = self._expire(context)
+        if bucket is not None and bucket.dim == queries.shape[1]:
+            entries = []
+            for query in queries:
+                entry = self._nearest(bucket, query)
+                if entry is None:
+                    break
+                entries.append(entry)
+            else:
+                for entry in entries:
+                    self._entries.move_to_end(bucket.ids[entry.row])
+                self.hits += 1
+                documents = [copy.deepcopy(entry.result) for entry in entries]
+                template = entries[0].template
+                return template.copy(
+                    {"code": 0, "msg": template.message, "documents": documents}
+                ), None
+        self.misses += 1
+        collection = (body.get("database") or "", body.get("collection") or "")
+        return None, (
+            context,
+            collection,
+            queries,
+            self._generations.get(collection, 0),
+            self._database_generations.get(collection[0], 0),
+        )
+
+    def store(self, token: Any, response: Any) -> None:
+        if token is None:
+            return
+        context, collection, queries, generation, database_generation = token
+        documents = response.body.get("documents")
+        if (
+            generation != self._generations.get(collection, 0)
+            or database_generation != self._database_generations.get(collection[0], 0)
+            or not isinstance(documents, list)
+            or len(documents) != len(queries)
+            or self.maxsize <= 0
+        ):
+            return
+        bucket = self._buckets.get(context)
+        if bucket is None:
+            bucket = self._buckets[context] = _Bucket(collection, queries.shape[1], 8)
+        elif bucket.dim != queries.shape[1]:
+            return
+        template = response.copy({})
+        expires_at = time.monotonic() + self.ttl
+        for query, result in zip(queries, documents):
+            entry_id = self._next_id
+            self._next_id += 1
+            row = bucket.append(query, expires_at, entry_id)
+            self._entries[entry_id] = _Entry(
+                context, row, copy.deepcopy(result), template
+            )
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        bucket = self._buckets[entry.context]
+        moved = bucket.remove(entry.row)
+        if moved is not None:
+            self._entries[moved].row = entry.row
+        if bucket.count == 0:
+            del self._buckets[entry.context]
+
+    def invalidate_collection(self, database_name: str, collection_name: str) -> int:
+        """Drop the entries of a collection, returns the number removed."""
+        collection = (database_name, collection_name)
+        self._generations[collection] = self._generations.get(collection, 0) + 1
+        removed = 0
+        for context, bucket in list(self._buckets.items()):
+            if bucket.collection != collection:
+                continue
+            for entry_id in bucket.ids:
+                del self._entries[entry_id]
+            removed += bucket.count
+            del self._buckets[context]
+        return removed
+
+    def invalidate(self, path: str, body: Optional[Mapping[str, Any]]) -> None:
+        """Drop the entries a write request to ``path`` may have made stale."""
+        if body is None:
+            return
+        database_name = body.get("database") or ""
+        if path in COLLECTION_WRITE_PATHS:
+            self.invalidate_collection(database_name, body.get("collection") or "")
+        elif path in DATABASE_WRITE_PATHS:
+            # also covers searches in flight on collections without entries yet
+            self._database_generations[database_name] = (
+                self._database_generations.get(database_name, 0) + 1
+            )
+            collections = {b.collection for b in self._buckets.values()}
+            for collection in collections:
+                if collection[0] == database_name:
+                    self.invalidate_collection(*collection)
+
+    def clear(self) -> None:
+        for bucket in list(self._buckets.values()):
+            self.invalidate_collection(*bucket.collection)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+from aiotcvectordb.exceptions import ParamError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_default(obj: Any) -> Any:
+    """``default`` hook of ``json.dumps`` encoding numpy arrays and scalars."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONSerializer:
+    """Request/response codec based on the standard library ``json``."""
+
+    name = "json"
+    content_type = "application/json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=json_default
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class ORJSONSerializer:
+    """Request/response codec based on ``orjson``, numpy arrays are encoded natively."""
+
+    name = "orjson"
+    content_type = "application/json"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed, run `pip install orjson`")
+        self._option = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=json_default, option=self._option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+def get_serializer(serializer: Union[str, Any, None] = "auto"):
+    """Resolve a serializer.
+
+    Args:
+        serializer: "auto" (orjson when installed, else json), "json", "orjson", or any object
+            providing ``dumps(obj) -> bytes``, ``loads(bytes)`` and ``content_type``.
+    """
+    if serializer is None or serializer == "auto":
+        return ORJSONSerializer() if orjson is not None else JSONSerializer()
+    if serializer == "json":
+        return JSONSerializer()
+    if serializer == "orjson":
+        return ORJSONSerializer()
+    if isinstance(serializer, str):
+        raise ParamError(message=f"Unknown serializer: {serializer}")
+    return serializer
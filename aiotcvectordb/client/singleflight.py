@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+from aiotcvectordb.client.retry import IDEMPOTENT_PATHS
+
+
+class _Flight:
+    __slots__ = ("task", "waiters", "copies")
+
+    def __init__(self):
+        self.task: Optional[asyncio.Future] = None
+        self.waiters = 0
+        # copies of the result for all waiters but one, taken before any of them resumes
+        self.copies: List[Any] = []
+
+
+class SingleFlight:
+    """Share one in-flight request between concurrent identical read requests.
+
+    A request arriving while an identical one (same method, path, encoded body, backend,
+    timeout and priority) is in flight doesn't go to the server, it waits for the result of
+    the first one. The first request runs in its own task, so cancelling one caller doesn't
+    fail the others; it's cancelled once no caller waits for it anymore.
+
+    Every caller gets its own response body: the copies are made when the request completes,
+    before any caller resumes. Requests are deduplicated within the client only while in
+    flight, nothing is cached.
+
+    Args:
+        paths (Iterable[str]): POST paths eligible for deduplication, they must be read-only.
+            GET requests are always eligible.
+    """
+
+    def __init__(self, paths: Iterable[str] = IDEMPOTENT_PATHS):
+        self.paths = frozenset(paths)
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.shared = 0
+
+    def applies(self, method: str, path: str) -> bool:
+        return method == "GET" or path in self.paths
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable], copy=None):
+        """Run ``call`` unless a call with the same ``key`` is in flight, and return its result.
+
+        Args:
+            copy (Callable): Applied to the result once per extra caller as soon as the call
+                completes, before any caller resumes, so that callers don't share mutable
+                results.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.shared += 1
+        else:
+            flight = self._flights[key] = _Flight()
+            flight.task = asyncio.ensure_future(self._run(key, flight, call, copy))
+            flight.task.add_done_callback(lambda _: self._done(key, flight))
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                flight.waiters -= 1
+                if flight.waiters == 0:
+                    self._done(key, flight)
+                    flight.task.cancel()
+            raise
+        # one caller gets the result itself, the others a copy
+        return flight.copies.pop() if flight.copies else result
+
+    async def _run(
+        self,
+        key: Hashable,
+        flight: _Flight,
+        call: Callable[[], Awaitable],
+        copy: Optional[Callable],
+    ):
+        try:
+            result = await call()
+        finally:
+            # no caller can join once the result is known
+            self._done(key, flight)
+        if copy is not None:
+            flight.copies = [copy(result) for _ in range(flight.waiters - 1)]
+        return result
+
+    def _done(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
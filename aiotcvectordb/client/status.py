@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from aiotcvectordb import exceptions
+
+# Error codes are HTTP statuses, raised as codes when the body isn't a code/msg body.
+
+# Statuses worth retrying
+RETRY_CODES = (429, 502, 503, 504)
+
+# Statuses meaning the server side is overloaded or down
+OVERLOAD_CODES = (429, 500, 502, 503, 504)
+
+# Statuses meaning the endpoint itself is unhealthy
+UNHEALTHY_CODES = (500, 502, 503, 504)
+
+
+def has_status(error: BaseException, codes: Iterable[int]) -> bool:
+    """Whether ``error`` is a server error with one of ``codes``."""
+    return isinstance(error, exceptions.ServerInternalError) and error.code in codes
+
+
+def is_failure(error: BaseException, codes: Iterable[int]) -> bool:
+    """Whether ``error`` is a connect error, a timeout or a server error with one of ``codes``."""
+    if isinstance(error, (exceptions.ConnectError, exceptions.RequestTimeoutError)):
+        return True
+    return has_status(error, codes)
@@ -1,9 +1,13 @@
-from typing import List, Optional, Union, Dict, Any
+from typing import Callable, List, Optional, Sequence, Union, Dict, Any
 from numpy import ndarray
 
 from aiotcvectordb import exceptions
 from aiotcvectordb.model.ai_database import AsyncAIDatabase
+from aiotcvectordb.model.bulk import MAX_UPSERT_BATCH_SIZE, Documents
+from aiotcvectordb.model.coalescer import SearchCoalescer
+from aiotcvectordb.model.collection import AsyncCollection
 from aiotcvectordb.model.database import AsyncDatabase
+from aiotcvectordb.model.results import SearchColumns
 from tcvectordb.model.collection import Embedding, FilterIndexConfig, Collection
 from tcvectordb.model.document import Document, Filter, AnnSearch, KeywordSearch, Rerank
 from tcvectordb.model.enum import ReadConsistency
@@ -15,15 +19,69 @@ from tcvectordb.model.index import (
     SparseVector,
 )
 
+from aiotcvectordb.client.balancer import EndpointBalancer
+from aiotcvectordb.client.breaker import CircuitBreaker
+from aiotcvectordb.client.cache import DatabaseIndex, TTLCache
+from aiotcvectordb.client.concurrency import ConcurrencyLimiter, Priority
+from aiotcvectordb.client.hedge import HedgePolicy
+from aiotcvectordb.client.ratelimit import RateLimiter
+from aiotcvectordb.client.result_cache import ResultCache
+from aiotcvectordb.client.semantic_cache import SemanticCache
 from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.retry import RetryPolicy
+from aiotcvectordb.client.singleflight import SingleFlight
 
 
 class AsyncVectorDBClient:
-    """Async client for vector db using aiohttp."""
+    """Async client for vector db using aiohttp.
+
+    Args:
+        url (Union[str, Sequence[str]]): Access endpoint, or a list of endpoints to balance
+            requests over with a default ``EndpointBalancer``.
+        serializer (Union[str, object]): JSON codec for request and response bodies, "auto" uses
+            orjson when it is installed and falls back to the standard json module, "json" and
+            "orjson" force one of them. numpy arrays in bodies are supported by both.
+        collection_cache (bool): Cache the collection handles resolved by document APIs, so that
+            ``upsert``/``search``/... don't issue a ``/collection/describe`` before every call.
+            Entries are dropped on drop/truncate/alias/index changes made through this client.
+        collection_cache_size (int): Maximum number of cached collection handles.
+        collection_cache_ttl (float): Lifetime in seconds of a cached collection handle.
+        database_cache (bool): Resolve ``database()`` from a cached name -> type index of
+            ``/database/list`` instead of listing and scanning all databases on every call.
+        database_cache_ttl (float): Lifetime in seconds of the database index.
+        search_coalesce_window (float): Opt-in, when set, concurrent ``search`` calls on the same
+            collection with identical parameters arriving within this many seconds are merged
+            into one batched request.
+        search_coalesce_max_batch (int): Maximum vectors in one merged search request.
+        retry (RetryPolicy): Retry failed requests with backoff, see
+            ``aiotcvectordb.client.retry.RetryPolicy``. None (default) disables retries.
+        hedge (HedgePolicy): Hedge slow search/query/count requests with a second identical
+            request, see ``aiotcvectordb.client.hedge.HedgePolicy``. None (default) disables it.
+        balancer (EndpointBalancer): Balance requests over several endpoints and eject the
+            unhealthy ones, see ``aiotcvectordb.client.balancer.EndpointBalancer``. Overrides
+            ``url`` when set.
+        breaker (CircuitBreaker): Fail fast with ``CircuitOpenError`` on hosts (or collections)
+            whose requests keep failing, see ``aiotcvectordb.client.breaker.CircuitBreaker``.
+        rate_limiter (RateLimiter): Client-side rate limits per group of paths (write, read,
+            admin), e.g. ``RateLimiter({"write": 100})`` keeps a bulk upsert from starving the
+            searches sharing the client, see ``aiotcvectordb.client.ratelimit.RateLimiter``.
+        concurrency (ConcurrencyLimiter): Adaptive limit of the requests in flight with a bounded
+            queue, see ``aiotcvectordb.client.concurrency.ConcurrencyLimiter``. Queued requests
+            are admitted by their ``priority`` argument, bulk upserts default to ``Priority.LOW``.
+        single_flight (Union[bool, SingleFlight]): Opt-in, concurrent identical read requests
+            (describe, list, search, query, ...) share one in-flight request, see
+            ``aiotcvectordb.client.singleflight.SingleFlight``.
+        result_cache (Union[bool, ResultCache]): Opt-in, cache search/query/hybrid_search
+            results, dropped on upsert/update/delete/truncate made through this client, see
+            ``aiotcvectordb.client.result_cache.ResultCache``.
+        semantic_cache (SemanticCache): Opt-in, answer vector searches near a recent search of
+            the same collection and parameters from its results, see
+            ``aiotcvectordb.client.semantic_cache.SemanticCache``.
+    """
 
     def __init__(
         self,
-        url: Optional[str] = None,
+        url: Union[str, Sequence[str], None] = None,
         username: str = "",
         key: str = "",
         read_consistency: ReadConsistency = ReadConsistency.EVENTUAL_CONSISTENCY,
@@ -32,6 +90,23 @@ class AsyncVectorDBClient:
         proxies: Optional[dict] = None,
         password: Optional[str] = None,
         connector: Optional[object] = None,
+        serializer: Union[str, object, None] = "auto",
+        collection_cache: bool = True,
+        collection_cache_size: int = 128,
+        collection_cache_ttl: Optional[float] = 60.0,
+        database_cache: bool = True,
+        database_cache_ttl: Optional[float] = 60.0,
+        search_coalesce_window: Optional[float] = None,
+        search_coalesce_max_batch: int = 20,
+        retry: Optional[RetryPolicy] = None,
+        hedge: Optional[HedgePolicy] = None,
+        balancer: Optional[EndpointBalancer] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[ConcurrencyLimiter] = None,
+        single_flight: Union[bool, SingleFlight] = False,
+        result_cache: Union[bool, ResultCache] = False,
+        semantic_cache: Optional[SemanticCache] = None,
     ):
         self._conn = AsyncHTTPClient(
             url,
@@ -42,13 +117,102 @@ class AsyncVectorDBClient:
             proxies=proxies,
             password=password,
             connector=connector,
+            serializer=serializer,
+            retry=retry,
+            hedge=hedge,
+            balancer=balancer,
+            breaker=breaker,
+            rate_limiter=rate_limiter,
+            concurrency=concurrency,
+            single_flight=single_flight,
+            result_cache=result_cache,
+            semantic_cache=semantic_cache,
         )
         self._read_consistency = read_consistency
+        self._collection_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=collection_cache_size, ttl=collection_cache_ttl)
+            if collection_cache
+            else None
+        )
+        self._database_index: Optional[DatabaseIndex] = (
+            DatabaseIndex(ttl=database_cache_ttl) if database_cache else None
+        )
+        self._search_coalesce_window = search_coalesce_window
+        self._search_coalesce_max_batch = search_coalesce_max_batch
+        self._coalescers: Dict[tuple, SearchCoalescer] = {}
 
     @property
     def http_client(self):
         return self._conn
 
+    def _cache_collection(self, database_name: str, collection_name: str, coll) -> None:
+        if self._collection_cache is not None:
+            self._collection_cache.set((database_name, collection_name), coll)
+
+    # Changes call these both before and after their request: a concurrent lookup may
+    # cache the handle again while the request is in flight.
+    def _invalidate_collection(self, database_name: str, collection_name: str) -> None:
+        if self._collection_cache is not None:
+            self._collection_cache.pop((database_name, collection_name))
+
+    def _invalidate_database(self, database_name: str) -> None:
+        if self._collection_cache is not None:
+            self._collection_cache.invalidate(lambda key: key[0] == database_name)
+
+    def clear_collection_cache(self) -> None:
+        """Drop all cached collection handles."""
+        if self._collection_cache is not None:
+            self._collection_cache.clear()
+
+    def _new_database(
+        self, database_name: str, info: Optional[dict]
+    ) -> Union[AsyncDatabase, AsyncAIDatabase]:
+        db_type = info.get("dbType", "BASE_DB") if info else "BASE_DB"
+        cls = AsyncAIDatabase if db_type in ("AI_DOC", "AI_DB") else AsyncDatabase
+        return cls(
+            conn=self._conn,
+            name=database_name,
+            read_consistency=self._read_consistency,
+            info=info,
+        )
+
+    async def refresh_databases(self, timeout: Optional[float] = None) -> List[str]:
+        """Reload the database index used by ``database()`` from ``/database/list``.
+
+        Args:
+            timeout (float): An optional duration of time in seconds to allow for the request. When timeout
+                is set to None, will use the connect timeout.
+
+        Returns:
+            List[str]: all database names
+        """
+        res = await self._conn.get("/database/list", timeout=timeout)
+        names = res.body.get("databases", [])
+        db_info = res.body.get("info", {})
+        if self._database_index is not None:
+            self._database_index.load({n: db_info.get(n, {}) for n in names})
+        return names
+
+    async def _lookup_database(
+        self, database_name: str, timeout: Optional[float] = None
+    ) -> Optional[Union[AsyncDatabase, AsyncAIDatabase]]:
+        index = self._database_index
+        if index is None:
+            for db in await self.list_databases(timeout=timeout):
+                if db.database_name == database_name:
+                    return db
+            return None
+        refreshed = False
+        if not index.fresh:
+            await self.refresh_databases(timeout=timeout)
+            refreshed = True
+        if database_name not in index and not refreshed:
+            # 可能由其他客户端新建，强制刷新一次
+            await self.refresh_databases(timeout=timeout)
+        if database_name not in index:
+            return None
+        return self._new_database(database_name, index.get(database_name))
+
     async def close(self):
         await self._conn.close()
 
@@ -77,6 +241,8 @@ class AsyncVectorDBClient:
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
         await db.create_database(timeout=timeout)
+        if self._database_index is not None:
+            self._database_index.invalidate()
         return db
 
     async def create_database_if_not_exists(
@@ -96,10 +262,9 @@ class AsyncVectorDBClient:
         Returns:
             AsyncDatabase: A database object.
         """
-        dbs = await self.list_databases(timeout=timeout)
-        for db in dbs:
-            if db.database_name == database_name:
-                return db
+        db = await self._lookup_database(database_name, timeout=timeout)
+        if db is not None:
+            return db
         return await self.create_database(database_name=database_name, timeout=timeout)
 
     async def create_ai_database(
@@ -121,6 +286,8 @@ class AsyncVectorDBClient:
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
         await db.create_database(timeout=timeout)
+        if self._database_index is not None:
+            self._database_index.invalidate()
         return db
 
     async def drop_database(
@@ -139,7 +306,15 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.drop_database(timeout=timeout)
+        self._invalidate_database(database_name)
+        if self._database_index is not None:
+            self._database_index.discard(database_name)
+        try:
+            return await adb.drop_database(timeout=timeout)
+        finally:
+            self._invalidate_database(database_name)
+            if self._database_index is not None:
+                self._database_index.discard(database_name)
 
     async def drop_ai_database(
         self, database_name: str, timeout: Optional[float] = None
@@ -154,9 +329,17 @@ class AsyncVectorDBClient:
         Returns:
             Dict: Contains code、msg、affectedCount
         """
-        res = await self._conn.post(
-            "/ai/database/drop", {"database": database_name}, timeout
-        )
+        self._invalidate_database(database_name)
+        if self._database_index is not None:
+            self._database_index.discard(database_name)
+        try:
+            res = await self._conn.post(
+                "/ai/database/drop", {"database": database_name}, timeout
+            )
+        finally:
+            self._invalidate_database(database_name)
+            if self._database_index is not None:
+                self._database_index.discard(database_name)
         return res.data()
 
     async def list_databases(
@@ -173,21 +356,25 @@ class AsyncVectorDBClient:
         """
         db = AsyncDatabase(conn=self._conn, read_consistency=self._read_consistency)
         dbs = await db.list_databases(timeout=timeout)
+        if self._database_index is not None:
+            self._database_index.load({d.database_name: d.info or {} for d in dbs})
         return dbs
 
     async def database(self, database: str) -> Union[AsyncDatabase, AsyncAIDatabase]:
         """Get a database.
 
+        The database type is resolved from the cached database index when it is enabled,
+        the index is reloaded when it's expired or the name is unknown.
+
         Args:
             database (str): The name of the database.
 
         Returns:
             An AsyncDatabase or AsyncAIDatabase object
         """
-        dbs = await self.list_databases()
-        for db in dbs:
-            if db.database_name == database:
-                return db
+        db = await self._lookup_database(database)
+        if db is not None:
+            return db
         raise exceptions.ParamError(
             code=14100, message="Database not exist: {}".format(database)
         )
@@ -232,18 +419,22 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.create_collection(
-            name=collection_name,
-            shard=shard,
-            replicas=replicas,
-            description=description,
-            index=index,
-            embedding=embedding,
-            timeout=timeout,
-            ttl_config=ttl_config,
-            filter_index_config=filter_index_config,
-            indexes=indexes,
-        )
+        self._invalidate_collection(database_name, collection_name)
+        try:
+            return await adb.create_collection(
+                name=collection_name,
+                shard=shard,
+                replicas=replicas,
+                description=description,
+                index=index,
+                embedding=embedding,
+                timeout=timeout,
+                ttl_config=ttl_config,
+                filter_index_config=filter_index_config,
+                indexes=indexes,
+            )
+        finally:
+            self._invalidate_collection(database_name, collection_name)
 
     async def create_collection_if_not_exists(
         self,
@@ -331,11 +522,16 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.describe_collection(collection_name, timeout=timeout)
+        coll = await adb.describe_collection(collection_name, timeout=timeout)
+        self._cache_collection(database_name, collection_name, coll)
+        return coll
 
     async def collection(self, database_name: str, collection_name: str) -> Collection:
         """Get a Collection by name.
 
+        The handle is served from the collection cache when it is enabled, use
+        ``describe_collection`` to always fetch the latest collection info.
+
         Args:
             database_name (str): The name of the database.
             collection_name (str): The name of the collection.
@@ -343,10 +539,32 @@ class AsyncVectorDBClient:
         Returns:
             A Collection object
         """
+        if self._collection_cache is not None:
+            coll = self._collection_cache.get((database_name, collection_name))
+            if coll is not None:
+                return coll
+        return await self.describe_collection(database_name, collection_name)
+
+    def collection_ref(
+        self, database_name: str, collection_name: str
+    ) -> AsyncCollection:
+        """Get a Collection handle by name without any request.
+
+        Document APIs on the returned handle (``upsert``/``search``/``query``/...) only need
+        the database and collection names, so no ``/collection/describe`` is issued and no
+        index is rebuilt. Call ``await coll.describe()`` to load the collection info on demand.
+
+        Args:
+            database_name (str): The name of the database.
+            collection_name (str): The name or alias of the collection.
+
+        Returns:
+            An AsyncCollection object
+        """
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.describe_collection(collection_name)
+        return adb.collection_ref(collection_name)
 
     async def list_collections(
         self, database_name: str, timeout: Optional[float] = None
@@ -383,7 +601,11 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.drop_collection(collection_name, timeout=timeout)
+        self._invalidate_collection(database_name, collection_name)
+        try:
+            return await adb.drop_collection(collection_name, timeout=timeout)
+        finally:
+            self._invalidate_collection(database_name, collection_name)
 
     async def truncate_collection(
         self, database_name: str, collection_name: str
@@ -400,7 +622,11 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.truncate_collection(collection_name)
+        self._invalidate_collection(database_name, collection_name)
+        try:
+            return await adb.truncate_collection(collection_name)
+        finally:
+            self._invalidate_collection(database_name, collection_name)
 
     async def set_alias(
         self, database_name: str, collection_name: str, collection_alias: str
@@ -417,9 +643,14 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.set_alias(
-            collection_name=collection_name, collection_alias=collection_alias
-        )
+        # 别名可能指向库内任意集合，直接失效整个库的缓存
+        self._invalidate_database(database_name)
+        try:
+            return await adb.set_alias(
+                collection_name=collection_name, collection_alias=collection_alias
+            )
+        finally:
+            self._invalidate_database(database_name)
 
     async def delete_alias(self, database_name: str, alias: str) -> Dict:
         """Delete alias by name.
@@ -434,7 +665,11 @@ class AsyncVectorDBClient:
         adb = AsyncDatabase(
             conn=self._conn, name=database_name, read_consistency=self._read_consistency
         )
-        return await adb.delete_alias(alias=alias)
+        self._invalidate_database(database_name)
+        try:
+            return await adb.delete_alias(alias=alias)
+        finally:
+            self._invalidate_database(database_name)
 
     async def upsert(
         self,
@@ -443,6 +678,7 @@ class AsyncVectorDBClient:
         documents: List[Union[Document, Dict]],
         timeout: Optional[float] = None,
         build_index: bool = True,
+        priority: int = Priority.NORMAL,
         **kwargs,
     ):
         """Upsert documents into a collection.
@@ -456,13 +692,115 @@ class AsyncVectorDBClient:
             build_index (bool) : An option for build index time when upsert, if build_index is true, will build index
                                  immediately, it will affect performance of upsert. And param buildIndex has same
                                  semantics with build_index, any of them false will be false
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Dict: Contains affectedCount
         """
         coll = await self.collection(database_name, collection_name)
         return await coll.upsert(
-            documents=documents, timeout=timeout, build_index=build_index, **kwargs
+            documents=documents,
+            timeout=timeout,
+            build_index=build_index,
+            priority=priority,
+            **kwargs,
+        )
+
+    async def upsert_many(
+        self,
+        database_name: str,
+        collection_name: str,
+        documents: Documents,
+        batch_size: int = MAX_UPSERT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = None,
+        concurrency: int = 4,
+        timeout: Optional[float] = None,
+        build_index: bool = True,
+        priority: int = Priority.LOW,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Upsert any number of documents, split into batches sent concurrently.
+
+        Args:
+            database_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            documents (Union[Iterable, AsyncIterable]) : Documents or dicts to upsert, a list or any
+                (async) iterable. Iterables are consumed lazily.
+            batch_size (int) : Maximum documents per request, in range [1, 1000].
+            max_batch_bytes (int) : An optional limit of the approximate encoded size of the documents
+                in one request.
+            concurrency (int) : Maximum number of requests in flight.
+            timeout (float) : An optional duration of time in seconds to allow for each request.
+                              When timeout is set to None, will use the connect timeout.
+            build_index (bool) : Same as ``upsert``.
+            priority (int) : Admission priority of each request, defaults to ``Priority.LOW``.
+
+        Returns:
+            Dict: Contains affectedCount (sum of all batches), batches (number of requests sent) and
+                failures, a list of {"batch", "offset", "count", "error"} for each failed batch.
+        """
+        coll = await self.collection(database_name, collection_name)
+        return await coll.upsert_many(
+            documents=documents,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            concurrency=concurrency,
+            timeout=timeout,
+            build_index=build_index,
+            priority=priority,
+            **kwargs,
+        )
+
+    async def upsert_stream(
+        self,
+        database_name: str,
+        collection_name: str,
+        source: Documents,
+        batch_size: int = MAX_UPSERT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = None,
+        linger: Optional[float] = 1.0,
+        concurrency: int = 4,
+        timeout: Optional[float] = None,
+        build_index: bool = True,
+        on_batch: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        priority: int = Priority.LOW,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Upsert documents pulled from an (async) iterator until it is exhausted.
+
+        Args:
+            database_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            source (Union[AsyncIterable, Iterable]) : Documents or dicts to upsert.
+            batch_size (int) : Maximum documents per request, in range [1, 1000].
+            max_batch_bytes (int) : An optional limit of the approximate encoded size of the documents
+                in one request.
+            linger (float) : Maximum seconds to wait for a batch to fill up before sending it.
+            concurrency (int) : Maximum number of requests in flight, the source is not read further
+                while the window is full.
+            timeout (float) : An optional duration of time in seconds to allow for each request.
+                              When timeout is set to None, will use the connect timeout.
+            build_index (bool) : Same as ``upsert``.
+            on_batch (Callable) : Called after each batch with
+                {"batch", "offset", "count", "affectedCount"}, plus "error" when it failed.
+            priority (int) : Admission priority of each request, defaults to ``Priority.LOW``.
+
+        Returns:
+            Dict: Same as ``upsert_many``.
+        """
+        coll = await self.collection(database_name, collection_name)
+        return await coll.upsert_stream(
+            source=source,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            linger=linger,
+            concurrency=concurrency,
+            timeout=timeout,
+            build_index=build_index,
+            on_batch=on_batch,
+            priority=priority,
+            **kwargs,
         )
 
     async def delete(
@@ -473,6 +811,7 @@ class AsyncVectorDBClient:
         filter: Union[Filter, str] = None,
         timeout: Optional[float] = None,
         limit: Optional[int] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict:
         """Delete document by conditions.
 
@@ -484,13 +823,19 @@ class AsyncVectorDBClient:
             limit (int): The amount of document deleted, with a range of [1, 16384].
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Dict: Contains affectedCount
         """
         coll = await self.collection(database_name, collection_name)
         return await coll.delete(
-            document_ids=document_ids, filter=filter, timeout=timeout, limit=limit
+            document_ids=document_ids,
+            filter=filter,
+            timeout=timeout,
+            limit=limit,
+            priority=priority,
         )
 
     async def update(
@@ -501,6 +846,7 @@ class AsyncVectorDBClient:
         filter: Union[Filter, str] = None,
         document_ids: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict:
         """Update document by conditions.
 
@@ -512,13 +858,19 @@ class AsyncVectorDBClient:
             filter (Union[Filter, str]): Filter condition of the scalar index field
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Dict: Contains affectedCount
         """
         coll = await self.collection(database_name, collection_name)
         return await coll.update(
-            data=data, filter=filter, document_ids=document_ids, timeout=timeout
+            data=data,
+            filter=filter,
+            document_ids=document_ids,
+            timeout=timeout,
+            priority=priority,
         )
 
     async def query(
@@ -533,6 +885,8 @@ class AsyncVectorDBClient:
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         sort: Optional[dict] = None,
+        vector_format: str = "list",
+        priority: int = Priority.NORMAL,
     ) -> List[Dict]:
         """Query documents that satisfies the condition.
 
@@ -548,6 +902,10 @@ class AsyncVectorDBClient:
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
             sort: (dict): Set order by, like {'fieldName': 'age', 'direction': 'desc'}, default asc
+            vector_format (str): "list" (default) returns vectors as lists, "numpy" decodes the
+                                 ``vector`` field of each document into a float32 ndarray.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[Dict]: all matched documents
@@ -562,6 +920,8 @@ class AsyncVectorDBClient:
             output_fields=output_fields,
             timeout=timeout,
             sort=sort,
+            vector_format=vector_format,
+            priority=priority,
         )
 
     async def count(
@@ -570,6 +930,7 @@ class AsyncVectorDBClient:
         collection_name: str,
         filter: Union[Filter, str] = None,
         timeout: float = None,
+        priority: int = Priority.NORMAL,
     ) -> int:
         """Calculate the number of documents based on the query conditions.
 
@@ -579,12 +940,14 @@ class AsyncVectorDBClient:
             filter (Union[Filter, str]): The optional filter condition of the scalar index field.
             timeout (float): An optional duration of time in seconds to allow for the request.
                     When timeout is set to None, will use the connect timeout.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             int: The number of documents based on the query conditions
         """
         coll = await self.collection(database_name, collection_name)
-        return await coll.count(filter=filter, timeout=timeout)
+        return await coll.count(filter=filter, timeout=timeout, priority=priority)
 
     async def search(
         self,
@@ -598,7 +961,10 @@ class AsyncVectorDBClient:
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         radius: Optional[float] = None,
-    ) -> List[List[Dict]]:
+        vector_format: str = "list",
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
+    ) -> Union[List[List[Dict]], List[SearchColumns]]:
         """Search the most similar vector by the given vectors. Batch API
 
         Args:
@@ -619,10 +985,41 @@ class AsyncVectorDBClient:
                             IP: return when score >= radius, value range (-∞, +∞).
                             COSINE: return when score >= radius, value range [-1, 1].
                             L2: return when score <= radius, value range [0, +∞).
+            vector_format (str): "list" (default) returns vectors as lists, "numpy" decodes the
+                                 ``vector`` field of each document into a float32 ndarray.
+            result_format (str): "documents" (default) returns a list of dicts per query, "columnar"
+                                 returns a ``SearchColumns`` per query with ids, float32 scores,
+                                 field lists and a 2-D vector array.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[List[Dict]]: Return the most similar document for each vector.
         """
+        if self._search_coalesce_window is not None:
+            key = (database_name, collection_name)
+            coalescer = self._coalescers.get(key)
+            if coalescer is None:
+                coalescer = self.collection_ref(
+                    database_name, collection_name
+                ).coalescer(
+                    window=self._search_coalesce_window,
+                    max_batch_size=self._search_coalesce_max_batch,
+                )
+                self._coalescers[key] = coalescer
+            return await coalescer.search(
+                vectors=vectors,
+                filter=filter,
+                params=params,
+                retrieve_vector=retrieve_vector,
+                limit=limit,
+                output_fields=output_fields,
+                timeout=timeout,
+                radius=radius,
+                vector_format=vector_format,
+                result_format=result_format,
+                priority=priority,
+            )
         coll = await self.collection(database_name, collection_name)
         return await coll.search(
             vectors=vectors,
@@ -633,6 +1030,9 @@ class AsyncVectorDBClient:
             output_fields=output_fields,
             timeout=timeout,
             radius=radius,
+            vector_format=vector_format,
+            result_format=result_format,
+            priority=priority,
         )
 
     async def search_by_id(
@@ -647,7 +1047,10 @@ class AsyncVectorDBClient:
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         radius: Optional[float] = None,
-    ) -> List[List[Dict]]:
+        vector_format: str = "list",
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
+    ) -> Union[List[List[Dict]], List[SearchColumns]]:
         """Search the most similar vector by id. Batch API
 
         Args:
@@ -668,6 +1071,13 @@ class AsyncVectorDBClient:
                             IP: return when score >= radius, value range (-∞, +∞).
                             COSINE: return when score >= radius, value range [-1, 1].
                             L2: return when score <= radius, value range [0, +∞).
+            vector_format (str): "list" (default) returns vectors as lists, "numpy" decodes the
+                                 ``vector`` field of each document into a float32 ndarray.
+            result_format (str): "documents" (default) returns a list of dicts per query, "columnar"
+                                 returns a ``SearchColumns`` per query with ids, float32 scores,
+                                 field lists and a 2-D vector array.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[List[Dict]]: Return the most similar document for each id.
@@ -682,6 +1092,9 @@ class AsyncVectorDBClient:
             output_fields=output_fields,
             timeout=timeout,
             radius=radius,
+            vector_format=vector_format,
+            result_format=result_format,
+            priority=priority,
         )
 
     async def search_by_text(
@@ -696,6 +1109,7 @@ class AsyncVectorDBClient:
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         radius: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict[str, Any]:
         """Search the most similar vector by the embeddingItem. Batch API
         The embedding_items will first be embedded into a vector by the model set by the collection on the server side.
@@ -718,6 +1132,8 @@ class AsyncVectorDBClient:
                             IP: return when score >= radius, value range (-∞, +∞).
                             COSINE: return when score >= radius, value range [-1, 1].
                             L2: return when score <= radius, value range [0, +∞).
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[List[Dict]]: Return the most similar document for each embedding_item.
@@ -732,6 +1148,7 @@ class AsyncVectorDBClient:
             output_fields=output_fields,
             timeout=timeout,
             radius=radius,
+            priority=priority,
         )
 
     async def hybrid_search(
@@ -746,8 +1163,10 @@ class AsyncVectorDBClient:
         output_fields: Optional[List[str]] = None,
         limit: Optional[int] = None,
         timeout: Optional[float] = None,
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
         **kwargs,
-    ) -> List[List[Dict]]:
+    ) -> Union[List[List[Dict]], List[Dict], List[SearchColumns], SearchColumns]:
         """Dense Vector and Sparse Vector Hybrid Retrieval
 
         Args:
@@ -762,6 +1181,11 @@ class AsyncVectorDBClient:
             output_fields (List[str]): document's fields to return
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
+            result_format (str): "documents" (default) returns a list of dicts per query, "columnar"
+                                 returns a ``SearchColumns`` per query with ids, float32 scores,
+                                 field lists and a 2-D vector array.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Union[List[List[Dict], [List[Dict]]: Return the most similar document for each condition.
@@ -776,6 +1200,8 @@ class AsyncVectorDBClient:
             output_fields=output_fields,
             limit=limit,
             timeout=timeout,
+            result_format=result_format,
+            priority=priority,
             **kwargs,
         )
 
@@ -791,6 +1217,7 @@ class AsyncVectorDBClient:
         limit: Optional[int] = None,
         terminate_after: Optional[int] = None,
         cutoff_frequency: Optional[float] = None,
+        priority: int = Priority.NORMAL,
         **kwargs,
     ) -> List[Dict]:
         """Sparse Vector retrieval
@@ -808,6 +1235,8 @@ class AsyncVectorDBClient:
                     This can effectively control the rate. For large datasets, the recommended empirical value is 4000.
             cutoff_frequency(float): Sets the upper limit for the frequency or occurrence count of high-frequency terms.
                     If the term frequency exceeds the value of cutoffFrequency, the keyword is ignored.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             [List[Dict]: the list of the matched document
@@ -822,6 +1251,7 @@ class AsyncVectorDBClient:
             limit=limit,
             terminate_after=terminate_after,
             cutoff_frequency=cutoff_frequency,
+            priority=priority,
             **kwargs,
         )
 
@@ -833,6 +1263,7 @@ class AsyncVectorDBClient:
         throttle: Optional[int] = None,
         timeout: Optional[float] = None,
         field_name: Optional[str] = None,
+        priority: int = Priority.NORMAL,
     ):
         """Rebuild all indexes under the specified collection.
 
@@ -848,14 +1279,21 @@ class AsyncVectorDBClient:
                     When timeout is set to None, will use the connect timeout.
             field_name (str): Specify the fields for the reconstructed index.
                               One of vector or sparse_vector. Default vector.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
         """
         coll = await self.collection(database_name, collection_name)
-        return await coll.rebuild_index(
-            drop_before_rebuild=drop_before_rebuild,
-            throttle=throttle,
-            timeout=timeout,
-            field_name=field_name,
-        )
+        self._invalidate_collection(database_name, collection_name)
+        try:
+            return await coll.rebuild_index(
+                drop_before_rebuild=drop_before_rebuild,
+                throttle=throttle,
+                timeout=timeout,
+                field_name=field_name,
+                priority=priority,
+            )
+        finally:
+            self._invalidate_collection(database_name, collection_name)
 
     async def add_index(
         self,
@@ -880,9 +1318,13 @@ class AsyncVectorDBClient:
             dict: The API returns a code and msg. For example: {"code": 0,  "msg": "Operation success"}
         """
         coll = await self.collection(database_name, collection_name)
-        return await coll.add_index(
-            indexes=indexes, build_existed_data=build_existed_data, timeout=timeout
-        )
+        self._invalidate_collection(database_name, collection_name)
+        try:
+            return await coll.add_index(
+                indexes=indexes, build_existed_data=build_existed_data, timeout=timeout
+            )
+        finally:
+            self._invalidate_collection(database_name, collection_name)
 
     async def modify_vector_index(
         self,
@@ -916,9 +1358,13 @@ class AsyncVectorDBClient:
            }
         """
         coll = await self.collection(database_name, collection_name)
-        return await coll.modify_vector_index(
-            vector_indexes=vector_indexes, rebuild_rules=rebuild_rules, timeout=timeout
-        )
+        self._invalidate_collection(database_name, collection_name)
+        try:
+            return await coll.modify_vector_index(
+                vector_indexes=vector_indexes, rebuild_rules=rebuild_rules, timeout=timeout
+            )
+        finally:
+            self._invalidate_collection(database_name, collection_name)
 
     async def create_user(self, user: str, password: str) -> dict:
         """Create a user.
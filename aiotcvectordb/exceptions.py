@@ -37,6 +37,30 @@ class ServerInternalError(_ServerInternalError):
     pass
 
 
+class RequestTimeoutError(ServerInternalError):
+    """The request didn't complete within its timeout."""
+
+
+class DeadlineExceededError(RequestTimeoutError):
+    """The end-to-end deadline of the operation passed, see ``aiotcvectordb.client.deadline``."""
+
+
+class ConnectionLostError(ConnectError):
+    """The connection was closed or reset after the request was sent."""
+
+
+class CircuitOpenError(VectorDBException):
+    """The request wasn't sent, the circuit breaker of its host or collection is open."""
+
+
+class RateLimitExceededError(VectorDBException):
+    """The request wasn't sent, it exceeded the client-side rate limit of its path."""
+
+
+class ConcurrencyLimitExceededError(VectorDBException):
+    """The request wasn't sent, the client's concurrency limit and queue were full."""
+
+
 class DescribeCollectionException(_DescribeCollectionException):
     pass
 
@@ -53,6 +77,12 @@ __all__ = [
     "NoConnectError",
     "ConnectError",
     "ServerInternalError",
+    "RequestTimeoutError",
+    "DeadlineExceededError",
+    "ConnectionLostError",
+    "CircuitOpenError",
+    "RateLimitExceededError",
+    "ConcurrencyLimitExceededError",
     "DescribeCollectionException",
     "GrpcException",
 ]
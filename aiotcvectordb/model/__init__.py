@@ -9,6 +9,8 @@
   - CollectionEmbedding: tcvectordb.model.collection.Embedding
   - ViewEmbedding      : tcvectordb.model.collection_view.Embedding
   - SplitterProcess / ParsingProcess 用于 CollectionView
+- 结果辅助：decode_vectors / vector_matrix（将结果中的向量转为 numpy），SearchColumns / to_columns（列式检索结果）
+- 导出：JsonlSink / NumpySink（AsyncCollection.export 的输出），range_partitions（按标量字段范围分区）
 """
 
 # 异步模型（本库实现）
@@ -17,6 +19,8 @@ from .ai_database import AsyncAIDatabase
 from .collection import AsyncCollection
 from .collection_view import AsyncCollectionView
 from .document_set import AsyncDocumentSet
+from .results import SearchColumns, decode_vectors, to_columns, vector_matrix
+from .export import JsonlSink, NumpySink, range_partitions
 
 # 同步模型与类型（从 vendor 透出，便于闭环）
 from tcvectordb.model.document import (
@@ -79,4 +83,13 @@ __all__ = [
     "ViewEmbedding",
     "SplitterProcess",
     "ParsingProcess",
+    # result helpers
+    "decode_vectors",
+    "vector_matrix",
+    # export
+    "JsonlSink",
+    "NumpySink",
+    "range_partitions",
+    "SearchColumns",
+    "to_columns",
 ]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from numpy import ndarray
+from tcvectordb.model.document import Document
+import tcvectordb.exceptions as vendor_exceptions
+
+from aiotcvectordb import exceptions as aio_exceptions
+from aiotcvectordb.client.serializer import json_default
+
+if TYPE_CHECKING:
+    from aiotcvectordb.model.collection import AsyncCollection
+
+# Server side limit of documents in one /document/upsert request
+MAX_UPSERT_BATCH_SIZE = 1000
+
+DocumentLike = Union[Document, Dict[str, Any]]
+Documents = Union[Iterable[DocumentLike], AsyncIterable[DocumentLike]]
+
+
+# Upper bound of an encoded vector element: sign, 17 digits, point, exponent and comma
+ARRAY_ELEMENT_BYTES = 25
+
+
+def document_size(doc: DocumentLike) -> int:
+    """Approximate size in bytes of a document once encoded into the request body.
+
+    ndarray fields are sized from their element count, they aren't converted to lists.
+    """
+    data = doc if isinstance(doc, dict) else vars(doc)
+    fields = {}
+    size = 0
+    for key, value in data.items():
+        if isinstance(value, ndarray):
+            # "key": [...],
+            size += len(key) + 6 + value.size * ARRAY_ELEMENT_BYTES
+        else:
+            fields[key] = value
+    return size + len(
+        json.dumps(fields, ensure_ascii=False, default=json_default).encode()
+    )
+
+
+async def _aiter(documents: Documents) -> AsyncIterator[DocumentLike]:
+    if hasattr(documents, "__aiter__"):
+        async for doc in documents:
+            yield doc
+    else:
+        for doc in documents:
+            yield doc
+
+
+async def iter_batches(
+    documents: Documents,
+    batch_size: int = MAX_UPSERT_BATCH_SIZE,
+    max_batch_bytes: Optional[int] = None,
+    linger: Optional[float] = None,
+) -> AsyncIterator[Tuple[int, List[DocumentLike]]]:
+    """Split documents into batches bounded by count and approximate body size.
+
+    With ``linger`` set, a batch is also emitted once ``linger`` seconds passed since its
+    first document arrived, so a slow source doesn't hold documents back indefinitely.
+
+    Yields:
+        (offset, batch): offset is the position of the first document of the batch.
+    """
+    if batch_size <= 0 or batch_size > MAX_UPSERT_BATCH_SIZE:
+        raise aio_exceptions.ParamError(
+            message=f"batch_size must be in [1, {MAX_UPSERT_BATCH_SIZE}]"
+        )
+    if linger is not None and linger > 0:
+        async for item in _linger_batches(
+            documents, batch_size, max_batch_bytes, linger
+        ):
+            yield item
+        return
+    batch: List[DocumentLike] = []
+    batch_bytes = 0
+    offset = 0
+    async for doc in _aiter(documents):
+        size = document_size(doc) if max_batch_bytes else 0
+        if batch and (
+            len(batch) >= batch_size
+            or (max_batch_bytes and batch_bytes + size > max_batch_bytes)
+        ):
+            yield offset, batch
+            offset += len(batch)
+            batch, batch_bytes = [], 0
+        batch.append(doc)
+        batch_bytes += size
+    if batch:
+        yield offset, batch
+
+
+_END = object()
+
+
+async def _linger_batches(
+    documents: Documents,
+    batch_size: int,
+    max_batch_bytes: Optional[int],
+    linger: float,
+) -> AsyncIterator[Tuple[int, List[DocumentLike]]]:
+    # A reader task moves documents into a bounded queue, so the batcher can wait on it
+    # with a timeout without cancelling the source iterator. The queue bound keeps the
+    # reader at most one batch ahead of the consumer.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=batch_size)
+    loop = asyncio.get_running_loop()
+
+    async def _reader() -> None:
+        try:
+            async for doc in _aiter(documents):
+                await queue.put(doc)
+            await queue.put(_END)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await queue.put(e)
+
+    def _check(item):
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    reader = asyncio.ensure_future(_reader())
+    try:
+        offset = 0
+        carry = None
+        finished = False
+        while not finished:
+            item = carry if carry is not None else _check(await queue.get())
+            carry = None
+            if item is _END:
+                break
+            batch = [item]
+            batch_bytes = document_size(item) if max_batch_bytes else 0
+            deadline = loop.time() + linger
+            while len(batch) < batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = _check(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                if item is _END:
+                    finished = True
+                    break
+                size = document_size(item) if max_batch_bytes else 0
+                if max_batch_bytes and batch_bytes + size > max_batch_bytes:
+                    carry = item
+                    break
+                batch.append(item)
+                batch_bytes += size
+            yield offset, batch
+            offset += len(batch)
+    finally:
+        reader.cancel()
+
+
+async def upsert_batches(
+    collection: "AsyncCollection",
+    batches: AsyncIterator[Tuple[int, List[DocumentLike]]],
+    concurrency: int = 4,
+    timeout: Optional[float] = None,
+    build_index: bool = True,
+    on_batch: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Send batches through ``collection.upsert`` with at most ``concurrency`` in flight.
+
+    The next batch is only pulled from ``batches`` once a slot is free, so a lazy source is
+    never read further ahead than the in-flight window.
+
+    ``on_batch`` is called with {"batch", "offset", "count", "affectedCount"} after each
+    successful batch, or with an additional "error" key after a failed one.
+    """
+    if concurrency <= 0:
+        raise aio_exceptions.ParamError(message="concurrency must be greater than 0")
+    result: Dict[str, Any] = {"affectedCount": 0, "batches": 0, "failures": []}
+    slots = asyncio.Semaphore(concurrency)
+    pending = set()
+
+    async def _send(index: int, offset: int, batch: List[DocumentLike]) -> None:
+        info: Dict[str, Any] = {"batch": index, "offset": offset, "count": len(batch)}
+        try:
+            res = await collection.upsert(
+                documents=batch, timeout=timeout, build_index=build_index, **kwargs
+            )
+            info["affectedCount"] = int(res.get("affectedCount", 0) or 0)
+            result["affectedCount"] += info["affectedCount"]
+        except vendor_exceptions.VectorDBException as e:
+            info["affectedCount"] = 0
+            info["error"] = e
+            result["failures"].append(
+                {"batch": index, "offset": offset, "count": len(batch), "error": e}
+            )
+        finally:
+            slots.release()
+        if on_batch is not None:
+            on_batch(info)
+
+    try:
+        async for offset, batch in batches:
+            await slots.acquire()
+            task = asyncio.ensure_future(_send(result["batches"], offset, batch))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            result["batches"] += 1
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        for task in pending:
+            task.cancel()
+        # stops the reader task of linger batches now rather than when garbage collected
+        aclose = getattr(batches, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return result
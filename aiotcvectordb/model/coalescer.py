@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+from numpy import ndarray
+from tcvectordb.model.document import Filter
+
+from aiotcvectordb import exceptions as aio_exceptions
+from aiotcvectordb.client.concurrency import Priority
+from aiotcvectordb.model.results import SearchColumns, to_columns
+
+if TYPE_CHECKING:
+    from aiotcvectordb.model.collection import AsyncCollection
+
+
+class _PendingBatch:
+    def __init__(self, kwargs: Dict[str, Any]):
+        self.kwargs = kwargs
+        self.chunks: List[Union[List[List[float]], ndarray]] = []
+        self.size = 0
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class SearchCoalescer:
+    """Merge concurrent ``search`` calls on one collection into batched requests.
+
+    Calls with identical filter/params/retrieve_vector/limit/output_fields/radius/timeout,
+    vector/result formats and priority arriving within ``window`` seconds are sent as a single
+    ``/document/search`` with all of their vectors, and each caller gets back the results of
+    its own vectors.
+
+    Args:
+        collection (AsyncCollection): The collection to search.
+        window (float): Seconds to wait for more calls after the first one of a batch.
+        max_batch_size (int): A batch is sent immediately once it holds this many vectors.
+    """
+
+    def __init__(
+        self,
+        collection: "AsyncCollection",
+        window: float = 0.002,
+        max_batch_size: int = 20,
+    ):
+        if max_batch_size <= 0:
+            raise aio_exceptions.ParamError(
+                message="max_batch_size must be greater than 0"
+            )
+        self._collection = collection
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._sending: Set[asyncio.Future] = set()
+
+    @staticmethod
+    def _key(
+        filter: Union[Filter, str, None],
+        params,
+        retrieve_vector: bool,
+        limit: int,
+        output_fields: Optional[List[str]],
+        timeout: Optional[float],
+        radius: Optional[float],
+        vector_format: str,
+        result_format: str,
+        priority: int,
+    ) -> Hashable:
+        cond = filter if (filter is None or isinstance(filter, str)) else filter.cond
+        params_key = None if params is None else repr(sorted(vars(params).items()))
+        fields_key = None if output_fields is None else tuple(output_fields)
+        return (
+            cond,
+            params_key,
+            retrieve_vector,
+            limit,
+            fields_key,
+            timeout,
+            radius,
+            vector_format,
+            result_format,
+            priority,
+        )
+
+    async def search(
+        self,
+        vectors: Union[List[List[float]], ndarray],
+        filter: Union[Filter, str] = None,
+        params=None,
+        retrieve_vector: bool = False,
+        limit: int = 10,
+        output_fields: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        radius: Optional[float] = None,
+        vector_format: str = "list",
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
+    ) -> List[Any]:
+        """Same as ``AsyncCollection.search``, possibly sharing the request with other calls."""
+        if isinstance(vectors, ndarray):
+            rows = vectors.reshape(-1, vectors.shape[-1]) if vectors.size else vectors
+        else:
+            rows = list(vectors)
+        if len(rows) == 0:
+            return []
+        key = self._key(
+            filter,
+            params,
+            retrieve_vector,
+            limit,
+            output_fields,
+            timeout,
+            radius,
+            vector_format,
+            result_format,
+            priority,
+        )
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(
+                dict(
+                    filter=filter,
+                    params=params,
+                    retrieve_vector=retrieve_vector,
+                    limit=limit,
+                    output_fields=output_fields,
+                    timeout=timeout,
+                    radius=radius,
+                    vector_format=vector_format,
+                    result_format=result_format,
+                    priority=priority,
+                )
+            )
+            self._pending[key] = batch
+            loop = asyncio.get_running_loop()
+            batch.timer = loop.call_later(self.window, self._flush, key, batch)
+        future = asyncio.get_running_loop().create_future()
+        batch.waiters.append((batch.size, len(rows), future))
+        batch.chunks.append(rows)
+        batch.size += len(rows)
+        if batch.size >= self.max_batch_size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        task = asyncio.ensure_future(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    @staticmethod
+    def _vectors(batch: _PendingBatch) -> Union[List[List[float]], ndarray]:
+        if all(isinstance(c, ndarray) for c in batch.chunks):
+            # keep ndarray input as one array so it's encoded from the buffer
+            return np.concatenate(batch.chunks)
+        vectors: List[Any] = []
+        for chunk in batch.chunks:
+            vectors.extend(chunk.tolist() if isinstance(chunk, ndarray) else chunk)
+        return vectors
+
+    @staticmethod
+    def _empty(batch: _PendingBatch) -> Union[List[Dict], SearchColumns]:
+        if batch.kwargs["result_format"] == "columnar":
+            return to_columns([])
+        return []
+
+    async def _send(self, batch: _PendingBatch) -> None:
+        try:
+            res = await self._collection.search(
+                vectors=self._vectors(batch), **batch.kwargs
+            )
+        except asyncio.CancelledError:
+            for _, _, future in batch.waiters:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in batch.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        res = res or []
+        for start, count, future in batch.waiters:
+            if future.done():
+                continue
+            part = res[start : start + count]
+            part.extend(self._empty(batch) for _ in range(count - len(part)))
+            future.set_result(part)
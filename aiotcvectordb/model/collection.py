@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Union
 
+import numpy as np
 from numpy import ndarray
 
 from tcvectordb.model.collection import (
@@ -17,6 +18,46 @@ from tcvectordb.model.enum import ReadConsistency
 from tcvectordb.model.index import Index, SparseVector, FilterIndex, VectorIndex
 from tcvectordb.debug import Warning
 from aiotcvectordb import exceptions as aio_exceptions
+from aiotcvectordb.client.concurrency import Priority
+from aiotcvectordb.model.coalescer import SearchCoalescer
+from aiotcvectordb.model.export import JsonlSink, NumpySink, export_collection
+from aiotcvectordb.model.importer import import_files
+from aiotcvectordb.model.scan import query_pages
+from aiotcvectordb.model.results import (
+    SearchColumns,
+    check_result_format,
+    check_vector_format,
+    decode_vectors,
+    to_columns,
+)
+from aiotcvectordb.model.bulk import (
+    MAX_UPSERT_BATCH_SIZE,
+    Documents,
+    iter_batches,
+    upsert_batches,
+)
+
+
+class _Search(Search):
+    """Search whose ndarray vectors are kept as is in the request body.
+
+    The vendor ``Search`` converts ndarray vectors with ``tolist()``, allocating a Python
+    float per element. Keeping the array lets the serializer encode it straight from the
+    buffer (orjson), or convert it only at encoding time (json).
+    """
+
+    @property
+    def __dict__(self):
+        vectors = self.vectors
+        if not isinstance(vectors, ndarray):
+            return super().__dict__
+        self.vectors = None
+        try:
+            res = super().__dict__
+        finally:
+            self.vectors = vectors
+        res["vectors"] = np.ascontiguousarray(vectors)
+        return res
 
 
 class AsyncCollection(Collection):
@@ -76,22 +117,78 @@ class AsyncCollection(Collection):
             f"name='{self.collection_name}', shards={self.shard}, replicas={self.replicas})"
         )
 
+    @property
+    def described(self) -> bool:
+        """False for a handle built by ``collection_ref`` that has not been described yet."""
+        return self._index is not None
+
+    async def describe(self, timeout: Optional[float] = None) -> "AsyncCollection":
+        """Fetch the collection info from server and fill it into this handle.
+
+        Handles created by ``collection_ref`` carry only the database and collection names,
+        call this to load shard/replicas/index/embedding etc. on demand.
+
+        Args:
+            timeout (float): An optional duration of time in seconds to allow for the request.
+                             When timeout is set to None, will use the connect timeout.
+
+        Returns:
+            AsyncCollection: self, with the collection info loaded.
+        """
+        from aiotcvectordb.model.database import AsyncDatabase, _gen_collection
+
+        if not self.database_name or not self.conn_name:
+            raise aio_exceptions.ParamError(
+                message="database_name or collection_name is blank"
+            )
+        body = {"database": self.database_name, "collection": self.conn_name}
+        res = await self._conn.post("/collection/describe", body, timeout)
+        if not res.body.get("collection"):
+            raise aio_exceptions.DescribeCollectionException(
+                code=-1, message=str(res.body)
+            )
+        db = AsyncDatabase(
+            conn=self._conn,
+            name=self.database_name,
+            read_consistency=self._read_consistency,
+        )
+        coll = _gen_collection(db, res.body["collection"], self._read_consistency)
+        self._collection = coll.collection_name
+        self.shard = coll.shard
+        self.replicas = coll.replicas
+        self.description = coll.description
+        self._index = coll.index
+        self._embedding = coll.embedding
+        self.ttl_config = coll.ttl_config
+        self.filter_index_config = coll.filter_index_config
+        self.create_time = coll.create_time
+        self.document_count = coll.document_count
+        self.alias = coll.alias
+        self.index_status = coll.index_status
+        self.kwargs = coll.kwargs
+        return self
+
     async def upsert(
         self,
         documents: List[Union[Document, Dict]],
         timeout: Optional[float] = None,
         build_index: bool = True,
+        priority: int = Priority.NORMAL,
         **kwargs,
     ):
         """Upsert documents into a collection.
 
         Args:
             documents (List[Union[Document, Dict]]) : The list of the document object or dict to upsert. Maximum 1000.
+                              ndarray vectors in dict documents are encoded without converting to lists,
+                              while ``Document`` converts them on construction.
             timeout (float) : An optional duration of time in seconds to allow for the request.
                               When timeout is set to None, will use the connect timeout.
             build_index (bool) : An option for build index time when upsert, if build_index is true, will build index
                                  immediately, it will affect performance of upsert. And param buildIndex has same
                                  semantics with build_index, any of them false will be false
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Dict: Contains affectedCount
@@ -115,9 +212,151 @@ class AsyncCollection(Collection):
                 body["documents"].append(doc)
             else:
                 body["documents"].append(vars(doc))
-        res = await self._conn.post("/document/upsert", body, timeout, ai=ai)
+        res = await self._conn.post(
+            "/document/upsert", body, timeout, ai=ai, priority=priority
+        )
         return res.data()
 
+    async def upsert_many(
+        self,
+        documents: Documents,
+        batch_size: int = MAX_UPSERT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = None,
+        concurrency: int = 4,
+        timeout: Optional[float] = None,
+        build_index: bool = True,
+        priority: int = Priority.LOW,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Upsert any number of documents, split into batches sent concurrently.
+
+        Args:
+            documents (Union[Iterable, AsyncIterable]) : Documents or dicts to upsert, a list or any
+                (async) iterable. Iterables are consumed lazily.
+            batch_size (int) : Maximum documents per request, in range [1, 1000].
+            max_batch_bytes (int) : An optional limit of the approximate encoded size of the documents
+                in one request.
+            concurrency (int) : Maximum number of requests in flight.
+            timeout (float) : An optional duration of time in seconds to allow for each request.
+                              When timeout is set to None, will use the connect timeout.
+            build_index (bool) : Same as ``upsert``.
+            priority (int) : Admission priority of each request, bulk traffic defaults to
+                ``Priority.LOW`` so that it yields to interactive requests.
+
+        Returns:
+            Dict: Contains affectedCount (sum of all batches), batches (number of requests sent) and
+                failures, a list of {"batch", "offset", "count", "error"} for each failed batch.
+        """
+        return await upsert_batches(
+            self,
+            iter_batches(documents, batch_size, max_batch_bytes),
+            concurrency=concurrency,
+            timeout=timeout,
+            build_index=build_index,
+            priority=priority,
+            **kwargs,
+        )
+
+    async def upsert_stream(
+        self,
+        source: Documents,
+        batch_size: int = MAX_UPSERT_BATCH_SIZE,
+        max_batch_bytes: Optional[int] = None,
+        linger: Optional[float] = 1.0,
+        concurrency: int = 4,
+        timeout: Optional[float] = None,
+        build_index: bool = True,
+        on_batch: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        priority: int = Priority.LOW,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Upsert documents pulled from an (async) iterator until it is exhausted.
+
+        Documents are grouped into batches by count, approximate size and time, and at most
+        ``concurrency`` batches are in flight. When the window is full the source is not read
+        any further, which gives backpressure to the producer.
+
+        Args:
+            source (Union[AsyncIterable, Iterable]) : Documents or dicts to upsert.
+            batch_size (int) : Maximum documents per request, in range [1, 1000].
+            max_batch_bytes (int) : An optional limit of the approximate encoded size of the documents
+                in one request.
+            linger (float) : Maximum seconds to wait for a batch to fill up before sending it.
+                None sends only full batches (and the last one).
+            concurrency (int) : Maximum number of requests in flight.
+            timeout (float) : An optional duration of time in seconds to allow for each request.
+                              When timeout is set to None, will use the connect timeout.
+            build_index (bool) : Same as ``upsert``.
+            on_batch (Callable) : Called after each batch with
+                {"batch", "offset", "count", "affectedCount"}, plus "error" when it failed.
+            priority (int) : Admission priority of each request, bulk traffic defaults to
+                ``Priority.LOW`` so that it yields to interactive requests.
+
+        Returns:
+            Dict: Same as ``upsert_many``.
+        """
+        return await upsert_batches(
+            self,
+            iter_batches(source, batch_size, max_batch_bytes, linger=linger),
+            concurrency=concurrency,
+            timeout=timeout,
+            build_index=build_index,
+            on_batch=on_batch,
+            priority=priority,
+            **kwargs,
+        )
+
+    async def import_files(
+        self,
+        vectors_path: str,
+        metadata_path: Optional[str] = None,
+        vector_field: str = "vector",
+        start: int = 0,
+        batch_size: int = MAX_UPSERT_BATCH_SIZE,
+        concurrency: int = 4,
+        timeout: Optional[float] = None,
+        build_index: bool = True,
+        on_progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        priority: int = Priority.LOW,
+    ) -> Dict[str, Any]:
+        """Upsert the vectors of a ``.npy`` file, with the fields of a JSONL file.
+
+        The ``.npy`` file is memory mapped and read one batch at a time; row i is upserted with
+        line i of ``metadata_path`` as the other fields (including the id). Vectors are kept
+        as float32 ndarrays in the request bodies, the orjson serializer encodes them without
+        creating a Python float per element.
+
+        Args:
+            vectors_path (str) : ``.npy`` file of a 2-D array, one vector per row.
+            metadata_path (str) : JSONL file, one document (without vector) per line. None uses the
+                row numbers as ids.
+            vector_field (str) : Field to put the vectors in.
+            start (int) : First row to import, e.g. to resume from a failed batch offset.
+            batch_size (int) : Maximum documents per request, in range [1, 1000].
+            concurrency (int) : Maximum number of requests in flight.
+            timeout (float) : An optional duration of time in seconds to allow for each request.
+            build_index (bool) : Same as ``upsert``.
+            on_progress (Callable) : Called after each upserted batch with {"documents", "bytes",
+                "elapsed", "docs_per_sec", "mb_per_sec"}, bytes being the size read from the files.
+            priority (int) : Admission priority of each request, defaults to ``Priority.LOW``.
+
+        Returns:
+            Dict: Same as ``upsert_many``, plus the final figures passed to ``on_progress``.
+        """
+        return await import_files(
+            self,
+            vectors_path,
+            metadata_path=metadata_path,
+            vector_field=vector_field,
+            start=start,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            timeout=timeout,
+            build_index=build_index,
+            on_progress=on_progress,
+            priority=priority,
+        )
+
     async def query(
         self,
         document_ids: Optional[List] = None,
@@ -128,6 +367,8 @@ class AsyncCollection(Collection):
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         sort: Optional[dict] = None,
+        vector_format: str = "list",
+        priority: int = Priority.NORMAL,
     ) -> List[Dict]:
         """Query documents that satisfies the condition.
 
@@ -141,10 +382,15 @@ class AsyncCollection(Collection):
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
             sort: (dict): Set order by, like {'fieldName': 'age', 'direction': 'desc'}, default asc
+            vector_format (str): "list" (default) returns vectors as lists, "numpy" decodes the
+                                 ``vector`` field of each document into a float32 ndarray.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[Dict]: all matched documents
         """
+        check_vector_format(vector_format)
         query_param = Query(
             limit=limit,
             offset=offset,
@@ -154,8 +400,129 @@ class AsyncCollection(Collection):
             output_fields=output_fields,
             sort=sort,
         )
-        return await self.__base_query_async(
-            query=query_param, read_consistency=self._read_consistency, timeout=timeout
+        documents = await self.__base_query_async(
+            query=query_param,
+            read_consistency=self._read_consistency,
+            timeout=timeout,
+            priority=priority,
+        )
+        if vector_format == "numpy" and retrieve_vector:
+            decode_vectors(documents)
+        return documents
+
+    async def iter_query(
+        self,
+        filter: Union[Filter, str] = None,
+        page_size: int = 100,
+        keyset: Optional[str] = None,
+        output_fields: Optional[List[str]] = None,
+        retrieve_vector: bool = False,
+        timeout: Optional[float] = None,
+        vector_format: str = "list",
+        priority: int = Priority.NORMAL,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over all documents that satisfy the condition, one page per request.
+
+        The next page is requested while the caller processes the current one. A caller
+        leaving the loop early should ``aclose()`` the iterator to cancel that request at once.
+        Example:
+            async for doc in collection.iter_query(filter="age > 10", page_size=500):
+                ...
+
+        Args:
+            filter (Union[Filter, str]): Filter condition of the scalar index field
+            page_size (int): Documents per request.
+            keyset (str): An optional filter indexed (uint64) field to page by instead of offset:
+                documents are sorted by it and each page continues with ``keyset >= last value``,
+                so deep pages don't cost more than the first ones. Documents are returned in
+                ascending order of the field. The document id can't be used: the filter
+                language has no range comparison on string fields.
+            output_fields (List[str]): document's fields to return
+            retrieve_vector (bool): Whether to return vector values
+            timeout (float): An optional duration of time in seconds to allow for each request.
+            vector_format (str): Same as ``query``.
+            priority (int): Admission priority of each request.
+
+        Yields:
+            Dict: matched documents
+        """
+        check_vector_format(vector_format)
+        pages = query_pages(
+            self,
+            filter=filter,
+            page_size=page_size,
+            keyset=keyset,
+            output_fields=output_fields,
+            retrieve_vector=retrieve_vector,
+            timeout=timeout,
+            vector_format=vector_format,
+            priority=priority,
+        )
+        try:
+            async for page in pages:
+                for doc in page:
+                    yield doc
+        finally:
+            # cancels the prefetched page now, not when the generator is garbage collected
+            await pages.aclose()
+
+    async def export(
+        self,
+        sink: Union[JsonlSink, NumpySink],
+        partitions: Optional[List[Union[Filter, str, None]]] = None,
+        concurrency: int = 4,
+        page_size: int = 1000,
+        keyset: Optional[str] = None,
+        output_fields: Optional[List[str]] = None,
+        resume: bool = True,
+        timeout: Optional[float] = None,
+        on_partition: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        priority: int = Priority.LOW,
+    ) -> Dict[str, Any]:
+        """Dump the collection to files, scanning disjoint partitions concurrently.
+
+        Each partition is a filter, scanned page by page like ``iter_query`` and written to
+        its own file(s) of ``sink``. A checkpoint file in the sink directory records the
+        finished partitions, so an interrupted export started again with the same partitions
+        only scans the others. Example:
+            await collection.export(
+                NumpySink("/backup/coll"),
+                partitions=range_partitions("bucket", [16, 32, 48]),
+                keyset="bucket",
+            )
+
+        Args:
+            sink (Union[JsonlSink, NumpySink]): Where documents go, see
+                ``aiotcvectordb.model.export``.
+            partitions (List[Union[Filter, str]]): Disjoint filters covering the documents to
+                export, e.g. from ``range_partitions``. None exports the whole collection as one
+                partition.
+            concurrency (int): Maximum number of partitions scanned at once.
+            page_size (int): Documents per request.
+            keyset (str): Same as ``iter_query``, avoids deep offsets in large partitions.
+            output_fields (List[str]): document's fields to export
+            resume (bool): Skip the partitions finished by a previous run.
+            timeout (float): An optional duration of time in seconds to allow for each request.
+            on_partition (Callable): Called after each partition with {"partition", "filter",
+                "count"}, plus "error" when it failed.
+            priority (int): Admission priority of each request, defaults to ``Priority.LOW``.
+
+        Returns:
+            Dict: {"documents", "partitions", "skipped", "failures"}, failed partitions are
+                listed with their error and can be retried by running the export again.
+        """
+        return await export_collection(
+            self,
+            sink,
+            partitions=partitions,
+            concurrency=concurrency,
+            page_size=page_size,
+            keyset=keyset,
+            output_fields=output_fields,
+            resume=resume,
+            timeout=timeout,
+            on_partition=on_partition,
+            priority=priority,
         )
 
     async def search(
@@ -168,11 +535,15 @@ class AsyncCollection(Collection):
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         radius: Optional[float] = None,
-    ) -> List[List[Dict]]:
+        vector_format: str = "list",
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
+    ) -> Union[List[List[Dict]], List[SearchColumns]]:
         """Search the most similar vector by the given vectors. Batch API
 
         Args:
-            vectors (Union[List[List[float]], ndarray]): The list of vectors
+            vectors (Union[List[List[float]], ndarray]): The list of vectors. A 2-D ndarray is
+                encoded into the request body directly, without building Python lists.
             filter (Union[Filter, str]): Filter condition of the scalar index field
             params (SearchParams): query parameters
                 FLAT: No parameters need to be specified.
@@ -187,11 +558,20 @@ class AsyncCollection(Collection):
                             IP: return when score >= radius, value range (-∞, +∞).
                             COSINE: return when score >= radius, value range [-1, 1].
                             L2: return when score <= radius, value range [0, +∞).
+            vector_format (str): "list" (default) returns vectors as lists, "numpy" decodes the
+                                 ``vector`` field of each document into a float32 ndarray.
+            result_format (str): "documents" (default) returns a list of dicts per query, "columnar"
+                                 returns a ``SearchColumns`` per query with ids, float32 scores,
+                                 field lists and a 2-D vector array.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[List[Dict]]: Return the most similar document for each vector.
         """
-        search_param = Search(
+        check_vector_format(vector_format)
+        check_result_format(result_format)
+        search_param = _Search(
             retrieve_vector=retrieve_vector,
             limit=limit,
             vectors=vectors,
@@ -204,8 +584,31 @@ class AsyncCollection(Collection):
             search=search_param,
             read_consistency=self._read_consistency,
             timeout=timeout,
+            priority=priority,
         )
-        return res.get("documents")
+        documents = res.get("documents")
+        if documents and vector_format == "numpy" and retrieve_vector:
+            for docs in documents:
+                decode_vectors(docs)
+        if result_format == "columnar":
+            # one SearchColumns per query, also when the server returns no documents
+            documents = documents + [[]] * (len(vectors) - len(documents))
+            return [to_columns(docs) for docs in documents]
+        return documents
+
+    def coalescer(
+        self, window: float = 0.002, max_batch_size: int = 20
+    ) -> SearchCoalescer:
+        """Get a SearchCoalescer merging concurrent searches on this collection.
+
+        Args:
+            window (float): Seconds to wait for more calls after the first one of a batch.
+            max_batch_size (int): A batch is sent immediately once it holds this many vectors.
+
+        Returns:
+            SearchCoalescer: ``await coalescer.search(...)`` has the same signature as ``search``.
+        """
+        return SearchCoalescer(self, window=window, max_batch_size=max_batch_size)
 
     async def searchById(
         self,
@@ -217,7 +620,10 @@ class AsyncCollection(Collection):
         timeout: Optional[float] = None,
         output_fields: Optional[List[str]] = None,
         radius: Optional[float] = None,
-    ) -> List[List[Dict]]:
+        vector_format: str = "list",
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
+    ) -> Union[List[List[Dict]], List[SearchColumns]]:
         """Search the most similar vector by id. Batch API
 
         Args:
@@ -236,6 +642,13 @@ class AsyncCollection(Collection):
                             IP: return when score >= radius, value range (-∞, +∞).
                             COSINE: return when score >= radius, value range [-1, 1].
                             L2: return when score <= radius, value range [0, +∞).
+            vector_format (str): "list" (default) returns vectors as lists, "numpy" decodes the
+                                 ``vector`` field of each document into a float32 ndarray.
+            result_format (str): "documents" (default) returns a list of dicts per query, "columnar"
+                                 returns a ``SearchColumns`` per query with ids, float32 scores,
+                                 field lists and a 2-D vector array.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[List[Dict]]: Return the most similar document for each id.
@@ -244,6 +657,8 @@ class AsyncCollection(Collection):
             raise aio_exceptions.ParamError(
                 message="database_name or collection_name is blank"
             )
+        check_vector_format(vector_format)
+        check_result_format(result_format)
         search_param = Search(
             retrieve_vector=retrieve_vector,
             limit=limit,
@@ -257,8 +672,17 @@ class AsyncCollection(Collection):
             search=search_param,
             read_consistency=self._read_consistency,
             timeout=timeout,
+            priority=priority,
         )
-        return res.get("documents")
+        documents = res.get("documents")
+        if documents and vector_format == "numpy" and retrieve_vector:
+            for docs in documents:
+                decode_vectors(docs)
+        if result_format == "columnar":
+            # one SearchColumns per query, also when the server returns no documents
+            documents = documents + [[]] * (len(document_ids) - len(documents))
+            return [to_columns(docs) for docs in documents]
+        return documents
 
     async def searchByText(
         self,
@@ -270,6 +694,7 @@ class AsyncCollection(Collection):
         output_fields: Optional[List[str]] = None,
         timeout: Optional[float] = None,
         radius: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict[str, Any]:
         """Search the most similar vector by the embeddingItem. Batch API
         The embeddingItem will first be embedded into a vector by the model set by the collection on the server side.
@@ -290,6 +715,8 @@ class AsyncCollection(Collection):
                             IP: return when score >= radius, value range (-∞, +∞).
                             COSINE: return when score >= radius, value range [-1, 1].
                             L2: return when score <= radius, value range [0, +∞).
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             List[List[Dict]]: Return the most similar document for each embeddingItem.
@@ -311,6 +738,7 @@ class AsyncCollection(Collection):
             search=search_param,
             read_consistency=self._read_consistency,
             timeout=timeout,
+            priority=priority,
         )
 
     async def hybrid_search(
@@ -323,8 +751,10 @@ class AsyncCollection(Collection):
         output_fields: Optional[List[str]] = None,
         limit: Optional[int] = None,
         timeout: Optional[float] = None,
+        result_format: str = "documents",
+        priority: int = Priority.NORMAL,
         **kwargs,
-    ) -> List[List[Dict]]:
+    ) -> Union[List[List[Dict]], List[Dict], List[SearchColumns], SearchColumns]:
         """Dense Vector and Sparse Vector Hybrid Retrieval
 
         Args:
@@ -337,10 +767,16 @@ class AsyncCollection(Collection):
             output_fields (List[str]): document's fields to return
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
+            result_format (str): "documents" (default) returns a list of dicts per query, "columnar"
+                                 returns a ``SearchColumns`` per query with ids, float32 scores,
+                                 field lists and a 2-D vector array.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Union[List[List[Dict], [List[Dict]]: Return the most similar document for each condition.
         """
+        check_result_format(result_format)
         single = True
         if ann:
             if isinstance(ann, List):
@@ -384,21 +820,21 @@ class AsyncCollection(Collection):
             "readConsistency": self._read_consistency.value,
             "search": search,
         }
-        res = await self._conn.post("/document/hybridSearch", body, timeout, ai=ai)
+        res = await self._conn.post(
+            "/document/hybridSearch", body, timeout, ai=ai, priority=priority
+        )
         if "warning" in res.body:
             Warning(res.body.get("warning"))
         documents = res.body.get("documents", None)
         if not documents:
+            if result_format == "columnar" and single:
+                return to_columns([])
             return []
-        documents_res: List[List[Dict]] = []
-        for arr in documents:
-            tmp: List[Dict] = []
-            for elem in arr:
-                tmp.append(elem)
-            documents_res.append(tmp)
-        if single:
-            documents_res = documents_res[0]
-        return documents_res
+        if result_format == "columnar":
+            columns = [to_columns(docs) for docs in documents]
+            return columns[0] if single else columns
+        # the decoded body is returned as is, it isn't shared with anything else
+        return documents[0] if single else documents
 
     async def fulltext_search(
         self,
@@ -410,6 +846,7 @@ class AsyncCollection(Collection):
         limit: Optional[int] = None,
         terminate_after: Optional[int] = None,
         cutoff_frequency: Optional[float] = None,
+        priority: int = Priority.NORMAL,
         **kwargs,
     ) -> List[Dict]:
         """Sparse Vector retrieval
@@ -427,6 +864,8 @@ class AsyncCollection(Collection):
                     This can effectively control the rate. For large datasets, the recommended empirical value is 4000.
             cutoff_frequency(float): Sets the upper limit for the frequency or occurrence count of high-frequency terms.
                     If the term frequency exceeds the value of cutoffFrequency, the keyword is ignored.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             [List[Dict]: the list of the matched document
@@ -452,19 +891,13 @@ class AsyncCollection(Collection):
             "readConsistency": self._read_consistency.value,
             "search": search,
         }
-        res = await self._conn.post("/document/fullTextSearch", body)
+        res = await self._conn.post("/document/fullTextSearch", body, priority=priority)
         if "warning" in res.body:
             Warning(res.body.get("warning"))
         documents = res.body.get("documents", None)
         if not documents:
             return []
-        documents_res: List[List[Dict]] = []
-        for arr in documents:
-            tmp: List[Dict] = []
-            for elem in arr:
-                tmp.append(elem)
-            documents_res.append(tmp)
-        return documents_res[0]
+        return documents[0]
 
     async def delete(
         self,
@@ -472,6 +905,7 @@ class AsyncCollection(Collection):
         filter: Union[Filter, str] = None,
         timeout: float = None,
         limit: Optional[int] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict:
         """Delete document by conditions.
 
@@ -481,6 +915,8 @@ class AsyncCollection(Collection):
             limit (int): The amount of document deleted, with a range of [1, 16384].
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Dict: Contains affectedCount
@@ -489,7 +925,7 @@ class AsyncCollection(Collection):
             filter=filter, document_ids=document_ids, limit=limit
         )
         return await self.__base_delete_async(
-            delete_query=delete_query_param, timeout=timeout
+            delete_query=delete_query_param, timeout=timeout, priority=priority
         )
 
     async def update(
@@ -498,6 +934,7 @@ class AsyncCollection(Collection):
         filter: Union[Filter, str] = None,
         document_ids: Optional[List[str]] = None,
         timeout: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict:
         """Update document by conditions.
 
@@ -507,6 +944,8 @@ class AsyncCollection(Collection):
             filter (Union[Filter, str]): Filter condition of the scalar index field
             timeout (float): An optional duration of time in seconds to allow for the request.
                              When timeout is set to None, will use the connect timeout.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
 
         Returns:
             Dict: Contains affectedCount
@@ -516,7 +955,10 @@ class AsyncCollection(Collection):
             raise aio_exceptions.ParamError(code=-1, message="data is None")
         update_query = UpdateQuery(document_ids=document_ids, filter=filter)
         return await self.__base_update_async(
-            update_query=update_query, document=data, timeout=timeout
+            update_query=update_query,
+            document=data,
+            timeout=timeout,
+            priority=priority,
         )
 
     async def rebuild_index(
@@ -525,6 +967,7 @@ class AsyncCollection(Collection):
         throttle: Optional[int] = None,
         timeout: Optional[float] = None,
         field_name: Optional[str] = None,
+        priority: int = Priority.NORMAL,
     ):
         """Rebuild all indexes under the specified collection.
 
@@ -538,6 +981,8 @@ class AsyncCollection(Collection):
                     When timeout is set to None, will use the connect timeout.
             field_name (str): Specify the fields for the reconstructed index.
                               One of vector or sparse_vector. Default vector.
+            priority (int): Admission priority of the request when the client has a ``concurrency``
+                limiter, see ``aiotcvectordb.client.concurrency.Priority``.
         """
 
         if not self.database_name or not self.collection_name:
@@ -553,10 +998,13 @@ class AsyncCollection(Collection):
             body["throttle"] = throttle
         if field_name is not None:
             body["fieldName"] = field_name
-        await self._conn.post("/index/rebuild", body, timeout)
+        await self._conn.post("/index/rebuild", body, timeout, priority=priority)
 
     async def count(
-        self, filter: Union[Filter, str] = None, timeout: float = None
+        self,
+        filter: Union[Filter, str] = None,
+        timeout: float = None,
+        priority: int = Priority.NORMAL,
     ) -> int:
         body = {
             "database": self.database_name,
@@ -568,7 +1016,7 @@ class AsyncCollection(Collection):
         if filter is not None:
             query["filter"] = filter if isinstance(filter, str) else filter.cond
         body["query"] = query
-        res = await self._conn.post("/document/count", body, timeout)
+        res = await self._conn.post("/document/count", body, timeout, priority=priority)
         return res.data().get("count")
 
     async def add_index(
@@ -646,6 +1094,7 @@ class AsyncCollection(Collection):
         query: Query,
         read_consistency: ReadConsistency = ReadConsistency.EVENTUAL_CONSISTENCY,
         timeout: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> List[Dict]:
         if query is None:
             raise aio_exceptions.ParamError(
@@ -657,17 +1106,18 @@ class AsyncCollection(Collection):
             "query": vars(query),
             "readConsistency": read_consistency.value,
         }
-        res = await self._conn.post("/document/query", body, timeout)
+        res = await self._conn.post("/document/query", body, timeout, priority=priority)
         documents = res.body.get("documents", None)
         if not documents:
             return []
-        return [doc for doc in documents]
+        return documents
 
     async def __base_search_async(
         self,
         search: Search,
         read_consistency: ReadConsistency = ReadConsistency.EVENTUAL_CONSISTENCY,
         timeout: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict[str, Any]:
         if not self.database_name or not self.collection_name:
             raise aio_exceptions.ParamError(
@@ -688,7 +1138,9 @@ class AsyncCollection(Collection):
             and isinstance(search.vectors[0], str)
         ):
             ai = True
-        res = await self._conn.post("/document/search", body, timeout, ai=ai)
+        res = await self._conn.post(
+            "/document/search", body, timeout, ai=ai, priority=priority
+        )
         warn_msg = ""
         if (
             res.body.get("warning", None) is not None
@@ -698,16 +1150,13 @@ class AsyncCollection(Collection):
         documents = res.body.get("documents", None)
         if not documents:
             return {"warning": warn_msg, "documents": []}
-        documents_res: List[List[Dict]] = []
-        for arr in documents:
-            tmp: List[Dict] = []
-            for elem in arr:
-                tmp.append(elem)
-            documents_res.append(tmp)
-        return {"warning": warn_msg, "documents": documents_res}
+        return {"warning": warn_msg, "documents": documents}
 
     async def __base_delete_async(
-        self, delete_query: DeleteQuery, timeout: Optional[float] = None
+        self,
+        delete_query: DeleteQuery,
+        timeout: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict:
         if not self.database_name or not self.collection_name:
             raise aio_exceptions.ParamError(
@@ -718,7 +1167,9 @@ class AsyncCollection(Collection):
             "collection": self.conn_name,
             "query": vars(delete_query),
         }
-        res = await self._conn.post("/document/delete", body, timeout)
+        res = await self._conn.post(
+            "/document/delete", body, timeout, priority=priority
+        )
         return res.data()
 
     async def __base_update_async(
@@ -726,6 +1177,7 @@ class AsyncCollection(Collection):
         update_query: UpdateQuery,
         document: Union[Document, Dict],
         timeout: Optional[float] = None,
+        priority: int = Priority.NORMAL,
     ) -> Dict:
         if not self.database_name or not self.collection_name:
             raise aio_exceptions.ParamError(
@@ -748,7 +1200,9 @@ class AsyncCollection(Collection):
         else:
             ai = isinstance(vars(document).get("vector"), str)
         body["update"] = document if isinstance(document, dict) else vars(document)
-        postRes = await self._conn.post("/document/update", body, timeout, ai=ai)
+        postRes = await self._conn.post(
+            "/document/update", body, timeout, ai=ai, priority=priority
+        )
         resBody = postRes.body
         res: Dict[str, Any] = {}
         if "warning" in resBody:
@@ -466,7 +466,7 @@ class AsyncCollectionView(CollectionView):
         documents = res.body.get("documents", None)
         if not documents:
             return []
-        return [doc for doc in documents]
+        return documents
 
 
 def ds_convert(ds: DocumentSet) -> AsyncDocumentSet:
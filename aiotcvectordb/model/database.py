@@ -290,6 +290,25 @@ class AsyncDatabase(Database):
         """Get a Collection by name (async)."""
         return await self.describe_collection(name)
 
+    def collection_ref(self, name: str) -> AsyncCollection:
+        """Get a Collection handle by name without any request.
+
+        The handle only knows the database and collection names, which is all the document
+        APIs need. Collection info such as index is not loaded, call
+        ``await coll.describe()`` when it's required.
+
+        Args:
+            name (str): The name or alias of the collection.
+
+        Returns:
+            A AsyncCollection object.
+        """
+        if not self.database_name:
+            raise aio_exceptions.ParamError(message="database not found")
+        if not name:
+            raise aio_exceptions.ParamError(message="collection name param not found")
+        return AsyncCollection(self, name, read_consistency=self._read_consistency)
+
     async def describe_collection(
         self, name: str, timeout: Optional[float] = None
     ) -> AsyncCollection:
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import numpy as np
+from tcvectordb.model.document import Filter
+import tcvectordb.exceptions as vendor_exceptions
+
+from aiotcvectordb import exceptions as aio_exceptions
+from aiotcvectordb.client.concurrency import Priority
+from aiotcvectordb.client.serializer import json_default
+from aiotcvectordb.model.scan import filter_cond, literal, query_pages
+
+if TYPE_CHECKING:
+    from aiotcvectordb.model.collection import AsyncCollection
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+def range_partitions(field: str, bounds: Sequence[Any]) -> List[str]:
+    """Disjoint filters covering every value of a filter indexed field.
+
+    ``range_partitions("age", [10, 20])`` gives ``age < 10``, ``age >= 10 and age < 20`` and
+    ``age >= 20``.
+    """
+    if not bounds:
+        raise aio_exceptions.ParamError(message="bounds must not be empty")
+    if list(bounds) != sorted(bounds):
+        raise aio_exceptions.ParamError(message="bounds must be sorted")
+    partitions = [f"{field} < {literal(bounds[0])}"]
+    for low, high in zip(bounds, bounds[1:]):
+        partitions.append(f"{field} >= {literal(low)} and {field} < {literal(high)}")
+    partitions.append(f"{field} >= {literal(bounds[-1])}")
+    return partitions
+
+
+def _dumps(doc: Dict[str, Any]) -> str:
+    return json.dumps(doc, ensure_ascii=False, default=json_default)
+
+
+class _JsonlPart:
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, docs: List[Dict[str, Any]]) -> None:
+        self._file.write("".join(_dumps(doc) + "\n" for doc in docs))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlSink:
+    """Export sink writing one JSONL file per partition, one document per line.
+
+    Args:
+        directory (str): Output directory, created when missing.
+        retrieve_vector (bool): Export the vectors too.
+        prefix (str): File name prefix, files are named ``<prefix>-<partition>.jsonl``.
+    """
+
+    vector_format = "list"
+
+    def __init__(self, directory: str, retrieve_vector: bool = True, prefix="part"):
+        self.directory = directory
+        self.retrieve_vector = retrieve_vector
+        self.prefix = prefix
+
+    def open(self, partition: int) -> _JsonlPart:
+        """A writer of the partition, replacing the output of a previous run."""
+        os.makedirs(self.directory, exist_ok=True)
+        return _JsonlPart(
+            os.path.join(self.directory, f"{self.prefix}-{partition:05d}.jsonl")
+        )
+
+
+class _NpyPart:
+    # The .npy header is written at close time once the row count is known, in a slot
+    # reserved at the start of the file.
+    HEADER_SIZE = 128
+
+    def __init__(self, vectors_path: str, rows_path: str, vector_field: str):
+        self._vector_field = vector_field
+        self._vectors = open(vectors_path, "wb")
+        self._vectors.write(b"\0" * self.HEADER_SIZE)
+        self._rows = open(rows_path, "w", encoding="utf-8")
+        self.count = 0
+        self.dim = 0
+
+    def write(self, docs: List[Dict[str, Any]]) -> None:
+        try:
+            vectors = np.stack(
+                [
+                    np.asarray(doc.pop(self._vector_field), dtype=np.float32)
+                    for doc in docs
+                ]
+            )
+        except KeyError:
+            raise aio_exceptions.ParamError(
+                message=f"Documents have no '{self._vector_field}' field"
+            )
+        if self.count and vectors.shape[1] != self.dim:
+            raise aio_exceptions.ParamError(message="Vectors of different dimensions")
+        self.dim = vectors.shape[1]
+        self._vectors.write(np.ascontiguousarray(vectors).tobytes())
+        self._rows.write("".join(_dumps(doc) + "\n" for doc in docs))
+        self.count += len(docs)
+
+    def close(self) -> None:
+        header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d, %d), }" % (
+            np.dtype(np.float32).str,
+            self.count,
+            self.dim,
+        )
+        header = header.ljust(self.HEADER_SIZE - 10 - 1) + "\n"
+        self._vectors.seek(0)
+        self._vectors.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)))
+        self._vectors.write(header.encode("latin1"))
+        self._vectors.close()
+        self._rows.close()
+
+
+class NumpySink:
+    """Export sink writing the vectors of each partition to a float32 ``.npy`` file.
+
+    The other fields go to a ``.jsonl`` sidecar, its line i holding the document of row i.
+    The ``.npy`` files can be opened with ``np.load(path, mmap_mode="r")``.
+
+    Args:
+        directory (str): Output directory, created when missing.
+        vector_field (str): Field holding the vectors.
+        prefix (str): File name prefix, files are named ``<prefix>-<partition>.npy`` and
+            ``<prefix>-<partition>.jsonl``.
+    """
+
+    retrieve_vector = True
+    vector_format = "numpy"
+
+    def __init__(self, directory: str, vector_field: str = "vector", prefix="part"):
+        self.directory = directory
+        self.vector_field = vector_field
+        self.prefix = prefix
+
+    def open(self, partition: int) -> _NpyPart:
+        """A writer of the partition, replacing the output of a previous run."""
+        os.makedirs(self.directory, exist_ok=True)
+        name = os.path.join(self.directory, f"{self.prefix}-{partition:05d}")
+        return _NpyPart(name + ".npy", name + ".jsonl", self.vector_field)
+
+
+def _load_checkpoint(path: str, partitions: List[Optional[str]]) -> Dict[str, int]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("partitions") != partitions:
+        raise aio_exceptions.ParamError(
+            message=f"{path} was written for other partitions, remove it to start over"
+        )
+    return checkpoint.get("done", {})
+
+
+def _save_checkpoint(
+    path: str, partitions: List[Optional[str]], done: Dict[str, int]
+) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"partitions": partitions, "done": done}, f)
+    os.replace(tmp, path)
+
+
+async def export_collection(
+    collection: "AsyncCollection",
+    sink: Union[JsonlSink, NumpySink],
+    partitions: Optional[Sequence[Union[Filter, str, None]]] = None,
+    concurrency: int = 4,
+    page_size: int = 1000,
+    keyset: Optional[str] = None,
+    output_fields: Optional[List[str]] = None,
+    resume: bool = True,
+    timeout: Optional[float] = None,
+    on_partition: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    priority: int = Priority.LOW,
+) -> Dict[str, Any]:
+    """Export the documents of ``partitions`` to ``sink``, see ``AsyncCollection.export``."""
+    if concurrency <= 0:
+        raise aio_exceptions.ParamError(message="concurrency must be greater than 0")
+    conds = [filter_cond(p) for p in (partitions or [None])]
+    checkpoint = os.path.join(sink.directory, CHECKPOINT_FILE)
+    done = _load_checkpoint(checkpoint, conds) if resume else {}
+    result: Dict[str, Any] = {
+        "documents": sum(done.values()),
+        "partitions": len(conds),
+        "skipped": len(done),
+        "failures": [],
+    }
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _export(index: int, cond: Optional[str]) -> None:
+        info: Dict[str, Any] = {"partition": index, "filter": cond, "count": 0}
+        async with slots:
+            writer = await loop.run_in_executor(None, sink.open, index)
+            try:
+                async for page in query_pages(
+                    collection,
+                    filter=cond,
+                    page_size=page_size,
+                    keyset=keyset,
+                    output_fields=output_fields,
+                    retrieve_vector=sink.retrieve_vector,
+                    timeout=timeout,
+                    vector_format=sink.vector_format,
+                    priority=priority,
+                ):
+                    # file writes don't block the requests of the other partitions
+                    await loop.run_in_executor(None, writer.write, page)
+                    info["count"] += len(page)
+            except vendor_exceptions.VectorDBException as e:
+                info["error"] = e
+                result["failures"].append(
+                    {"partition": index, "filter": cond, "error": e}
+                )
+            finally:
+                await loop.run_in_executor(None, writer.close)
+        if "error" not in info:
+            result["documents"] += info["count"]
+            done[str(index)] = info["count"]
+            _save_checkpoint(checkpoint, conds, done)
+        if on_partition is not None:
+            on_partition(info)
+
+    tasks = [
+        asyncio.ensure_future(_export(index, cond))
+        for index, cond in enumerate(conds)
+        if str(index) not in done
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return result
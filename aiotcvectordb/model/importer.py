@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+from aiotcvectordb import exceptions as aio_exceptions
+from aiotcvectordb.client.concurrency import Priority
+from aiotcvectordb.model.bulk import MAX_UPSERT_BATCH_SIZE, upsert_batches
+
+if TYPE_CHECKING:
+    from aiotcvectordb.model.collection import AsyncCollection
+
+
+def _skip_lines(metadata: IO[bytes], count: int) -> None:
+    for _ in range(count):
+        if metadata.readline() == b"":
+            raise aio_exceptions.ParamError(
+                message=f"Metadata has fewer rows than the start row {count}"
+            )
+
+
+def _read_batch(
+    vectors: np.ndarray,
+    metadata: Optional[IO[bytes]],
+    start: int,
+    end: int,
+    vector_field: str,
+) -> Tuple[List[Dict[str, Any]], int]:
+    # One copy of the block out of the memory map, documents hold row views of it: no
+    # Python float is created, the serializer encodes the rows from the buffer.
+    block = np.ascontiguousarray(vectors[start:end], dtype=np.float32)
+    nbytes = block.nbytes
+    docs = []
+    for i, vector in enumerate(block):
+        if metadata is None:
+            doc: Dict[str, Any] = {"id": str(start + i)}
+        else:
+            line = metadata.readline()
+            if line == b"":
+                raise aio_exceptions.ParamError(
+                    message=f"Metadata has fewer rows than the {len(vectors)} vectors"
+                )
+            if not line.strip():
+                raise aio_exceptions.ParamError(
+                    message=f"Blank metadata line for vector row {start + i}"
+                )
+            # read as bytes, so that the throughput counts bytes rather than characters
+            nbytes += len(line)
+            doc = json.loads(line)
+        doc[vector_field] = vector
+        docs.append(doc)
+    return docs, nbytes
+
+
+async def import_files(
+    collection: "AsyncCollection",
+    vectors_path: str,
+    metadata_path: Optional[str] = None,
+    vector_field: str = "vector",
+    start: int = 0,
+    batch_size: int = MAX_UPSERT_BATCH_SIZE,
+    concurrency: int = 4,
+    timeout: Optional[float] = None,
+    build_index: bool = True,
+    on_progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    priority: int = Priority.LOW,
+) -> Dict[str, Any]:
+    """Upsert vectors of a ``.npy`` file with their JSONL metadata, see ``AsyncCollection.import_files``."""
+    if batch_size <= 0 or batch_size > MAX_UPSERT_BATCH_SIZE:
+        raise aio_exceptions.ParamError(
+            message=f"batch_size must be in [1, {MAX_UPSERT_BATCH_SIZE}]"
+        )
+    vectors = np.load(vectors_path, mmap_mode="r")
+    if vectors.ndim != 2:
+        raise aio_exceptions.ParamError(
+            message=f"{vectors_path} must hold a 2-D array, got shape {vectors.shape}"
+        )
+    loop = asyncio.get_running_loop()
+    began = time.monotonic()
+    progress: Dict[str, Any] = {"documents": 0, "bytes": 0}
+    # input size of the batches in flight, by offset
+    sizes: Dict[int, int] = {}
+
+    def _throughput() -> Dict[str, Any]:
+        elapsed = time.monotonic() - began
+        return {
+            **progress,
+            "elapsed": elapsed,
+            "docs_per_sec": progress["documents"] / elapsed if elapsed else 0.0,
+            "mb_per_sec": progress["bytes"] / 1e6 / elapsed if elapsed else 0.0,
+        }
+
+    def _on_batch(info: Dict[str, Any]) -> None:
+        nbytes = sizes.pop(info["offset"], 0)
+        if "error" in info:
+            return
+        progress["documents"] += info["count"]
+        progress["bytes"] += nbytes
+        if on_progress is not None:
+            on_progress(_throughput())
+
+    metadata = None if metadata_path is None else open(metadata_path, "rb")
+
+    async def _batches() -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        if metadata is not None and start:
+            await loop.run_in_executor(None, _skip_lines, metadata, start)
+        for offset in range(start, len(vectors), batch_size):
+            end = min(offset + batch_size, len(vectors))
+            # file reads don't block the event loop
+            docs, nbytes = await loop.run_in_executor(
+                None, _read_batch, vectors, metadata, offset, end, vector_field
+            )
+            sizes[offset] = nbytes
+            yield offset, docs
+        if metadata is None:
+            return
+        rest = await loop.run_in_executor(None, metadata.readline)
+        if rest.strip():
+            raise aio_exceptions.ParamError(
+                message=f"Metadata has more rows than the {len(vectors)} vectors"
+            )
+
+    try:
+        result = await upsert_batches(
+            collection,
+            _batches(),
+            concurrency=concurrency,
+            timeout=timeout,
+            build_index=build_index,
+            on_batch=_on_batch,
+            priority=priority,
+        )
+    finally:
+        if metadata is not None:
+            metadata.close()
+    result.update(_throughput())
+    return result
@@ -0,0 +1,130 @@
+"""Helpers turning document results into numpy friendly structures."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from aiotcvectordb import exceptions as aio_exceptions
+
+VECTOR_FORMATS = ("list", "numpy")
+
+
+def check_vector_format(vector_format: str) -> None:
+    if vector_format not in VECTOR_FORMATS:
+        raise aio_exceptions.ParamError(
+            message=f"vector_format must be one of {VECTOR_FORMATS}, got {vector_format!r}"
+        )
+
+
+def decode_vectors(
+    documents: Sequence[Dict[str, Any]],
+    field: str = "vector",
+    dtype=np.float32,
+) -> Sequence[Dict[str, Any]]:
+    """Replace the list vector of each document by a 1-D numpy array, in place.
+
+    Documents without the field, or whose value is not a list of numbers (e.g. the text
+    of an embedding collection), are left untouched.
+    """
+    for doc in documents:
+        value = doc.get(field)
+        if isinstance(value, list) and (not value or not isinstance(value[0], str)):
+            doc[field] = np.asarray(value, dtype=dtype)
+    return documents
+
+
+def vector_matrix(
+    documents: Sequence[Dict[str, Any]],
+    field: str = "vector",
+    dtype=np.float32,
+    pop: bool = False,
+) -> Tuple[List[Any], np.ndarray]:
+    """Stack the vectors of a result page into one contiguous 2-D array.
+
+    Args:
+        documents (List[Dict]): Documents returned with ``retrieve_vector=True``.
+        field (str): The vector field name.
+        dtype: dtype of the returned matrix, float32 by default.
+        pop (bool): Remove the field from the documents, so the Python lists can be freed.
+
+    Returns:
+        (ids, matrix): ``ids[i]`` is the id of the document whose vector is ``matrix[i]``.
+    """
+    ids: List[Any] = []
+    rows: List[Any] = []
+    for doc in documents:
+        value = doc.pop(field, None) if pop else doc.get(field)
+        if value is None:
+            continue
+        ids.append(doc.get("id"))
+        rows.append(value)
+    if not rows:
+        return ids, np.empty((0, 0), dtype=dtype)
+    return ids, np.asarray(rows, dtype=dtype)
+
+
+RESULT_FORMATS = ("documents", "columnar")
+
+
+def check_result_format(result_format: str) -> None:
+    if result_format not in RESULT_FORMATS:
+        raise aio_exceptions.ParamError(
+            message=f"result_format must be one of {RESULT_FORMATS}, got {result_format!r}"
+        )
+
+
+class SearchColumns:
+    """Columnar result of one search query.
+
+    Attributes:
+        ids (List): Document ids, ordered by rank.
+        scores (ndarray): float32 scores aligned with ``ids``.
+        fields (Dict[str, List]): Other returned fields, one list per field aligned with ``ids``,
+            None where a document doesn't have the field.
+        vectors (ndarray): float32 2-D array of the returned vectors, or None when
+            ``retrieve_vector`` is off.
+    """
+
+    __slots__ = ("ids", "scores", "fields", "vectors")
+
+    def __init__(
+        self,
+        ids: List[Any],
+        scores: np.ndarray,
+        fields: Dict[str, List[Any]],
+        vectors: Optional[np.ndarray] = None,
+    ):
+        self.ids = ids
+        self.scores = scores
+        self.fields = fields
+        self.vectors = vectors
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchColumns(size={len(self.ids)}, fields={list(self.fields)}, "
+            f"vectors={None if self.vectors is None else self.vectors.shape})"
+        )
+
+
+def to_columns(documents: Sequence[Dict[str, Any]]) -> SearchColumns:
+    """Convert the result list of one search query into a SearchColumns."""
+    n = len(documents)
+    ids = [doc.get("id") for doc in documents]
+    scores = np.fromiter(
+        (doc.get("score", np.nan) for doc in documents), dtype=np.float32, count=n
+    )
+    names: Dict[str, None] = {}
+    for doc in documents:
+        names.update(dict.fromkeys(doc))
+    for name in ("id", "score", "vector"):
+        names.pop(name, None)
+    fields = {name: [doc.get(name) for doc in documents] for name in names}
+    vectors = None
+    if n and "vector" in documents[0]:
+        vectors = np.asarray([doc.get("vector") for doc in documents], dtype=np.float32)
+    return SearchColumns(ids, scores, fields, vectors)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Union
+
+from tcvectordb.model.document import Filter
+
+from aiotcvectordb import exceptions as aio_exceptions
+from aiotcvectordb.client.concurrency import Priority
+
+if TYPE_CHECKING:
+    from aiotcvectordb.model.collection import AsyncCollection
+
+
+def filter_cond(filter: Union[Filter, str, None]) -> Optional[str]:
+    return filter.cond if isinstance(filter, Filter) else filter
+
+
+def and_filter(filter: Union[Filter, str, None], cond: str) -> str:
+    """``cond`` and-ed with an optional filter."""
+    base = filter_cond(filter)
+    return f"({base}) and ({cond})" if base else cond
+
+
+def literal(value: Any) -> str:
+    """A scalar value as written in a filter expression."""
+    return json.dumps(value) if isinstance(value, str) else str(value)
+
+
+async def query_pages(
+    collection: "AsyncCollection",
+    filter: Union[Filter, str, None] = None,
+    page_size: int = 100,
+    keyset: Optional[str] = None,
+    output_fields: Optional[List[str]] = None,
+    retrieve_vector: bool = False,
+    timeout: Optional[float] = None,
+    vector_format: str = "list",
+    priority: int = Priority.NORMAL,
+) -> AsyncIterator[List[Dict]]:
+    """Pages of the documents matching ``filter``, see ``AsyncCollection.iter_query``.
+
+    In keyset mode, documents are sorted by the ``keyset`` field and each page continues from
+    the last value of the previous one with ``keyset >= last``; the offset then only skips the
+    documents of that value already returned, instead of every previous document.
+    """
+    if page_size < 1:
+        raise aio_exceptions.ParamError(message="page_size must be >= 1")
+    fields = output_fields
+    strip = False
+    if keyset is not None and output_fields and keyset not in output_fields:
+        fields = [*output_fields, keyset]
+        strip = True
+    sort = {"fieldName": keyset, "direction": "asc"} if keyset is not None else None
+
+    def fetch(cond: Union[Filter, str, None], offset: int) -> asyncio.Future:
+        return asyncio.ensure_future(
+            collection.query(
+                filter=cond,
+                limit=page_size,
+                offset=offset or None,
+                output_fields=fields,
+                retrieve_vector=retrieve_vector,
+                timeout=timeout,
+                sort=sort,
+                vector_format=vector_format,
+                priority=priority,
+            )
+        )
+
+    cond, offset, last = filter, 0, None
+    pending: Optional[asyncio.Future] = fetch(cond, offset)
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            if len(page) == page_size:
+                if keyset is None:
+                    offset += page_size
+                else:
+                    try:
+                        value = page[-1][keyset]
+                    except KeyError:
+                        raise aio_exceptions.ParamError(
+                            message=f"Documents have no '{keyset}' field to continue from"
+                        )
+                    if last is not None and value == last:
+                        # the whole page had the value of the previous one
+                        offset += page_size
+                    else:
+                        offset = sum(1 for doc in page if doc.get(keyset) == value)
+                        cond = and_filter(filter, f"{keyset} >= {literal(value)}")
+                        last = value
+                # fetched while the caller processes this page
+                pending = fetch(cond, offset)
+            if strip:
+                for doc in page:
+                    doc.pop(keyset, None)
+            if page:
+                yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
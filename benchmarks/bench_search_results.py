@@ -0,0 +1,103 @@
+"""Measure what AsyncCollection.search spends on the decoded response body.
+
+The body is decoded before measuring, so the numbers only cover the result path: the old
+path copied the body dict and rebuilt every per-query list element by element, the current
+one hands the decoded lists back as they are.
+
+Usage:
+    python benchmarks/bench_search_results.py [--queries 50] [--limit 1000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Dict, List
+
+from tcvectordb.model.enum import ReadConsistency
+
+from aiotcvectordb.client.httpclient import Response
+from aiotcvectordb.model.collection import AsyncCollection
+
+
+class _Conn:
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self.body = None
+
+    async def post(self, path, body, timeout=None, ai=False, **kwargs):
+        return Response(path, self.body, 200, "OK")
+
+
+class _DB:
+    def __init__(self, conn):
+        self.conn = conn
+        self.database_name = "db"
+
+
+def _legacy(res: Response) -> List[List[Dict]]:
+    # result handling as it was before: Response.data() copy + nested appends
+    body: Dict = {}
+    body.update(res.body)
+    documents_res: List[List[Dict]] = []
+    for arr in body.get("documents") or []:
+        tmp: List[Dict] = []
+        for elem in arr:
+            tmp.append(elem)
+        documents_res.append(tmp)
+    return documents_res
+
+
+def _measure(fn, conn: _Conn, repeat: int):
+    best = float("inf")
+    peak = 0
+    for i in range(repeat + 1):
+        conn.body = json.loads(conn.raw)
+        if i == repeat:
+            tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if i == repeat:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            best = min(best, elapsed)
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    documents = [
+        [{"id": f"{q}-{i}", "score": 1.0 / (i + 1)} for i in range(args.limit)]
+        for q in range(args.queries)
+    ]
+    conn = _Conn(json.dumps({"code": 0, "msg": "", "documents": documents}).encode())
+    coll = AsyncCollection(
+        _DB(conn), "coll", read_consistency=ReadConsistency.EVENTUAL_CONSISTENCY
+    )
+    vectors = [[0.0, 0.0]] * args.queries
+    loop = asyncio.new_event_loop()
+
+    def current():
+        loop.run_until_complete(coll.search(vectors, limit=args.limit))
+
+    def legacy():
+        _legacy(Response("/document/search", conn.body, 200, "OK"))
+
+    print(f"{args.queries} queries x {args.limit} documents, best of {args.repeat}")
+    print(f"{'path':<8} {'ms':>8} {'peak KiB':>10}")
+    for name, fn in (("legacy", legacy), ("current", current)):
+        best, peak = _measure(fn, conn, args.repeat)
+        print(f"{name:<8} {best * 1000:>8.2f} {peak / 2**10:>10.1f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
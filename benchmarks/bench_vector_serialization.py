@@ -0,0 +1,65 @@
+"""Compare encoding a search body from ndarray vectors via the vendor Search (tolist)
+and via _Search, which keeps the array for the serializer.
+
+Usage:
+    python benchmarks/bench_vector_serialization.py [--rows 1000] [--dim 768] [--repeat 20]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from tcvectordb.model.collection import Search
+
+from aiotcvectordb.client.serializer import get_serializer
+from aiotcvectordb.model.collection import _Search
+
+
+def _encode(serializer, search_cls, vectors):
+    body = {
+        "database": "db",
+        "collection": "coll",
+        "readConsistency": "eventualConsistency",
+        "search": vars(search_cls(vectors=vectors, limit=10)),
+    }
+    return serializer.dumps(body)
+
+
+def _measure(serializer, search_cls, vectors, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _encode(serializer, search_cls, vectors)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    _encode(serializer, search_cls, vectors)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    arr = np.random.default_rng(0).random((args.rows, args.dim), dtype=np.float32)
+    cases = {"list": Search, "ndarray": _Search}
+    print(f"vectors: {args.rows}x{args.dim} float32, best of {args.repeat}")
+    print(f"{'serializer':<10} {'path':<8} {'encode ms':>10} {'peak MiB':>10}")
+    for name in ("json", "orjson"):
+        try:
+            serializer = get_serializer(name)
+        except ImportError:
+            print(f"{name:<10} (not installed)")
+            continue
+        for case, search_cls in cases.items():
+            best, peak = _measure(serializer, search_cls, arr, args.repeat)
+            print(f"{name:<10} {case:<8} {best * 1000:>10.1f} {peak / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
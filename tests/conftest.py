@@ -283,3 +283,110 @@ async def temp_embedding_collection(
             await db_client.drop_collection(db_client.default_db, coll)
         except Exception:
             pass
+
+
+class FakeConn:
+    """In-memory stand-in for AsyncHTTPClient used by offline unit tests.
+
+    ``handler(path, body)`` returns the JSON body of the response; every call is
+    recorded in ``calls`` as ``(path, body)``.
+    """
+
+    def __init__(self, handler=None):
+        self.handler = handler or (lambda path, body: {"code": 0, "msg": "ok"})
+        self.calls = []
+
+    async def post(self, path, body, timeout=None, ai=False, **kwargs):
+        from aiotcvectordb.client.httpclient import Response
+
+        self.calls.append((path, body))
+        return Response(path, self.handler(path, body), 200, "OK")
+
+    async def get(self, path, params=None, timeout=None, ai=False, **kwargs):
+        from aiotcvectordb.client.httpclient import Response
+
+        self.calls.append((path, params))
+        return Response(path, self.handler(path, params), 200, "OK")
+
+    def paths(self):
+        return [path for path, _ in self.calls]
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_conn():
+    return FakeConn()
+
+
+@pytest_asyncio.fixture()
+async def fake_client(fake_conn):
+    client = AsyncVectorDBClient(url="http://vdb.local", username="root", key="key")
+    client._conn = fake_conn
+    try:
+        yield client
+    finally:
+        await client.close()
+
+
+class LocalServer:
+    """Local aiohttp server standing in for VectorDB in offline HTTP layer tests.
+
+    ``handler(path, body)`` may be sync or async and returns the JSON body, or a
+    ``(status, body)`` tuple, or an ``aiohttp.web.StreamResponse``; every request is
+    recorded in ``calls`` as ``(path, body)``. Tests using it need the ``novcr`` marker.
+    """
+
+    def __init__(self):
+        self.handler = lambda path, body: {"code": 0, "msg": "ok"}
+        self.calls = []
+        self.url = ""
+        self._runner = None
+
+    async def _handle(self, request):
+        import asyncio
+        import json
+        from aiohttp import web
+
+        raw = await request.read()
+        body = json.loads(raw) if raw else dict(request.query)
+        self.calls.append((request.path, body))
+        res = self.handler(request.path, body)
+        if asyncio.iscoroutine(res):
+            res = await res
+        if isinstance(res, web.StreamResponse):
+            return res
+        status = 200
+        if isinstance(res, tuple):
+            status, res = res
+        return web.json_response(res, status=status)
+
+    async def start(self):
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def paths(self):
+        return [path for path, _ in self.calls]
+
+
+@pytest_asyncio.fixture()
+async def local_server():
+    server = LocalServer()
+    await server.start()
+    try:
+        yield server
+    finally:
+        await server.stop()
@@ -0,0 +1,101 @@
+import json
+import operator
+import re
+
+import numpy as np
+import pytest
+
+from aiotcvectordb.client.httpclient import Response
+from aiotcvectordb.exceptions import ParamError, ServerInternalError
+from aiotcvectordb.model import JsonlSink, NumpySink, range_partitions
+
+OPS = {">=": operator.ge, "<": operator.lt}
+
+
+class TableConn:
+    def __init__(self, docs, fail=None):
+        self.docs = docs
+        self.fail = fail
+        self.filters = []
+
+    async def post(self, path, body, timeout=None, ai=False, **kwargs):
+        query = body["query"]
+        cond = query.get("filter", "")
+        self.filters.append(cond)
+        if self.fail is not None and self.fail in cond:
+            raise ServerInternalError(code=500, message="boom")
+        docs = self.docs
+        for field, op, value in re.findall(r"(\w+) (>=|<) (\d+)", cond):
+            docs = [d for d in docs if OPS[op](d[field], int(value))]
+        offset = query.get("offset", 0)
+        docs = [dict(d) for d in docs[offset : offset + query["limit"]]]
+        if not query.get("retrieveVector"):
+            for d in docs:
+                d.pop("vector")
+        return Response(path, {"code": 0, "documents": docs}, 200, "OK")
+
+    async def close(self):
+        pass
+
+
+DOCS = [
+    {"id": str(i), "bucket": i % 10, "vector": [float(i), float(-i)]} for i in range(25)
+]
+
+
+def test_range_partitions():
+    assert range_partitions("bucket", [3, 7]) == [
+        "bucket < 3",
+        "bucket >= 3 and bucket < 7",
+        "bucket >= 7",
+    ]
+    with pytest.raises(ParamError):
+        range_partitions("bucket", [7, 3])
+
+
+async def test_export_jsonl_partitions(fake_client, tmp_path):
+    fake_client._conn = TableConn(DOCS)
+    coll = fake_client.collection_ref("db", "coll")
+    seen = []
+    res = await coll.export(
+        JsonlSink(str(tmp_path)),
+        partitions=range_partitions("bucket", [3, 7]),
+        concurrency=2,
+        page_size=4,
+        on_partition=seen.append,
+    )
+    assert res == {"documents": 25, "partitions": 3, "skipped": 0, "failures": []}
+    ids = []
+    for part in sorted(tmp_path.glob("part-*.jsonl")):
+        ids += [json.loads(line)["id"] for line in part.read_text().splitlines()]
+    assert sorted(ids, key=int) == [d["id"] for d in DOCS]
+    assert sorted(info["count"] for info in seen) == [6, 9, 10]
+
+
+async def test_export_numpy_memmap(fake_client, tmp_path):
+    fake_client._conn = TableConn(DOCS)
+    coll = fake_client.collection_ref("db", "coll")
+    await coll.export(NumpySink(str(tmp_path)), page_size=10)
+    vectors = np.load(tmp_path / "part-00000.npy", mmap_mode="r")
+    rows = [json.loads(line) for line in (tmp_path / "part-00000.jsonl").open()]
+    assert vectors.shape == (25, 2) and vectors.dtype == np.float32
+    assert [row["id"] for row in rows] == [d["id"] for d in DOCS]
+    assert "vector" not in rows[0]
+    np.testing.assert_array_equal(vectors[7], [7.0, -7.0])
+
+
+async def test_export_resumes_failed_partitions(fake_client, tmp_path):
+    conn = fake_client._conn = TableConn(DOCS, fail="bucket >= 7")
+    coll = fake_client.collection_ref("db", "coll")
+    partitions = range_partitions("bucket", [3, 7])
+    res = await coll.export(JsonlSink(str(tmp_path)), partitions=partitions)
+    assert res["documents"] == 19 and len(res["failures"]) == 1
+    assert res["failures"][0]["partition"] == 2
+
+    conn.fail, conn.filters = None, []
+    res = await coll.export(JsonlSink(str(tmp_path)), partitions=partitions)
+    assert res["documents"] == 25 and res["skipped"] == 2
+    assert conn.filters == ["bucket >= 7"]
+
+    with pytest.raises(ParamError):
+        await coll.export(JsonlSink(str(tmp_path)), partitions=["bucket < 5"])
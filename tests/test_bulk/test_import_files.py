@@ -0,0 +1,96 @@
+import json
+
+import numpy as np
+import pytest
+
+from aiotcvectordb.client.httpclient import Response
+from aiotcvectordb.exceptions import ParamError
+
+
+class RecordingConn:
+    def __init__(self):
+        self.documents = []
+
+    async def post(self, path, body, timeout=None, ai=False, **kwargs):
+        self.documents += body["documents"]
+        return Response(
+            path, {"code": 0, "affectedCount": len(body["documents"])}, 200, "OK"
+        )
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def files(tmp_path):
+    vectors = np.arange(20, dtype=np.float64).reshape(10, 2)
+    np.save(tmp_path / "vectors.npy", vectors)
+    with open(tmp_path / "meta.jsonl", "w") as f:
+        for i in range(10):
+            f.write(json.dumps({"id": f"doc-{i}", "n": i}) + "\n")
+    return str(tmp_path / "vectors.npy"), str(tmp_path / "meta.jsonl")
+
+
+async def test_import_zips_vectors_and_metadata(fake_client, files):
+    conn = fake_client._conn = RecordingConn()
+    coll = fake_client.collection_ref("db", "coll")
+    progress = []
+    res = await coll.import_files(
+        *files, batch_size=3, concurrency=2, on_progress=progress.append
+    )
+    assert res["affectedCount"] == 10 and res["batches"] == 4
+    assert res["documents"] == 10 and res["docs_per_sec"] > 0
+    docs = sorted(conn.documents, key=lambda d: d["n"])
+    assert [d["id"] for d in docs] == [f"doc-{i}" for i in range(10)]
+    # vectors stay float32 ndarray rows, they are never turned into lists of floats
+    assert all(isinstance(d["vector"], np.ndarray) for d in docs)
+    assert docs[4]["vector"].dtype == np.float32
+    np.testing.assert_array_equal(docs[4]["vector"], [8.0, 9.0])
+    assert [p["documents"] for p in progress][-1] == 10
+    assert progress[-1]["bytes"] > 10 * 2 * 4
+
+
+async def test_import_from_a_row(fake_client, files):
+    conn = fake_client._conn = RecordingConn()
+    coll = fake_client.collection_ref("db", "coll")
+    res = await coll.import_files(*files, start=7)
+    assert res["affectedCount"] == 3
+    assert [d["id"] for d in conn.documents] == ["doc-7", "doc-8", "doc-9"]
+
+
+async def test_import_without_metadata_uses_row_ids(fake_client, files):
+    conn = fake_client._conn = RecordingConn()
+    coll = fake_client.collection_ref("db", "coll")
+    await coll.import_files(files[0], vector_field="embedding")
+    assert [d["id"] for d in conn.documents] == [str(i) for i in range(10)]
+    assert "embedding" in conn.documents[0]
+
+
+async def test_throughput_counts_bytes(fake_client, files, tmp_path):
+    fake_client._conn = RecordingConn()
+    coll = fake_client.collection_ref("db", "coll")
+    meta = tmp_path / "utf8.jsonl"
+    line = json.dumps({"id": "文档"}, ensure_ascii=False) + "\n"
+    meta.write_text(line * 10, encoding="utf-8")
+    res = await coll.import_files(files[0], str(meta))
+    assert res["bytes"] == 10 * 2 * 4 + 10 * len(line.encode("utf-8"))
+
+
+async def test_row_count_mismatch(fake_client, files, tmp_path):
+    fake_client._conn = RecordingConn()
+    coll = fake_client.collection_ref("db", "coll")
+    short = tmp_path / "short.jsonl"
+    short.write_text('{"id": "a"}\n')
+    with pytest.raises(ParamError):
+        await coll.import_files(files[0], str(short))
+
+
+async def test_blank_metadata_line(fake_client, files, tmp_path):
+    fake_client._conn = RecordingConn()
+    coll = fake_client.collection_ref("db", "coll")
+    lines = open(files[1]).readlines()
+    lines[4] = "\n"
+    blank = tmp_path / "blank.jsonl"
+    blank.write_text("".join(lines))
+    with pytest.raises(ParamError, match="Blank metadata line for vector row 4"):
+        await coll.import_files(files[0], str(blank))
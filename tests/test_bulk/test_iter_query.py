@@ -0,0 +1,93 @@
+import asyncio
+import re
+
+import pytest
+
+from aiotcvectordb.client.httpclient import Response
+from aiotcvectordb.exceptions import ParamError
+
+
+class TableConn:
+    """Serves /document/query from a list of documents, supports `field >= n` filters."""
+
+    def __init__(self, docs, delay=0.0):
+        self.docs = docs
+        self.delay = delay
+        self.queries = []
+
+    async def post(self, path, body, timeout=None, ai=False, **kwargs):
+        query = body["query"]
+        self.queries.append(query)
+        await asyncio.sleep(self.delay)
+        docs = self.docs
+        for field, value in re.findall(r"(\w+) >= (\d+)", query.get("filter", "")):
+            docs = [d for d in docs if d[field] >= int(value)]
+        for sort in query.get("sort", []):
+            docs = sorted(docs, key=lambda d: d[sort["fieldName"]])
+        offset = query.get("offset", 0)
+        docs = [dict(d) for d in docs[offset : offset + query["limit"]]]
+        fields = query.get("outputFields")
+        if fields:
+            docs = [{k: v for k, v in d.items() if k in fields} for d in docs]
+        return Response(path, {"code": 0, "documents": docs}, 200, "OK")
+
+    async def close(self):
+        pass
+
+
+DOCS = [{"id": str(i), "age": i // 3, "name": f"n{i}"} for i in range(20)]
+
+
+async def test_offset_pages(fake_client):
+    conn = fake_client._conn = TableConn(DOCS)
+    coll = fake_client.collection_ref("db", "coll")
+    ids = [doc["id"] async for doc in coll.iter_query(page_size=6)]
+    assert ids == [d["id"] for d in DOCS]
+    assert [q.get("offset") for q in conn.queries] == [None, 6, 12, 18]
+
+
+async def test_keyset_pages_handle_ties(fake_client):
+    conn = fake_client._conn = TableConn(list(reversed(DOCS)))
+    coll = fake_client.collection_ref("db", "coll")
+    docs = [
+        doc
+        async for doc in coll.iter_query(
+            filter="age >= 1", page_size=2, keyset="age", output_fields=["id"]
+        )
+    ]
+    assert sorted(int(d["id"]) for d in docs) == list(range(3, 20))
+    assert all(set(d) == {"id"} for d in docs)
+    # the offset never grows past the documents sharing a value
+    assert max(q.get("offset", 0) for q in conn.queries) <= 3
+    assert conn.queries[-1]["filter"].startswith("(age >= 1) and (age >= ")
+
+
+async def test_next_page_is_prefetched(fake_client):
+    conn = fake_client._conn = TableConn(DOCS)
+    coll = fake_client.collection_ref("db", "coll")
+    issued = []
+    async for _ in coll.iter_query(page_size=5):
+        await asyncio.sleep(0)
+        issued.append(len(conn.queries))
+    # while a page is processed, the query of the next one has already been sent
+    assert issued[4::5] == [2, 3, 4, 5]
+
+
+async def test_closing_early_cancels_the_prefetched_page(fake_client):
+    conn = fake_client._conn = TableConn(DOCS)
+    coll = fake_client.collection_ref("db", "coll")
+    docs = coll.iter_query(page_size=5)
+    await docs.__anext__()
+    conn.delay = 10
+    await asyncio.sleep(0)
+    await docs.aclose()
+    await asyncio.sleep(0)
+    assert len(conn.queries) == 2
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_invalid_page_size(fake_client):
+    coll = fake_client.collection_ref("db", "coll")
+    with pytest.raises(ParamError):
+        async for _ in coll.iter_query(page_size=0):
+            pass
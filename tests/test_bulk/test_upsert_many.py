@@ -0,0 +1,87 @@
+import asyncio
+
+import numpy as np
+
+from aiotcvectordb.client.serializer import JSONSerializer
+from aiotcvectordb.exceptions import ServerInternalError
+from aiotcvectordb.model import Document
+from aiotcvectordb.model.bulk import document_size
+
+
+def _upsert_handler(path, body):
+    return {"code": 0, "affectedCount": len(body["documents"])}
+
+
+async def test_upsert_many_splits_batches(fake_client, fake_conn):
+    fake_conn.handler = _upsert_handler
+    coll = fake_client.collection_ref("db", "coll")
+    docs = [Document(id=str(i), vector=[0.1, 0.2, 0.3]) for i in range(25)]
+    res = await coll.upsert_many(docs, batch_size=10, concurrency=2)
+    assert res["affectedCount"] == 25
+    assert res["batches"] == 3
+    assert res["failures"] == []
+    sizes = sorted(len(body["documents"]) for _, body in fake_conn.calls)
+    assert sizes == [5, 10, 10]
+
+
+async def test_upsert_many_bounds_batch_bytes(fake_client, fake_conn):
+    fake_conn.handler = _upsert_handler
+
+    async def source():
+        for i in range(6):
+            yield {"id": str(i), "vector": [0.1, 0.2, 0.3], "text": "x" * 100}
+
+    coll = fake_client.collection_ref("db", "coll")
+    res = await coll.upsert_many(source(), max_batch_bytes=300)
+    assert res["affectedCount"] == 6
+    assert all(len(body["documents"]) <= 2 for _, body in fake_conn.calls)
+
+
+async def test_upsert_many_reports_failed_batches(fake_client, fake_conn):
+    def handler(path, body):
+        if path != "/document/upsert":
+            return {"code": 0, "collection": {"collection": "coll", "indexes": []}}
+        if body["documents"][0]["id"] == "2":
+            raise ServerInternalError(code=15000, message="boom")
+        return _upsert_handler(path, body)
+
+    fake_conn.handler = handler
+    docs = [{"id": str(i), "vector": [0.1, 0.2, 0.3]} for i in range(4)]
+    res = await fake_client.upsert_many("db", "coll", docs, batch_size=2)
+    assert res["affectedCount"] == 2
+    assert [(f["batch"], f["offset"], f["count"]) for f in res["failures"]] == [
+        (1, 2, 2)
+    ]
+
+
+async def test_upsert_many_limits_in_flight(fake_client):
+    in_flight = 0
+    peak = 0
+
+    class SlowConn:
+        async def post(self, path, body, timeout=None, ai=False, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            from aiotcvectordb.client.httpclient import Response
+
+            return Response(path, _upsert_handler(path, body), 200, "OK")
+
+        async def close(self):
+            pass
+
+    fake_client._conn = SlowConn()
+    coll = fake_client.collection_ref("db", "coll")
+    docs = [{"id": str(i)} for i in range(40)]
+    res = await coll.upsert_many(docs, batch_size=2, concurrency=3)
+    assert res["affectedCount"] == 40
+    assert peak == 3
+
+
+def test_document_size_bounds_ndarray_vectors():
+    vector = np.random.default_rng(0).standard_normal(64).astype(np.float32)
+    doc = {"id": "a", "vector": vector, "text": "x" * 10}
+    encoded = len(JSONSerializer().dumps({**doc, "vector": vector}))
+    assert encoded <= document_size(doc) <= 2 * encoded
@@ -0,0 +1,80 @@
+import asyncio
+
+from aiotcvectordb.client.httpclient import Response
+from aiotcvectordb.model.bulk import iter_batches, upsert_batches
+
+
+class SlowConn:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batches = []
+
+    async def post(self, path, body, timeout=None, ai=False, **kwargs):
+        self.batches.append([doc["id"] for doc in body["documents"]])
+        await asyncio.sleep(self.delay)
+        return Response(
+            path, {"code": 0, "affectedCount": len(body["documents"])}, 200, "OK"
+        )
+
+    async def close(self):
+        pass
+
+
+async def test_upsert_stream_flushes_on_linger(fake_client):
+    conn = fake_client._conn = SlowConn()
+
+    async def source():
+        for i in range(3):
+            yield {"id": str(i)}
+        await asyncio.sleep(0.1)
+        for i in range(3, 5):
+            yield {"id": str(i)}
+
+    coll = fake_client.collection_ref("db", "coll")
+    seen = []
+    res = await coll.upsert_stream(
+        source(), batch_size=10, linger=0.02, on_batch=seen.append
+    )
+    assert res["affectedCount"] == 5
+    assert conn.batches == [["0", "1", "2"], ["3", "4"]]
+    assert [b["count"] for b in seen] == [3, 2]
+
+
+async def test_upsert_stream_applies_backpressure(fake_client):
+    fake_client._conn = SlowConn(delay=0.05)
+    produced = 0
+
+    async def source():
+        nonlocal produced
+        for i in range(100):
+            produced += 1
+            yield {"id": str(i)}
+
+    coll = fake_client.collection_ref("db", "coll")
+    task = asyncio.ensure_future(
+        coll.upsert_stream(source(), batch_size=5, linger=0.01, concurrency=2)
+    )
+    await asyncio.sleep(0.02)
+    # two batches in flight, at most one batch queued and one being assembled
+    assert produced <= 5 * 4 + 1
+    res = await task
+    assert res["affectedCount"] == 100
+    assert res["batches"] == 20
+
+
+async def test_cancelled_upsert_stream_stops_its_reader(fake_client):
+    fake_client._conn = SlowConn(delay=10)
+
+    async def source():
+        for i in range(100):
+            yield {"id": str(i)}
+
+    coll = fake_client.collection_ref("db", "coll")
+    batches = iter_batches(source(), batch_size=1, linger=0.01)
+    # cancelled while waiting for a free slot, not inside the batches generator
+    task = asyncio.ensure_future(upsert_batches(coll, batches, concurrency=1))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,119 @@
+import pytest
+
+from aiotcvectordb.client.balancer import EndpointBalancer
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.retry import RetryPolicy
+from aiotcvectordb.exceptions import ConnectError, ParamError, ServerInternalError
+
+pytestmark = pytest.mark.novcr
+
+# nothing listens on port 1, connections are refused
+DEAD_URL = "http://127.0.0.1:1"
+
+
+def test_round_robin_spreads_requests():
+    balancer = EndpointBalancer(["http://a", "http://b", "http://c"])
+    picked = []
+    for _ in range(6):
+        ep = balancer.pick()
+        picked.append(ep.url)
+        balancer.release(ep, latency=0.01)
+    assert picked == ["http://a", "http://b", "http://c"] * 2
+
+
+def test_least_outstanding_avoids_busy_endpoint():
+    balancer = EndpointBalancer(["http://a", "http://b"], strategy="least_outstanding")
+    busy = balancer.pick()
+    for _ in range(3):
+        ep = balancer.pick()
+        assert ep is not busy
+        balancer.release(ep, latency=0.01)
+
+
+def test_p2c_prefers_faster_endpoint():
+    balancer = EndpointBalancer(["http://a", "http://b"], strategy="p2c")
+    fast, slow = balancer.endpoints
+    fast.latency, slow.latency = 0.01, 0.5
+    for _ in range(10):
+        ep = balancer.pick()
+        assert ep is fast
+        balancer.release(ep, latency=0.01)
+
+
+def test_ejects_after_consecutive_failures_and_probes_back(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("aiotcvectordb.client.balancer.time.monotonic", lambda: now[0])
+    balancer = EndpointBalancer(["http://a", "http://b"], eject_after=2, eject_time=5)
+    bad = balancer.endpoints[0]
+    for _ in range(2):
+        balancer.pick()
+        balancer.release(bad, error=ConnectError(message="refused"))
+    assert bad.ejected
+    assert {balancer.pick().url for _ in range(4)} == {"http://b"}
+
+    now[0] += 6
+    probe = balancer.pick()
+    assert probe is bad
+    # a single probe at a time
+    assert balancer.pick().url == "http://b"
+    balancer.release(probe, error=ServerInternalError(code=503, message="down"))
+    assert bad.ejected_until == pytest.approx(now[0] + 10)
+
+    now[0] += 11
+    probe = balancer.pick()
+    balancer.release(probe, latency=0.01)
+    assert not bad.ejected and bad.failures == 0
+
+
+def test_probe_ending_without_a_failure(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("aiotcvectordb.client.balancer.time.monotonic", lambda: now[0])
+    balancer = EndpointBalancer(["http://a", "http://b"], eject_after=1, eject_time=5)
+    bad = balancer.endpoints[0]
+    balancer.release(balancer.pick(), error=ConnectError(message="refused"))
+    now[0] += 6
+    # a cancelled probe lets the next request probe again
+    probe = balancer.pick()
+    balancer.release(probe)
+    assert bad.ejected and balancer.pick() is bad
+    # an application error shows the endpoint answers
+    balancer.release(bad, error=ServerInternalError(code=15302, message="not found"))
+    assert not bad.ejected and bad.ejections == 0
+
+
+def test_application_errors_do_not_eject():
+    balancer = EndpointBalancer(["http://a"], eject_after=1)
+    ep = balancer.pick()
+    balancer.release(ep, error=ServerInternalError(code=15302, message="not found"))
+    assert not ep.ejected
+
+
+def test_rejects_bad_config():
+    with pytest.raises(ParamError):
+        EndpointBalancer([])
+    with pytest.raises(ParamError):
+        EndpointBalancer(["http://a"], strategy="random")
+
+
+async def test_fails_over_to_healthy_endpoint(local_server):
+    balancer = EndpointBalancer([DEAD_URL, local_server.url], eject_after=1)
+    retry = RetryPolicy(backoff_base=0.001)
+    async with AsyncHTTPClient(
+        None, "root", "key", retry=retry, balancer=balancer
+    ) as conn:
+        for _ in range(4):
+            res = await conn.post("/document/search", {"search": {}})
+            assert res.code == 0
+    dead, alive = balancer.endpoints
+    assert dead.ejected and dead.outstanding == 0
+    assert len(local_server.calls) == 4 and alive.latency is not None
+
+
+async def test_url_list_creates_balancer(local_server):
+    async with AsyncHTTPClient(
+        [local_server.url, local_server.url + "/"], "root", "key"
+    ) as conn:
+        assert conn.balancer is not None
+        await conn.post("/database/list", {})
+        await conn.post("/database/list", {})
+    assert local_server.paths() == ["/database/list"] * 2
@@ -0,0 +1,107 @@
+import pytest
+
+from aiotcvectordb.client.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.retry import RetryPolicy
+from aiotcvectordb.exceptions import (
+    CircuitOpenError,
+    ConnectError,
+    ParamError,
+    ServerInternalError,
+)
+
+pytestmark = pytest.mark.novcr
+
+KEY = ("http://a",)
+
+
+def _fail(breaker, key=KEY, error=None):
+    probe = breaker.acquire(key)
+    breaker.release(key, probe, error=error or ConnectError(message="refused"))
+
+
+def test_opens_on_failure_rate_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("aiotcvectordb.client.breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_rate=0.5, min_requests=4, window=4, open_time=5)
+    breaker.release(KEY, breaker.acquire(KEY))
+    breaker.release(KEY, breaker.acquire(KEY))
+    _fail(breaker)
+    assert breaker.state(KEY) == CLOSED
+    _fail(breaker)
+    assert breaker.state(KEY) == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire(KEY)
+
+    now[0] += 6
+    assert breaker.acquire(KEY) is True
+    assert breaker.state(KEY) == HALF_OPEN
+    # one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire(KEY)
+    breaker.release(KEY, True, error=ServerInternalError(code=503, message="busy"))
+    assert breaker.state(KEY) == OPEN
+
+    now[0] += 6
+    breaker.release(KEY, breaker.acquire(KEY))
+    assert breaker.state(KEY) == CLOSED
+
+
+def test_application_errors_are_not_failures():
+    breaker = CircuitBreaker(min_requests=1, window=1)
+    _fail(breaker, error=ServerInternalError(code=15302, message="not found"))
+    assert breaker.state(KEY) == CLOSED
+
+
+def test_cancelled_probe_frees_its_slot(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("aiotcvectordb.client.breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(min_requests=1, window=1, open_time=1)
+    _fail(breaker)
+    now[0] += 2
+    breaker.release(KEY, breaker.acquire(KEY), cancelled=True)
+    assert breaker.state(KEY) == HALF_OPEN
+    assert breaker.acquire(KEY) is True
+
+
+def test_per_collection_scope():
+    breaker = CircuitBreaker(per_collection=True)
+    assert breaker.scope({"database": "db", "collection": "c"}) == ("db", "c")
+    assert breaker.scope({"database": "db"}) == ()
+    assert CircuitBreaker().scope({"database": "db", "collection": "c"}) == ()
+
+
+def test_rejects_bad_config():
+    with pytest.raises(ParamError):
+        CircuitBreaker(failure_rate=0)
+    with pytest.raises(ParamError):
+        CircuitBreaker(min_requests=10, window=5)
+
+
+async def test_fails_fast_once_open(local_server):
+    local_server.handler = lambda path, body: (503, {"error": "rebuilding"})
+    breaker = CircuitBreaker(min_requests=2, window=2, per_collection=True)
+    body = {"database": "db", "collection": "c", "search": {}}
+    async with AsyncHTTPClient(local_server.url, "root", "key", breaker=breaker) as conn:
+        for _ in range(2):
+            with pytest.raises(ServerInternalError):
+                await conn.post("/document/search", body)
+        with pytest.raises(CircuitOpenError):
+            await conn.post("/document/search", body)
+        # other collections of the host are unaffected
+        local_server.handler = lambda path, body: {"code": 0, "msg": "ok"}
+        await conn.post("/document/search", dict(body, collection="other"))
+    assert breaker.state((local_server.url, "db", "c")) == OPEN
+    assert len(local_server.calls) == 3
+
+
+async def test_open_circuit_is_not_retried(local_server):
+    local_server.handler = lambda path, body: (503, {"error": "busy"})
+    breaker = CircuitBreaker(min_requests=1, window=1)
+    retry = RetryPolicy(max_attempts=5, backoff_base=0.001, budget=False)
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", retry=retry, breaker=breaker
+    ) as conn:
+        with pytest.raises(CircuitOpenError):
+            await conn.post("/document/query", {"query": {}})
+    assert len(local_server.calls) == 1
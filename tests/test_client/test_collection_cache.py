@@ -0,0 +1,74 @@
+import asyncio
+
+from aiotcvectordb import AsyncVectorDBClient
+
+
+def _describe_handler(path, body):
+    if path == "/collection/describe":
+        return {
+            "code": 0,
+            "collection": {
+                "database": body["database"],
+                "collection": body["collection"],
+                "shardNum": 1,
+                "replicaNum": 1,
+                "indexes": [],
+            },
+        }
+    if path == "/document/count":
+        return {"code": 0, "count": 3}
+    return {"code": 0, "msg": "ok", "affectedCount": 1}
+
+
+async def test_document_calls_reuse_cached_collection(fake_client, fake_conn):
+    fake_conn.handler = _describe_handler
+    assert await fake_client.count("db", "coll") == 3
+    assert await fake_client.count("db", "coll") == 3
+    assert fake_conn.paths() == [
+        "/collection/describe",
+        "/document/count",
+        "/document/count",
+    ]
+
+
+async def test_drop_and_alias_invalidate_cache(fake_client, fake_conn):
+    fake_conn.handler = _describe_handler
+    await fake_client.count("db", "coll")
+    await fake_client.drop_collection("db", "coll")
+    await fake_client.count("db", "coll")
+    await fake_client.set_alias("db", "coll", "alias")
+    await fake_client.count("db", "coll")
+    assert fake_conn.paths().count("/collection/describe") == 3
+
+
+async def test_collection_cache_opt_out(fake_conn):
+    fake_conn.handler = _describe_handler
+    client = AsyncVectorDBClient(
+        url="http://vdb.local", username="root", key="key", collection_cache=False
+    )
+    client._conn = fake_conn
+    await client.count("db", "coll")
+    await client.count("db", "coll")
+    assert fake_conn.paths().count("/collection/describe") == 2
+
+
+async def test_lookup_during_drop_is_not_kept(fake_client, fake_conn):
+    fake_conn.handler = _describe_handler
+    post = fake_conn.post
+    dropping, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_post(path, body, *args, **kwargs):
+        if path == "/collection/drop":
+            dropping.set()
+            await release.wait()
+        return await post(path, body, *args, **kwargs)
+
+    fake_conn.post = slow_post
+    drop = asyncio.ensure_future(fake_client.drop_collection("db", "coll"))
+    await dropping.wait()
+    # caches the handle of the collection being dropped
+    await fake_client.count("db", "coll")
+    release.set()
+    await drop
+    await fake_client.count("db", "coll")
+    assert fake_conn.paths().count("/collection/describe") == 2
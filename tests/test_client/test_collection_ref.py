@@ -0,0 +1,30 @@
+def _describe_handler(path, body):
+    if path == "/collection/describe":
+        return {
+            "code": 0,
+            "collection": {
+                "database": body["database"],
+                "collection": body["collection"],
+                "shardNum": 1,
+                "replicaNum": 1,
+                "indexes": [],
+            },
+        }
+    return {"code": 0, "count": 3}
+
+
+async def test_collection_ref_skips_describe(fake_client, fake_conn):
+    fake_conn.handler = _describe_handler
+    coll = fake_client.collection_ref("db", "coll")
+    assert not coll.described
+    assert await coll.count() == 3
+    assert fake_conn.paths() == ["/document/count"]
+
+
+async def test_collection_ref_describe_on_demand(fake_client, fake_conn):
+    fake_conn.handler = _describe_handler
+    coll = fake_client.collection_ref("db", "coll")
+    assert await coll.describe() is coll
+    assert coll.described
+    assert coll.shard == 1 and coll.replicas == 1
+    assert fake_conn.paths() == ["/collection/describe"]
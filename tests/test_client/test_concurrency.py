@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from aiotcvectordb import AsyncVectorDBClient
+from aiotcvectordb.client.concurrency import ConcurrencyLimiter, Priority
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.exceptions import (
+    ConcurrencyLimitExceededError,
+    ParamError,
+    ServerInternalError,
+)
+
+pytestmark = pytest.mark.novcr
+
+
+async def test_aimd_grows_while_saturated_and_backs_off():
+    limiter = ConcurrencyLimiter(initial_limit=2, max_queue=0)
+    for _ in range(3):
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.release(latency=0.01)
+        limiter.release(latency=0.01)
+    assert limiter.limit > 2
+    grown = limiter.limit
+    await limiter.acquire()
+    limiter.release(latency=0.1)  # 10x the baseline
+    assert limiter.limit < grown
+    await limiter.acquire()
+    limiter.release(error=ServerInternalError(code=503, message="busy"))
+    assert limiter.limit <= int(grown * 0.9 * 0.9)
+
+
+async def test_gradient_shrinks_on_latency_inflation():
+    limiter = ConcurrencyLimiter(algorithm="gradient", initial_limit=20)
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(latency=0.01)
+    stable = limiter.limit
+    assert stable >= 20
+    for _ in range(10):
+        await limiter.acquire()
+        limiter.release(latency=0.2)
+    assert limiter.limit < stable
+
+
+async def test_fails_fast_when_queue_is_full():
+    limiter = ConcurrencyLimiter(initial_limit=1, max_queue=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.acquire()
+    limiter.release(latency=0.01)
+    await waiter
+    assert limiter.in_flight == 1 and limiter.queue_depth == 0
+    assert limiter.metrics()["rejected"] == 1
+
+
+async def test_queue_timeout():
+    limiter = ConcurrencyLimiter(initial_limit=1, queue_timeout=0.01)
+    await limiter.acquire()
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.acquire()
+    assert limiter.queue_depth == 0
+
+
+def test_rejects_bad_config():
+    with pytest.raises(ParamError):
+        ConcurrencyLimiter(algorithm="vegas")
+    with pytest.raises(ParamError):
+        ConcurrencyLimiter(initial_limit=5, max_limit=2)
+
+
+async def test_bounds_requests_in_flight(local_server):
+    peak = {"now": 0, "max": 0}
+
+    async def handler(path, body):
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(0.01)
+        peak["now"] -= 1
+        return {"code": 0, "msg": "ok"}
+
+    local_server.handler = handler
+    limiter = ConcurrencyLimiter(initial_limit=2, max_limit=2)
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", concurrency=limiter
+    ) as conn:
+        await asyncio.gather(
+            *[conn.post("/document/search", {"search": {}}) for _ in range(8)]
+        )
+    assert peak["max"] == 2
+    assert limiter.in_flight == 0 and limiter.queue_depth == 0
+
+
+async def test_queue_admits_by_priority():
+    limiter = ConcurrencyLimiter(algorithm="fixed", initial_limit=1)
+    await limiter.acquire()
+    order = []
+
+    async def _wait(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+        limiter.release(latency=0.01)
+
+    tasks = [
+        asyncio.ensure_future(_wait("bulk", Priority.LOW)),
+        asyncio.ensure_future(_wait("normal", Priority.NORMAL)),
+        asyncio.ensure_future(_wait("interactive", Priority.HIGH)),
+    ]
+    await asyncio.sleep(0)
+    limiter.release(latency=0.01)
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "normal", "bulk"]
+    assert limiter.limit == 1
+
+
+async def test_search_jumps_ahead_of_bulk_upserts(local_server):
+    async def handler(path, body):
+        await asyncio.sleep(0.01)
+        return {"code": 0, "msg": "ok", "affectedCount": 1, "documents": [[]]}
+
+    local_server.handler = handler
+    limiter = ConcurrencyLimiter(algorithm="fixed", initial_limit=1)
+    client = AsyncVectorDBClient(
+        url=local_server.url, username="root", key="key", concurrency=limiter
+    )
+    coll = client.collection_ref("db", "coll")
+    try:
+        bulk = asyncio.ensure_future(
+            coll.upsert_many([{"id": str(i)} for i in range(5)], batch_size=1)
+        )
+        await asyncio.sleep(0.005)
+        await coll.search([[0.1, 0.2]], priority=Priority.HIGH)
+        await bulk
+    finally:
+        await client.close()
+    paths = local_server.paths()
+    # the search only waited for the upsert in flight
+    assert paths.index("/document/search") == 1
@@ -0,0 +1,38 @@
+import pytest
+
+from aiotcvectordb.exceptions import ParamError
+from aiotcvectordb.model import AsyncAIDatabase, AsyncDatabase
+
+
+def _list_handler(path, body):
+    if path == "/database/list":
+        return {
+            "code": 0,
+            "databases": ["db1", "ai1"],
+            "info": {"db1": {"dbType": "BASE_DB"}, "ai1": {"dbType": "AI_DB"}},
+        }
+    return {"code": 0, "msg": "ok", "affectedCount": 1}
+
+
+async def test_database_lookup_uses_index(fake_client, fake_conn):
+    fake_conn.handler = _list_handler
+    assert isinstance(await fake_client.database("db1"), AsyncDatabase)
+    assert isinstance(await fake_client.database("ai1"), AsyncAIDatabase)
+    assert fake_conn.paths() == ["/database/list"]
+
+
+async def test_unknown_database_forces_refresh(fake_client, fake_conn):
+    fake_conn.handler = _list_handler
+    await fake_client.database("db1")
+    with pytest.raises(ParamError):
+        await fake_client.database("missing")
+    assert fake_conn.paths() == ["/database/list", "/database/list"]
+
+
+async def test_create_and_drop_invalidate_index(fake_client, fake_conn):
+    fake_conn.handler = _list_handler
+    await fake_client.database("db1")
+    await fake_client.create_database("db2")
+    await fake_client.database("db1")
+    await fake_client.drop_ai_database("ai1")
+    assert fake_conn.paths().count("/database/list") == 2
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pytest
+
+from aiotcvectordb.client.deadline import deadline, remaining
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.retry import RetryPolicy
+from aiotcvectordb.exceptions import (
+    DeadlineExceededError,
+    RequestTimeoutError,
+    ServerInternalError,
+)
+
+pytestmark = pytest.mark.novcr
+
+
+def _slow(delay):
+    async def handler(path, body):
+        await asyncio.sleep(delay)
+        return {"code": 0, "msg": "ok"}
+
+    return handler
+
+
+def test_nested_deadline_only_shortens():
+    assert remaining() is None
+    with deadline(10) as outer:
+        with deadline(20) as inner:
+            assert inner == outer
+        with deadline(1):
+            assert remaining() <= 1
+        assert remaining() > 1
+    assert remaining() is None
+
+
+async def test_budget_is_shared_across_requests(local_server):
+    local_server.handler = _slow(0.06)
+    async with AsyncHTTPClient(local_server.url, "root", "key") as conn:
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError) as e:
+            with deadline(0.15):
+                for _ in range(5):
+                    await conn.post("/collection/describe", {})
+        assert time.monotonic() - start < 0.25
+    assert isinstance(e.value, RequestTimeoutError)
+    assert len(local_server.calls) == 3
+
+
+async def test_expired_deadline_sends_nothing(local_server):
+    async with AsyncHTTPClient(local_server.url, "root", "key") as conn:
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError):
+                await conn.post("/database/list", {})
+    assert local_server.calls == []
+
+
+async def test_no_retry_past_the_deadline(local_server):
+    local_server.handler = lambda path, body: (503, {"error": "busy"})
+    retry = RetryPolicy(max_attempts=10, backoff_base=0.05, jitter=False, budget=False)
+    async with AsyncHTTPClient(local_server.url, "root", "key", retry=retry) as conn:
+        start = time.monotonic()
+        with deadline(0.12):
+            with pytest.raises(ServerInternalError) as e:
+                await conn.post("/document/search", {"search": {}})
+        assert time.monotonic() - start < 0.2
+    assert e.value.code == 503
+    assert len(local_server.calls) == 2
+
+
+async def test_tasks_inherit_the_deadline(local_server):
+    local_server.handler = _slow(0.2)
+    async with AsyncHTTPClient(local_server.url, "root", "key") as conn:
+        with deadline(0.05):
+            tasks = [
+                asyncio.ensure_future(conn.post("/document/query", {"query": {}}))
+                for _ in range(3)
+            ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, DeadlineExceededError) for r in results)
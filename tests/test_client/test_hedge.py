@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+import pytest
+
+from aiotcvectordb.client.hedge import HedgePolicy
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+
+pytestmark = pytest.mark.novcr
+
+
+def _slow_first(slow=1.0):
+    state = {"n": 0}
+
+    async def handler(path, body):
+        state["n"] += 1
+        if state["n"] == 1:
+            await asyncio.sleep(slow)
+        return {"code": 0, "msg": "ok", "documents": [[{"id": str(state["n"])}]]}
+
+    return handler
+
+
+async def test_hedge_wins_over_slow_request(local_server):
+    local_server.handler = _slow_first()
+    hedge = HedgePolicy(delay=0.05, max_ratio=1.0)
+    async with AsyncHTTPClient(local_server.url, "root", "key", hedge=hedge) as conn:
+        start = time.monotonic()
+        res = await conn.post("/document/search", {"search": {}})
+        assert time.monotonic() - start < 0.5
+    assert res.body["documents"] == [[{"id": "2"}]]
+    assert len(local_server.calls) == 2 and hedge.hedged == 1
+
+
+async def test_write_paths_are_not_hedged(local_server):
+    local_server.handler = _slow_first(0.2)
+    hedge = HedgePolicy(delay=0.01, max_ratio=1.0)
+    async with AsyncHTTPClient(local_server.url, "root", "key", hedge=hedge) as conn:
+        await conn.post("/document/upsert", {"documents": []})
+    assert len(local_server.calls) == 1 and hedge.hedged == 0
+
+
+async def test_hedges_are_budgeted(local_server):
+    async def handler(path, body):
+        await asyncio.sleep(0.05)
+        return {"code": 0, "msg": "ok"}
+
+    local_server.handler = handler
+    hedge = HedgePolicy(delay=0.01, max_ratio=0.25)
+    async with AsyncHTTPClient(local_server.url, "root", "key", hedge=hedge) as conn:
+        for _ in range(4):
+            await conn.post("/document/count", {"query": {}})
+    assert hedge.hedged == 1
+    assert len(local_server.calls) == 5
+
+
+def test_adaptive_delay_uses_percentile():
+    hedge = HedgePolicy(min_samples=10, min_delay=0.0, max_delay=1.0)
+    assert hedge.delay_for("/document/search") == 1.0
+    for i in range(100):
+        hedge.observe("/document/search", i / 1000)
+    assert hedge.delay_for("/document/search") == pytest.approx(0.095)
@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.ratelimit import RateLimiter, TokenBucket
+from aiotcvectordb.exceptions import ParamError, RateLimitExceededError
+
+pytestmark = pytest.mark.novcr
+
+
+def test_paths_resolve_to_groups():
+    limiter = RateLimiter({"write": 10, "admin": 1})
+    assert limiter.group("/document/upsert") == "write"
+    assert limiter.group("/document/search") == "read"
+    assert limiter.group("/collection/describe") == "admin"
+    assert limiter.group("/index/rebuild") == "admin"
+    assert limiter.group("/database/list") is None
+    # read isn't limited
+    assert limiter.bucket("/document/search") is None
+    assert limiter.bucket("/document/delete") is limiter.buckets["write"]
+
+
+def test_bucket_reserves_tokens_in_order():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_rejects_beyond_max_wait():
+    bucket = TokenBucket(rate=10, burst=1, max_wait=0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() is None
+    assert bucket.tokens == pytest.approx(0, abs=0.05)
+
+
+def test_rejects_bad_config():
+    with pytest.raises(ParamError):
+        TokenBucket(rate=0)
+    with pytest.raises(ParamError):
+        RateLimiter({"bulk": 10})
+
+
+async def test_writes_are_shaped_reads_are_not(local_server):
+    limiter = RateLimiter({"write": TokenBucket(rate=20, burst=1)})
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", rate_limiter=limiter
+    ) as conn:
+        start = time.monotonic()
+        await asyncio.gather(
+            *[conn.post("/document/upsert", {"documents": []}) for _ in range(4)]
+        )
+        assert time.monotonic() - start >= 0.14
+        start = time.monotonic()
+        await asyncio.gather(
+            *[conn.post("/document/search", {"search": {}}) for _ in range(10)]
+        )
+        assert time.monotonic() - start < 0.14
+    assert len(local_server.calls) == 14
+
+
+async def test_excess_requests_are_rejected(local_server):
+    limiter = RateLimiter({"admin": TokenBucket(rate=1, burst=1, max_wait=0)})
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", rate_limiter=limiter
+    ) as conn:
+        await conn.post("/collection/list", {})
+        with pytest.raises(RateLimitExceededError):
+            await conn.post("/collection/list", {})
+    assert len(local_server.calls) == 1
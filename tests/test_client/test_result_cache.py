@@ -0,0 +1,157 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.result_cache import ResultCache, request_key
+
+pytestmark = pytest.mark.novcr
+
+RESULT = {"code": 0, "msg": "ok", "documents": [[{"id": "1", "score": 0.9}]]}
+
+
+def _search(collection="coll", vectors=None, **kwargs):
+    return {
+        "database": "db",
+        "collection": collection,
+        "readConsistency": "eventualConsistency",
+        "search": {"vectors": vectors or [[0.1, 0.2]], "limit": 1},
+        **kwargs,
+    }
+
+
+def test_request_key_is_canonical():
+    vectors = np.array([[0.1, 0.2]], dtype=np.float32)
+    a = {"database": "db", "search": {"limit": 1, "vectors": vectors}}
+    b = {"search": {"vectors": vectors.copy(), "limit": 1}, "database": "db"}
+    assert request_key("/document/search", a) == request_key("/document/search", b)
+    c = {"database": "db", "search": {"limit": 1, "vectors": vectors + 1}}
+    assert request_key("/document/search", a) != request_key("/document/search", c)
+    assert request_key("/document/search", a) != request_key("/document/query", a)
+
+
+def test_request_key_tells_values_apart():
+    keys = {
+        request_key("/document/search", {"search": value})
+        for value in (
+            {"vectors": [[0.1, 0.2]]},
+            {"vectors": [[0.1, 0.3]]},
+            {"vectors": np.array([[0.1, 0.2]])},
+            {"vectors": ["0.1"]},
+            {"vectors": [1]},
+            {"vectors": "[1]"},
+            {"vector": [[0.1, 0.2]]},
+        )
+    }
+    assert len(keys) == 7
+
+
+async def test_hit_returns_a_copy(local_server):
+    local_server.handler = lambda path, body: RESULT
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", result_cache=True
+    ) as conn:
+        first = await conn.post("/document/search", _search())
+        first.body["documents"].clear()
+        second = await conn.post("/document/search", _search())
+        cache = conn.result_cache
+    assert len(local_server.calls) == 1
+    assert second.body["documents"] == RESULT["documents"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+async def test_writes_invalidate_their_collection(local_server):
+    local_server.handler = lambda path, body: RESULT
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", result_cache=True
+    ) as conn:
+        await conn.post("/document/search", _search())
+        await conn.post("/document/search", _search("other"))
+        await conn.post("/document/upsert", {"database": "db", "collection": "coll"})
+        await conn.post("/document/search", _search())
+        await conn.post("/document/search", _search("other"))
+        await conn.post(
+            "/collection/truncate", {"database": "db", "collection": "coll"}
+        )
+        await conn.post("/document/search", _search())
+    paths = [path for path, _ in local_server.calls]
+    assert paths.count("/document/search") == 4
+    assert len(conn.result_cache) == 2
+
+
+async def test_read_racing_a_write_is_not_stored(local_server):
+    async def handler(path, body):
+        if path == "/document/search":
+            await asyncio.sleep(0.05)
+        return RESULT
+
+    local_server.handler = handler
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", result_cache=True
+    ) as conn:
+        read = asyncio.ensure_future(conn.post("/document/search", _search()))
+        await asyncio.sleep(0.01)
+        await conn.post("/document/delete", {"database": "db", "collection": "coll"})
+        await read
+        assert len(conn.result_cache) == 0
+
+
+async def test_read_racing_a_database_change_is_not_stored(local_server):
+    async def handler(path, body):
+        if path == "/document/search":
+            await asyncio.sleep(0.05)
+        return RESULT
+
+    local_server.handler = handler
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", result_cache=True
+    ) as conn:
+        # nothing of the collection is cached yet when the alias changes
+        read = asyncio.ensure_future(conn.post("/document/search", _search()))
+        await asyncio.sleep(0.01)
+        await conn.post("/alias/set", {"database": "db", "alias": "coll"})
+        await read
+        assert len(conn.result_cache) == 0
+
+
+async def test_strong_consistency_and_disabled_collections_bypass(local_server):
+    local_server.handler = lambda path, body: RESULT
+    cache = ResultCache(ttls={("db", "nocache"): 0})
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", result_cache=cache
+    ) as conn:
+        for _ in range(2):
+            await conn.post(
+                "/document/search", _search(readConsistency="strongConsistency")
+            )
+            await conn.post("/document/search", _search("nocache"))
+    assert len(local_server.calls) == 4 and len(cache) == 0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResultCache(maxsize=2, max_bytes=100)
+    coll = ("db", "coll")
+    cache.set("a", 1, coll, 10, 0)
+    cache.set("b", 2, coll, 10, 0)
+    assert cache.get("a") == 1
+    cache.set("c", 3, coll, 10, 0)
+    assert cache.get("b") is None and cache.get("a") == 1
+    cache.set("d", 4, coll, 95, 0)
+    assert len(cache) == 1 and cache.nbytes == 95
+    cache.set("e", 5, coll, 200, 0)
+    assert cache.get("e") is None
+
+
+def test_per_collection_ttl(monkeypatch):
+    import aiotcvectordb.client.result_cache as module
+
+    now = [100.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+    cache = ResultCache(ttl=1)
+    cache.set_ttl("db", "slow", 10)
+    cache.set("a", 1, ("db", "fast"), 1, 0)
+    cache.set("b", 2, ("db", "slow"), 1, 0)
+    now[0] += 5
+    assert cache.get("a") is None and cache.get("b") == 2
+    assert cache.invalidate_database("db") == 1 and len(cache) == 0
@@ -0,0 +1,71 @@
+import pytest
+
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.retry import RetryBudget, RetryPolicy
+from aiotcvectordb.exceptions import ConnectError, ServerInternalError
+
+pytestmark = pytest.mark.novcr
+
+
+def _flaky(failures, status=503):
+    state = {"left": failures}
+
+    def handler(path, body):
+        if state["left"] > 0:
+            state["left"] -= 1
+            return status, {"error": "unavailable"}
+        return {"code": 0, "msg": "ok", "documents": []}
+
+    return handler
+
+
+def _client(url, **kwargs):
+    policy = RetryPolicy(backoff_base=0.001, **kwargs)
+    return AsyncHTTPClient(url, "root", "key", retry=policy)
+
+
+async def test_retries_idempotent_read(local_server):
+    local_server.handler = _flaky(2)
+    async with _client(local_server.url) as conn:
+        res = await conn.post("/document/search", {"search": {}})
+    assert res.code == 0
+    assert local_server.paths() == ["/document/search"] * 3
+
+
+async def test_gives_up_after_max_attempts(local_server):
+    local_server.handler = _flaky(5)
+    async with _client(local_server.url, max_attempts=2) as conn:
+        with pytest.raises(ServerInternalError) as e:
+            await conn.post("/document/query", {"query": {}})
+    assert e.value.code == 503
+    assert len(local_server.calls) == 2
+
+
+async def test_does_not_retry_upsert(local_server):
+    local_server.handler = _flaky(1)
+    async with _client(local_server.url) as conn:
+        with pytest.raises(ServerInternalError):
+            await conn.post("/document/upsert", {"documents": []})
+    assert len(local_server.calls) == 1
+
+
+async def test_connect_error_is_retried_for_any_path():
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.001)
+    async with AsyncHTTPClient(
+        "http://127.0.0.1:1", "root", "key", retry=policy
+    ) as conn:
+        with pytest.raises(ConnectError):
+            await conn.post("/document/upsert", {"documents": []})
+    assert policy.budget is not None and len(policy.budget._retries) == 2
+
+
+def test_budget_caps_retries():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, window=10)
+    for _ in range(4):
+        budget.deposit()
+    assert [budget.withdraw() for _ in range(3)] == [True, True, False]
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(backoff_base=0.1, backoff_max=0.3, jitter=False)
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [0.1, 0.2, 0.3, 0.3]
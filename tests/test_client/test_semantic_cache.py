@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.semantic_cache import SemanticCache
+from aiotcvectordb.exceptions import ParamError
+
+pytestmark = pytest.mark.novcr
+
+
+def _handler(path, body):
+    vectors = body.get("search", {}).get("vectors", [])
+    return {
+        "code": 0,
+        "msg": "ok",
+        "documents": [[{"id": str(v[0])}] for v in vectors],
+    }
+
+
+def _search(vectors, collection="coll", limit=1):
+    return {
+        "database": "db",
+        "collection": collection,
+        "readConsistency": "eventualConsistency",
+        "search": {"vectors": vectors, "limit": limit},
+    }
+
+
+async def test_near_query_hits(local_server):
+    local_server.handler = _handler
+    cache = SemanticCache(threshold=0.01)
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", semantic_cache=cache
+    ) as conn:
+        first = await conn.post("/document/search", _search([[1.0, 0.0]]))
+        near = await conn.post("/document/search", _search([[1.0, 0.01]]))
+        far = await conn.post("/document/search", _search([[0.0, 1.0]]))
+        other_limit = await conn.post(
+            "/document/search", _search([[1.0, 0.0]], limit=2)
+        )
+    assert len(local_server.calls) == 3
+    assert near.body["documents"] == first.body["documents"]
+    assert far.body["documents"] == [[{"id": "0.0"}]]
+    assert other_limit.body["documents"] == first.body["documents"]
+    assert (cache.hits, cache.misses) == (1, 3) and cache.hit_rate == 0.25
+
+
+async def test_batch_hits_only_when_every_vector_does(local_server):
+    local_server.handler = _handler
+    cache = SemanticCache(threshold=0.1, metric="l2")
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", semantic_cache=cache
+    ) as conn:
+        await conn.post("/document/search", _search(np.array([[1.0, 0.0], [2.0, 0.0]])))
+        hit = await conn.post("/document/search", _search([[2.0, 0.05], [1.0, 0.0]]))
+        await conn.post("/document/search", _search([[1.0, 0.0], [3.0, 0.0]]))
+    assert len(local_server.calls) == 2
+    assert hit.body["documents"] == [[{"id": "2.0"}], [{"id": "1.0"}]]
+    # every vector of a batch is cached on its own
+    assert len(cache) == 4
+
+
+async def test_writes_invalidate_and_text_is_not_cached(local_server):
+    local_server.handler = _handler
+    cache = SemanticCache()
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", semantic_cache=cache
+    ) as conn:
+        await conn.post("/document/search", _search([[1.0, 0.0]]))
+        await conn.post("/document/update", {"database": "db", "collection": "coll"})
+        await conn.post("/document/search", _search([[1.0, 0.0]]))
+        await conn.post("/document/search", _search(["text"]), ai=True)
+        await conn.post("/document/search", _search(["text"]), ai=True)
+    paths = [path for path, _ in local_server.calls]
+    assert paths.count("/document/search") == 4
+    assert len(cache) == 1
+
+
+class _Response:
+    message = "ok"
+
+    def __init__(self, documents):
+        self.body = {"documents": documents}
+
+    def copy(self, body=None):
+        return _Response(body["documents"] if body else [])
+
+
+def test_lru_eviction_keeps_rows_consistent():
+    cache = SemanticCache(threshold=0.001, metric="l2", maxsize=2)
+    body = _search(None)
+    for i in range(3):
+        body["search"]["vectors"] = [[float(i)]]
+        _, token = cache.lookup("/document/search", body, False)
+        cache.store(token, _Response([[{"id": i}]]))
+    assert len(cache) == 2
+    for i, expected in ((0, None), (1, [[{"id": 1}]]), (2, [[{"id": 2}]])):
+        body["search"]["vectors"] = [[float(i)]]
+        hit, _ = cache.lookup("/document/search", body, False)
+        assert (hit.body["documents"] if hit else None) == expected
+
+
+def test_expired_nearest_row_does_not_hide_live_ones(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "aiotcvectordb.client.semantic_cache.time.monotonic", lambda: now[0]
+    )
+    cache = SemanticCache(threshold=0.3, metric="l2", ttl=10)
+    body = _search(None)
+    for i, vector in enumerate(([0.0], [0.4])):
+        body["search"]["vectors"] = [vector]
+        _, token = cache.lookup("/document/search", body, False)
+        cache.store(token, _Response([[{"id": i}]]))
+        now[0] += 5
+    # the nearest row, [0.0], expired, [0.4] is still live and within the threshold
+    body["search"]["vectors"] = [[0.15]]
+    hit, _ = cache.lookup("/document/search", body, False)
+    assert hit.body["documents"] == [[{"id": 1}]]
+    assert len(cache) == 1
+
+
+def test_search_racing_a_database_change_is_not_stored():
+    cache = SemanticCache()
+    _, token = cache.lookup("/document/search", _search([[1.0, 0.0]]), False)
+    cache.invalidate("/alias/set", {"database": "db", "alias": "coll"})
+    cache.store(token, _Response([[{"id": "a"}]]))
+    assert len(cache) == 0
+
+
+def test_invalid_metric():
+    with pytest.raises(ParamError):
+        SemanticCache(metric="ip")
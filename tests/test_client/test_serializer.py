@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from aiotcvectordb.client.serializer import (
+    JSONSerializer,
+    ORJSONSerializer,
+    get_serializer,
+)
+from aiotcvectordb.exceptions import ParamError
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_roundtrip_with_numpy(name):
+    pytest.importorskip(name)
+    serializer = get_serializer(name)
+    body = {
+        "database": "db",
+        "search": {"vectors": np.arange(6, dtype=np.float32).reshape(2, 3)},
+        "limit": np.int64(3),
+    }
+    assert serializer.loads(serializer.dumps(body)) == {
+        "database": "db",
+        "search": {"vectors": [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]},
+        "limit": 3,
+    }
+
+
+def test_non_contiguous_array_falls_back():
+    pytest.importorskip("orjson")
+    vectors = np.arange(6, dtype=np.float32).reshape(3, 2).T
+    assert ORJSONSerializer().loads(ORJSONSerializer().dumps(vectors)) == (
+        vectors.tolist()
+    )
+
+
+def test_get_serializer():
+    assert isinstance(get_serializer("json"), JSONSerializer)
+    custom = JSONSerializer()
+    assert get_serializer(custom) is custom
+    with pytest.raises(ParamError):
+        get_serializer("yaml")
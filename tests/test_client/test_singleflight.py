@@ -0,0 +1,115 @@
+import asyncio
+import copy
+
+import pytest
+
+from aiotcvectordb.client.httpclient import AsyncHTTPClient
+from aiotcvectordb.client.singleflight import SingleFlight
+from aiotcvectordb.exceptions import ServerInternalError
+
+pytestmark = pytest.mark.novcr
+
+
+def _slow(body, delay=0.05):
+    async def handler(path, request):
+        await asyncio.sleep(delay)
+        return body
+
+    return handler
+
+
+async def test_concurrent_duplicates_share_one_request(local_server):
+    local_server.handler = _slow({"code": 0, "msg": "ok", "documents": [[{"id": "1"}]]})
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", single_flight=True
+    ) as conn:
+        results = await asyncio.gather(
+            *[conn.post("/document/search", {"search": {"limit": 1}}) for _ in range(5)]
+        )
+        flight = conn.single_flight
+    assert len(local_server.calls) == 1 and flight.shared == 4
+    assert all(r.body == results[0].body for r in results)
+    # every caller owns its body
+    results[1].body["documents"].clear()
+    assert results[0].body["documents"] == [[{"id": "1"}]]
+    assert flight.in_flight == 0
+
+
+async def test_callers_changing_their_result_do_not_affect_others():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        return {"documents": [1]}
+
+    async def caller(tag):
+        result = await flight.do("key", call, copy=copy.deepcopy)
+        # changed in place as soon as the caller resumes, like decode_vectors does
+        result["documents"].append(tag)
+        return result
+
+    results = await asyncio.gather(*[caller(tag) for tag in "abc"])
+    assert [r["documents"] for r in results] == [[1, "a"], [1, "b"], [1, "c"]]
+
+
+async def test_different_bodies_and_writes_are_not_shared(local_server):
+    local_server.handler = _slow({"code": 0, "msg": "ok"})
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", single_flight=True
+    ) as conn:
+        await asyncio.gather(
+            conn.post("/document/query", {"query": {"limit": 1}}),
+            conn.post("/document/query", {"query": {"limit": 2}}),
+            conn.post("/document/upsert", {"documents": []}),
+            conn.post("/document/upsert", {"documents": []}),
+        )
+    assert len(local_server.calls) == 4
+
+
+async def test_errors_are_shared(local_server):
+    local_server.handler = _slow((503, {"error": "busy"}))
+    async with AsyncHTTPClient(
+        local_server.url, "root", "key", single_flight=True
+    ) as conn:
+        results = await asyncio.gather(
+            *[conn.post("/collection/describe", {}) for _ in range(3)],
+            return_exceptions=True,
+        )
+    assert all(isinstance(r, ServerInternalError) for r in results)
+    assert len(local_server.calls) == 1
+
+
+async def test_cancelled_caller_does_not_fail_the_others():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "result"
+
+    first = asyncio.ensure_future(flight.do("key", call))
+    await started.wait()
+    second = asyncio.ensure_future(flight.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "result"
+    assert first.cancelled()
+
+
+async def test_abandoned_flight_is_cancelled():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.ensure_future(flight.do("key", call))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert flight.in_flight == 0
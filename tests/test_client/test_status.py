@@ -0,0 +1,23 @@
+from aiotcvectordb.client import status
+from aiotcvectordb.exceptions import (
+    ConnectError,
+    ParamError,
+    RequestTimeoutError,
+    ServerInternalError,
+)
+
+
+def test_is_failure():
+    codes = status.UNHEALTHY_CODES
+    assert status.is_failure(ConnectError(message="refused"), codes)
+    assert status.is_failure(RequestTimeoutError(code=-1, message="slow"), codes)
+    assert status.is_failure(ServerInternalError(code=503, message="down"), codes)
+    assert not status.is_failure(ServerInternalError(code=429, message="busy"), codes)
+    assert not status.is_failure(ParamError(message="bad"), codes)
+
+
+def test_has_status():
+    error = ServerInternalError(code=429, message="busy")
+    assert status.has_status(error, status.RETRY_CODES)
+    assert not status.has_status(error, status.UNHEALTHY_CODES)
+    assert not status.has_status(ConnectError(message="refused"), status.RETRY_CODES)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from aiotcvectordb.exceptions import ParamError
+from aiotcvectordb.model import SearchColumns
+
+
+def _handler(path, body):
+    docs = [
+        {"id": "a", "score": 0.9, "vector": [0.1, 0.2], "page": 1},
+        {"id": "b", "score": 0.5, "vector": [0.3, 0.4], "author": "x"},
+    ]
+    return {"code": 0, "documents": [docs, []]}
+
+
+async def test_search_columnar(fake_client, fake_conn):
+    fake_conn.handler = _handler
+    res = await fake_client.collection_ref("db", "coll").search(
+        [[0.1, 0.2], [0.3, 0.4]],
+        retrieve_vector=True,
+        result_format="columnar",
+    )
+    assert len(res) == 2 and all(isinstance(r, SearchColumns) for r in res)
+    cols = res[0]
+    assert cols.ids == ["a", "b"]
+    assert cols.scores.dtype == np.float32
+    assert np.allclose(cols.scores, [0.9, 0.5])
+    assert cols.fields == {"page": [1, None], "author": [None, "x"]}
+    assert cols.vectors.shape == (2, 2)
+    assert len(res[1]) == 0 and res[1].vectors is None
+
+
+async def test_search_columnar_coalesced(fake_client, fake_conn):
+    fake_conn.handler = _handler
+    coalescer = fake_client.collection_ref("db", "coll").coalescer(window=0.01)
+    res = await coalescer.search([[0.1, 0.2]], result_format="columnar")
+    assert isinstance(res[0], SearchColumns)
+    assert res[0].ids == ["a", "b"]
+
+
+async def test_invalid_result_format(fake_client):
+    with pytest.raises(ParamError):
+        await fake_client.collection_ref("db", "coll").search(
+            [[0.1, 0.2]], result_format="arrow"
+        )
+
+
+async def test_search_columnar_without_documents(fake_client, fake_conn):
+    fake_conn.handler = lambda path, body: {"code": 0}
+    coll = fake_client.collection_ref("db", "coll")
+    res = await coll.search([[0.1, 0.2], [0.3, 0.4]], result_format="columnar")
+    assert len(res) == 2 and all(len(r) == 0 for r in res)
+    res = await coll.searchById(["a", "b", "c"], result_format="columnar")
+    assert len(res) == 3 and all(isinstance(r, SearchColumns) for r in res)
@@ -0,0 +1,34 @@
+import asyncio
+
+import numpy as np
+
+
+def _search_handler(path, body):
+    vectors = body["search"]["vectors"]
+    return {"code": 0, "documents": [[{"id": "x", "score": 1.0}] for _ in vectors]}
+
+
+async def test_search_keeps_ndarray_in_body(fake_client, fake_conn):
+    fake_conn.handler = _search_handler
+    vectors = np.ones((2, 3), dtype=np.float32)
+    res = await fake_client.collection_ref("db", "coll").search(vectors, limit=1)
+    assert len(res) == 2
+    sent = fake_conn.calls[0][1]["search"]["vectors"]
+    assert isinstance(sent, np.ndarray) and sent.shape == (2, 3)
+
+
+async def test_upsert_keeps_ndarray_vectors(fake_client, fake_conn):
+    doc = {"id": "1", "vector": np.ones(3, dtype=np.float32)}
+    await fake_client.collection_ref("db", "coll").upsert([doc])
+    assert isinstance(fake_conn.calls[0][1]["documents"][0]["vector"], np.ndarray)
+
+
+async def test_coalescer_concatenates_ndarray_chunks(fake_client, fake_conn):
+    fake_conn.handler = _search_handler
+    coalescer = fake_client.collection_ref("db", "coll").coalescer(window=0.01)
+    await asyncio.gather(
+        coalescer.search(np.ones((1, 3), dtype=np.float32)),
+        coalescer.search(np.zeros((2, 3), dtype=np.float32)),
+    )
+    sent = fake_conn.calls[0][1]["search"]["vectors"]
+    assert isinstance(sent, np.ndarray) and sent.shape == (3, 3)
@@ -0,0 +1,19 @@
+async def test_search_returns_decoded_documents(fake_client, fake_conn):
+    documents = [[{"id": "a", "score": 0.9}], [{"id": "b", "score": 0.8}]]
+    fake_conn.handler = lambda path, body: {"code": 0, "documents": documents}
+    coll = fake_client.collection_ref("db", "coll")
+    res = await coll.search([[0.1, 0.2], [0.3, 0.4]])
+    # no intermediate copies of the per-query lists
+    assert res is documents
+    assert res[1] is documents[1]
+
+
+async def test_query_and_hybrid_results(fake_client, fake_conn):
+    documents = [{"id": "a"}]
+    fake_conn.handler = lambda path, body: {
+        "code": 0,
+        "documents": documents if path == "/document/query" else [documents],
+    }
+    coll = fake_client.collection_ref("db", "coll")
+    assert await coll.query() is documents
+    assert await coll.hybrid_search(ann=None, match=None) is documents
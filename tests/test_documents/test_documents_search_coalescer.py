@@ -0,0 +1,64 @@
+import asyncio
+
+from aiotcvectordb import AsyncVectorDBClient
+
+
+def _search_handler(path, body):
+    vectors = body["search"]["vectors"]
+    return {
+        "code": 0,
+        "documents": [[{"id": str(v[0]), "score": 1.0}] for v in vectors],
+    }
+
+
+async def test_concurrent_searches_are_merged(fake_client, fake_conn):
+    fake_conn.handler = _search_handler
+    coalescer = fake_client.collection_ref("db", "coll").coalescer(window=0.01)
+    results = await asyncio.gather(
+        *[coalescer.search([[float(i), 0.0, 0.0]], limit=1) for i in range(5)]
+    )
+    assert [r[0][0]["id"] for r in results] == [str(float(i)) for i in range(5)]
+    assert fake_conn.paths() == ["/document/search"]
+
+
+async def test_different_params_are_not_merged(fake_client, fake_conn):
+    fake_conn.handler = _search_handler
+    coalescer = fake_client.collection_ref("db", "coll").coalescer(window=0.01)
+    await asyncio.gather(
+        coalescer.search([[1.0, 0.0, 0.0]], limit=1),
+        coalescer.search([[2.0, 0.0, 0.0]], limit=2),
+        coalescer.search([[3.0, 0.0, 0.0]], limit=1, filter='tag="a"'),
+    )
+    assert fake_conn.paths() == ["/document/search"] * 3
+
+
+async def test_max_batch_size_flushes_early(fake_client, fake_conn):
+    fake_conn.handler = _search_handler
+    coalescer = fake_client.collection_ref("db", "coll").coalescer(
+        window=10, max_batch_size=2
+    )
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.search([[1.0, 0.0, 0.0]]),
+            coalescer.search([[2.0, 0.0, 0.0], [3.0, 0.0, 0.0]]),
+        ),
+        timeout=1,
+    )
+    assert [len(r) for r in results] == [1, 2]
+    assert len(fake_conn.calls) == 1
+
+
+async def test_client_opt_in_coalescing(fake_conn):
+    fake_conn.handler = _search_handler
+    client = AsyncVectorDBClient(
+        url="http://vdb.local",
+        username="root",
+        key="key",
+        search_coalesce_window=0.01,
+    )
+    client._conn = fake_conn
+    results = await asyncio.gather(
+        *[client.search("db", "coll", [[float(i), 0.0, 0.0]]) for i in range(3)]
+    )
+    assert len(results) == 3
+    assert fake_conn.paths() == ["/document/search"]
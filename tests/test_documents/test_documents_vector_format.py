@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from aiotcvectordb.exceptions import ParamError
+from aiotcvectordb.model import vector_matrix
+
+
+def _handler(path, body):
+    docs = [
+        {"id": "a", "vector": [0.1, 0.2, 0.3], "page": 1},
+        {"id": "b", "vector": [0.4, 0.5, 0.6], "page": 2},
+    ]
+    if path == "/document/query":
+        return {"code": 0, "documents": docs}
+    return {"code": 0, "documents": [docs]}
+
+
+async def test_query_numpy_vectors(fake_client, fake_conn):
+    fake_conn.handler = _handler
+    coll = fake_client.collection_ref("db", "coll")
+    docs = await coll.query(retrieve_vector=True, vector_format="numpy")
+    assert all(isinstance(d["vector"], np.ndarray) for d in docs)
+    assert docs[0]["vector"].dtype == np.float32
+
+
+async def test_search_numpy_vectors(fake_client, fake_conn):
+    fake_conn.handler = _handler
+    coll = fake_client.collection_ref("db", "coll")
+    res = await coll.search(
+        [[0.1, 0.2, 0.3]], retrieve_vector=True, vector_format="numpy"
+    )
+    assert isinstance(res[0][1]["vector"], np.ndarray)
+
+
+async def test_invalid_vector_format(fake_client):
+    with pytest.raises(ParamError):
+        await fake_client.collection_ref("db", "coll").query(vector_format="arrow")
+
+
+def test_vector_matrix_pops_vectors():
+    docs = [{"id": "a", "vector": [1.0, 2.0]}, {"id": "b", "vector": [3.0, 4.0]}]
+    ids, matrix = vector_matrix(docs, pop=True)
+    assert ids == ["a", "b"]
+    assert matrix.shape == (2, 2) and matrix.dtype == np.float32
+    assert matrix.flags["C_CONTIGUOUS"]
+    assert "vector" not in docs[0]